@@ -14,10 +14,23 @@
 
 
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 
 import agate
 
+from dbt.adapters.dremio.api.flight import (
+    DremioFlightClient,
+    arrow_schema_to_job_schema,
+)
+from dbt.adapters.dremio.api.job_watcher import DremioJobWatcher
+from dbt.adapters.dremio.api.polling import (
+    PollingPolicy,
+    ExponentialBackoffPollingPolicy,
+)
 from dbt.adapters.dremio.api.rest.client import DremioRestClient
+from dbt.adapters.dremio.api.result_decoder import DremioResultDecoder
 
 from dbt.adapters.events.logging import AdapterLogger
 
@@ -25,15 +38,31 @@ logger = AdapterLogger("dremio")
 
 
 class DremioCursor:
-    def __init__(self, rest_client: DremioRestClient):
+    def __init__(
+        self,
+        rest_client: DremioRestClient,
+        polling_policy: PollingPolicy = None,
+        job_watcher: DremioJobWatcher = None,
+        result_fetch_parallelism: int = 1,
+        flight_client: DremioFlightClient = None,
+    ):
         self._rest_client = rest_client
+        self._flight_client = flight_client
+        self._polling_policy = polling_policy or ExponentialBackoffPollingPolicy()
+        self._job_watcher = job_watcher
+        self._result_fetch_parallelism = result_fetch_parallelism
 
         self._closed = False
         self._job_id = None
         self._rowcount = -1
         self._job_results = None
         self._table_results: agate.Table = None
+        self._arrow_table = None
         self._description = None
+        # DB-API default number of rows returned by fetchmany()
+        self.arraysize = 1
+        self._row_position = 0
+        self._row_stream = None
 
     @property
     def description(self):
@@ -59,6 +88,11 @@ class DremioCursor:
     def table(self) -> agate.Table:
         return self._table_results
 
+    @property
+    def arrow_table(self):
+        # columnar results, only available when fetched over Arrow Flight
+        return self._arrow_table
+
     def job_results(self):
         if self.closed:
             raise Exception("CursorClosed")
@@ -78,24 +112,42 @@ class DremioCursor:
         self._initialize()
         self.closed = True
 
-    def execute(self, sql, bindings=None, fetch=False):
+    def execute(self, sql, bindings=None, fetch=False, limit=None):
         if self.closed:
             raise Exception("CursorClosed")
         if bindings is None:
             self._initialize()
 
+            if fetch and self._flight_client is not None:
+                self._execute_flight(sql, limit)
+                return
+
             json_payload = self._rest_client.sql_endpoint(sql, context=None)
 
             self._job_id = json_payload["id"]
 
             self._populate_rowcount()
             if fetch:
-                self._populate_job_results()
+                self._populate_job_results(max_rows=limit)
             self._populate_results_table()
 
         else:
             raise Exception("Bindings not currently supported.")
 
+    def _execute_flight(self, sql, limit=None):
+        arrow_table = self._flight_client.execute(sql)
+        if limit is not None:
+            arrow_table = arrow_table.slice(0, limit)
+        self._arrow_table = arrow_table
+        self._rowcount = arrow_table.num_rows
+        # exposed in the same shape as the job results REST API
+        self._job_results = {
+            "rowCount": arrow_table.num_rows,
+            "schema": arrow_schema_to_job_schema(arrow_table.schema),
+            "rows": arrow_table.to_pylist(),
+        }
+        self._populate_results_table()
+
     def fetchone(self):
         row = None
         if self._table_results is not None:
@@ -106,40 +158,58 @@ class DremioCursor:
         logger.debug(f"The fetch result is: {self._table_results.rows}")
         return self._table_results.rows
 
+    def fetchmany(self, size=None):
+        # Results that were fetched on execute are served from the agate table,
+        # otherwise pages are pulled lazily from the job results as rows are consumed
+        if self.closed:
+            raise Exception("CursorClosed")
+        size = self.arraysize if size is None else size
+        if self._table_results is not None:
+            end = self._row_position + size
+            rows = self._table_results.rows[self._row_position : end]
+            self._row_position += len(rows)
+            return list(rows)
+        if self._job_id is None:
+            raise Exception("No job has been executed")
+        if self._row_stream is None:
+            self._row_stream = self._iter_job_result_rows()
+        return list(islice(self._row_stream, size))
+
+    def __iter__(self):
+        while True:
+            rows = self.fetchmany()
+            if not rows:
+                return
+            yield from rows
+
     def _initialize(self):
         self._job_id = None
         self._rowcount = -1
         self._table_results = None
         self._job_results = None
+        self._arrow_table = None
+        self._row_position = 0
+        self._row_stream = None
 
     def _populate_rowcount(self):
         if self.closed:
             raise Exception("CursorClosed")
-        # keep checking job status until status is one of COMPLETE, CANCELLED or FAILED
+        # wait until job status is one of COMPLETED, CANCELLED or FAILED
         # map job results to AdapterResponse
-        job_id = self._job_id
-
-        last_job_state = ""
-        job_status_response = self._rest_client.job_status(job_id)
+        if self._job_watcher is not None:
+            job_status_response = self._job_watcher.wait_for(
+                self._rest_client, self._job_id
+            )
+        else:
+            job_status_response = self._wait_for_job(self._job_id)
         job_status_state = job_status_response["jobState"]
 
-        while True:
-            time.sleep(0.2)
-            if job_status_state != last_job_state:
-                logger.debug(f"Job State = {job_status_state}")
-
-            if job_status_state == "FAILED":
-                error_message = job_status_response["errorMessage"]
-                raise Exception(f"ERROR: {error_message}")
+        if job_status_state == "FAILED":
+            error_message = job_status_response["errorMessage"]
+            raise Exception(f"ERROR: {error_message}")
 
-            if job_status_state == "CANCELLED":
-                raise Exception("Job was cancelled")
-
-            if job_status_state == "COMPLETED":
-                break
-            last_job_state = job_status_state
-            job_status_response = self._rest_client.job_status(job_id)
-            job_status_state = job_status_response["jobState"]
+        if job_status_state == "CANCELLED":
+            raise Exception("Job was cancelled")
 
         # this is done as job status does not return a rowCount if there are no rows affected (even in completed job_state)
         # pyodbc Cursor documentation states "[rowCount] is -1 if no SQL has been executed or if the number of rows is unknown.
@@ -152,47 +222,102 @@ class DremioCursor:
 
         self._rowcount = rows
 
-    def _populate_job_results(self, row_limit=500):
+    def _wait_for_job(self, job_id):
+        # used when no job watcher is shared with this cursor
+        last_job_state = ""
+        # the first check is made right away so that short jobs are not delayed,
+        # later checks are spaced out by the polling policy
+        poll_delays = self._polling_policy.delays()
+        job_status_response = self._rest_client.job_status(job_id)
+
+        while True:
+            job_status_state = job_status_response["jobState"]
+            if job_status_state != last_job_state:
+                logger.debug(f"Job State = {job_status_state}")
+
+            if job_status_state in DremioJobWatcher.TERMINAL_JOB_STATES:
+                return job_status_response
+
+            last_job_state = job_status_state
+            time.sleep(next(poll_delays))
+            job_status_response = self._rest_client.job_status(job_id)
+
+    def _populate_job_results(self, row_limit=500, max_rows=None):
         if self._job_results == None:
-            combined_job_results = self._rest_client.job_results(
-                self._job_id,
-                offset=0,
-                limit=row_limit,
-            )
+            pages = self._iter_job_result_pages(row_limit, max_rows)
+            combined_job_results = next(pages)
             total_row_count = combined_job_results["rowCount"]
-            current_row_count = len(combined_job_results["rows"])
+            if max_rows is not None:
+                total_row_count = min(total_row_count, max_rows)
 
             if total_row_count > 100000:
                 logger.warning(
                     "Fetching more than 100000 records. This may result in slower performance."
                 )
 
-            while current_row_count < total_row_count:
-                combined_job_results["rows"].extend(
-                    self._rest_client.job_results(
-                        self._job_id,
-                        offset=current_row_count,
-                        limit=row_limit,
-                    )["rows"]
-                )
-                current_row_count += row_limit
+            for page in pages:
+                combined_job_results["rows"].extend(page["rows"])
+            if max_rows is not None:
+                del combined_job_results["rows"][max_rows:]
 
             self._job_results = combined_job_results
 
+    def _iter_job_result_rows(self, row_limit=500):
+        decoder = None
+        for page in self._iter_job_result_pages(row_limit):
+            if decoder is None:
+                decoder = DremioResultDecoder(page["schema"])
+            yield from decoder.decode_rows(page["rows"])
+
+    def _iter_job_result_pages(self, row_limit, max_rows=None):
+        def fetch_page(offset):
+            return self._rest_client.job_results(
+                self._job_id,
+                offset=offset,
+                limit=row_limit,
+            )
+
+        first_page = self._rest_client.job_results(
+            self._job_id,
+            offset=0,
+            limit=row_limit if max_rows is None else max(1, min(row_limit, max_rows)),
+        )
+        yield first_page
+
+        # the first page tells us the total row count, so every remaining
+        # offset is known up front and the next pages can be prefetched
+        total_row_count = first_page["rowCount"]
+        if max_rows is not None:
+            total_row_count = min(total_row_count, max_rows)
+        offsets = range(len(first_page["rows"]), total_row_count, row_limit)
+
+        if self._result_fetch_parallelism <= 1 or len(offsets) <= 1:
+            for offset in offsets:
+                yield fetch_page(offset)
+            return
+
+        # at most result_fetch_parallelism pages are in flight or waiting to be
+        # consumed, which keeps memory bounded when rows are streamed
+        max_workers = min(self._result_fetch_parallelism, len(offsets))
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="dremio-results"
+        )
+        try:
+            remaining_offsets = iter(offsets)
+            pending = deque(
+                executor.submit(fetch_page, offset)
+                for offset in islice(remaining_offsets, max_workers)
+            )
+            while pending:
+                page = pending.popleft().result()
+                next_offset = next(remaining_offsets, None)
+                if next_offset is not None:
+                    pending.append(executor.submit(fetch_page, next_offset))
+                yield page
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def _populate_results_table(self):
         if self._job_results is not None:
-            tester = agate.TypeTester()
-            json_rows = self._job_results["rows"]
-            # Used to force agate to use a specific .DataType for some type values that can be misinterpreted as Boolean
-            force = {}
-            self._table_results = json_rows
-            for col in self._job_results["schema"]:
-                name = col["name"]
-                data_type_str = col["type"]["name"]
-                if data_type_str == "BIGINT" or data_type_str == "INTEGER":
-                    force[name] = agate.Number()
-            if force:
-                tester = agate.TypeTester(force=force)
-            self._table_results = agate.Table.from_object(
-                json_rows, column_types=tester
-            )
+            decoder = DremioResultDecoder(self._job_results["schema"])
+            self._table_results = decoder.to_table(self._job_results["rows"])
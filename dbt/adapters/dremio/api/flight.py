@@ -0,0 +1,143 @@
+# Copyright (C) 2022 Dremio Corporation
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any, Dict, List, Optional
+
+from dbt.adapters.dremio.api.authentication import (
+    DremioAuthentication,
+    DremioPatAuthentication,
+)
+from dbt.adapters.dremio.credentials import DremioCredentials
+
+from dbt.adapters.events.logging import AdapterLogger
+
+logger = AdapterLogger("dremio")
+
+try:
+    import pyarrow
+    import pyarrow.flight as flight
+except ImportError:  # pragma: no cover - pyarrow is an optional dependency
+    pyarrow = None
+    flight = None
+
+
+class DremioFlightClient:
+    """Runs queries over Arrow Flight and returns their results as Arrow tables.
+
+    Requires the optional pyarrow dependency (pip install dbt-dremio[flight]).
+    """
+
+    def __init__(
+        self,
+        location: str,
+        authentication: DremioAuthentication,
+        cloud_project_id: Optional[str] = None,
+    ):
+        if flight is None:
+            raise Exception(
+                "The flight transport requires pyarrow. "
+                "Install it with: pip install dbt-dremio[flight]"
+            )
+        self._location = location
+        self._authentication = authentication
+        self._cloud_project_id = cloud_project_id
+        self._client = None
+        self._call_options = None
+
+    def start(self):
+        if self._client is not None:
+            return
+        client = flight.FlightClient(
+            self._location,
+            disable_server_verification=not self._authentication.verify_ssl,
+        )
+        headers = []
+        if isinstance(self._authentication, DremioPatAuthentication):
+            headers.append(
+                (b"authorization", f"Bearer {self._authentication.pat}".encode())
+            )
+        else:
+            headers.append(
+                client.authenticate_basic_token(
+                    self._authentication.username, self._authentication.password
+                )
+            )
+        if self._cloud_project_id is not None:
+            headers.append((b"project_id", self._cloud_project_id.encode()))
+        self._call_options = flight.FlightCallOptions(headers=headers)
+        self._client = client
+
+    def execute(self, sql: str) -> "pyarrow.Table":
+        self.start()
+        descriptor = flight.FlightDescriptor.for_command(sql)
+        flight_info = self._client.get_flight_info(descriptor, self._call_options)
+        tables = [
+            self._client.do_get(endpoint.ticket, self._call_options).read_all()
+            for endpoint in flight_info.endpoints
+        ]
+        if not tables:
+            return flight_info.schema.empty_table()
+        return pyarrow.concat_tables(tables)
+
+    def close(self):
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+
+def build_flight_location(credentials: DremioCredentials) -> str:
+    if credentials.cloud_host is not None:
+        # Dremio Cloud serves Flight from data.<region> next to api.<region>
+        host = credentials.flight_host or credentials.cloud_host.replace(
+            "api.", "data.", 1
+        )
+        return f"grpc+tls://{host}:443"
+    host = credentials.flight_host or credentials.software_host
+    protocol = "grpc+tls" if credentials.use_ssl else "grpc+tcp"
+    return f"{protocol}://{host}:{credentials.flight_port}"
+
+
+def arrow_schema_to_job_schema(schema: "pyarrow.Schema") -> List[Dict[str, Any]]:
+    """Describes an Arrow schema the way the job results REST API does."""
+    return [
+        {"name": field.name, "type": {"name": _dremio_type_name(field.type)}}
+        for field in schema
+    ]
+
+
+def _dremio_type_name(arrow_type) -> str:
+    types = pyarrow.types
+    if types.is_boolean(arrow_type):
+        return "BOOLEAN"
+    if types.is_integer(arrow_type):
+        return "BIGINT"
+    if types.is_decimal(arrow_type):
+        return "DECIMAL"
+    if types.is_floating(arrow_type):
+        return "DOUBLE"
+    if types.is_date(arrow_type):
+        return "DATE"
+    if types.is_timestamp(arrow_type):
+        return "TIMESTAMP"
+    if types.is_time(arrow_type):
+        return "TIME"
+    if types.is_string(arrow_type) or types.is_large_string(arrow_type):
+        return "VARCHAR"
+    if types.is_list(arrow_type) or types.is_large_list(arrow_type):
+        return "LIST"
+    if types.is_struct(arrow_type):
+        return "STRUCT"
+    if types.is_map(arrow_type):
+        return "MAP"
+    return str(arrow_type).upper()
@@ -12,9 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import requests
+
 from dbt.adapters.dremio.api.cursor import DremioCursor
+from dbt.adapters.dremio.api.flight import DremioFlightClient
+from dbt.adapters.dremio.api.job_watcher import DremioJobWatcher
 from dbt.adapters.dremio.api.parameters import Parameters
+from dbt.adapters.dremio.api.polling import PollingPolicy
 from dbt.adapters.dremio.api.rest.client import DremioRestClient
+from dbt.adapters.dremio.api.rest.rate_limiter import RateLimits
 
 from dbt.adapters.events.logging import AdapterLogger
 
@@ -22,8 +28,21 @@ logger = AdapterLogger("dremio")
 
 
 class DremioHandle:
-    def __init__(self, parameters: Parameters):
-        self._rest_client = DremioRestClient(parameters)
+    def __init__(
+        self,
+        parameters: Parameters,
+        polling_policy: PollingPolicy = None,
+        job_watcher: DremioJobWatcher = None,
+        result_fetch_parallelism: int = 1,
+        flight_client: DremioFlightClient = None,
+        session: requests.Session = None,
+        rate_limits: RateLimits = None,
+    ):
+        self._rest_client = DremioRestClient(parameters, session, rate_limits)
+        self._flight_client = flight_client
+        self._polling_policy = polling_policy
+        self._job_watcher = job_watcher
+        self._result_fetch_parallelism = result_fetch_parallelism
         self._cursor = None
         self.closed = False
 
@@ -35,12 +54,28 @@ class DremioHandle:
             raise Exception("HandleClosed")
         if self._cursor is None or self._cursor.closed:
             self._rest_client.start()
-            self._cursor = DremioCursor(self._rest_client)
+            self._cursor = self.open_cursor()
         return self._cursor
 
+    def open_cursor(self):
+        # a cursor that is not the handle's own, so that several statements
+        # can run concurrently on one connection
+        if self.closed:
+            raise Exception("HandleClosed")
+        return DremioCursor(
+            self._rest_client,
+            self._polling_policy,
+            self._job_watcher,
+            self._result_fetch_parallelism,
+            self._flight_client,
+        )
+
     def close(self):
         if self.closed:
             raise Exception("HandleClosed")
+        if self._flight_client is not None:
+            self._flight_client.close()
+        self._rest_client.close()
         self.closed = True
 
     def rollback(self):
@@ -0,0 +1,186 @@
+# Copyright (C) 2022 Dremio Corporation
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, Optional
+
+from dbt.adapters.dremio.api.polling import PollingPolicy
+from dbt.adapters.dremio.api.rest.client import DremioRestClient
+
+from dbt.adapters.events.logging import AdapterLogger
+
+logger = AdapterLogger("dremio")
+
+
+@dataclass
+class _WatchedJob:
+    rest_client: DremioRestClient
+    future: Future
+    delays: Iterator[float]
+    next_poll: float
+    last_state: Optional[str] = field(default=None)
+    # set while a status request for the job is in flight
+    polling: bool = field(default=False)
+
+
+class DremioJobWatcher:
+    """Polls the status of every in-flight job from a single background thread.
+
+    Cursors register a job id with watch() and block on the returned future,
+    which resolves to the final job status payload once the job reaches a
+    terminal state. The status requests themselves run on a small pool, so a
+    request that is retried or rate limited only holds up its own job.
+    """
+
+    TERMINAL_JOB_STATES = ("COMPLETED", "FAILED", "CANCELLED")
+
+    # jobs that become due within this window are polled in the same sweep
+    COALESCE_WINDOW_S = 0.01
+
+    # how often a waiting cursor checks that the watcher thread is still alive
+    LIVENESS_CHECK_S = 5
+
+    def __init__(self, polling_policy: PollingPolicy, poll_workers: int = 4):
+        self._polling_policy = polling_policy
+        self._poll_workers = max(poll_workers, 1)
+        self._jobs: Dict[str, _WatchedJob] = {}
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._stopped = False
+
+    def watch(self, rest_client: DremioRestClient, job_id: str) -> Future:
+        future = Future()
+        with self._condition:
+            if self._stopped:
+                raise Exception("JobWatcherStopped")
+            self._jobs[job_id] = _WatchedJob(
+                rest_client=rest_client,
+                future=future,
+                delays=self._polling_policy.delays(),
+                next_poll=time.monotonic(),
+            )
+            self._ensure_running()
+            self._condition.notify()
+        return future
+
+    def wait_for(self, rest_client: DremioRestClient, job_id: str):
+        future = self.watch(rest_client, job_id)
+        while True:
+            try:
+                return future.result(timeout=self.LIVENESS_CHECK_S)
+            except FutureTimeoutError:
+                # a watcher thread that died is started again, so that the
+                # jobs it was watching are still polled
+                with self._condition:
+                    if not self._stopped:
+                        self._ensure_running()
+
+    def stop(self):
+        with self._condition:
+            self._stopped = True
+            jobs = list(self._jobs.values())
+            self._jobs.clear()
+            executor = self._executor
+            self._condition.notify()
+        if executor is not None:
+            executor.shutdown(wait=False)
+        for job in jobs:
+            self._resolve(job, exception=Exception("JobWatcherStopped"))
+
+    def _ensure_running(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._poll_workers, thread_name_prefix="dremio-job-poll"
+            )
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="dremio-job-watcher", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._stopped and not self._idle_jobs():
+                    self._condition.wait()
+                if self._stopped:
+                    return
+                now = time.monotonic()
+                idle = self._idle_jobs()
+                next_poll = min(job.next_poll for _, job in idle)
+                if next_poll > now:
+                    self._condition.wait(next_poll - now)
+                    continue
+                due = [
+                    (job_id, job)
+                    for job_id, job in idle
+                    if job.next_poll <= now + self.COALESCE_WINDOW_S
+                ]
+                for _, job in due:
+                    job.polling = True
+                executor = self._executor
+            for job_id, job in due:
+                try:
+                    executor.submit(self._poll, job_id, job)
+                except RuntimeError as e:
+                    # the executor was shut down by stop()
+                    self._forget(job_id)
+                    self._resolve(job, exception=e)
+
+    def _idle_jobs(self):
+        return [(job_id, job) for job_id, job in self._jobs.items() if not job.polling]
+
+    def _poll(self, job_id: str, job: _WatchedJob):
+        # any error fails only the job it came from, the watcher keeps polling
+        # the jobs of every other cursor
+        try:
+            job_status_response = job.rest_client.job_status(job_id)
+            job_status_state = job_status_response["jobState"]
+            if job_status_state != job.last_state:
+                logger.debug(f"Job {job_id} State = {job_status_state}")
+                job.last_state = job_status_state
+
+            if job_status_state in self.TERMINAL_JOB_STATES:
+                self._forget(job_id)
+                self._resolve(job, result=job_status_response)
+                return
+            delay_s = next(job.delays)
+        except Exception as e:
+            self._forget(job_id)
+            self._resolve(job, exception=e)
+            return
+        with self._condition:
+            job.next_poll = time.monotonic() + delay_s
+            job.polling = False
+            self._condition.notify()
+
+    def _forget(self, job_id: str):
+        with self._condition:
+            self._jobs.pop(job_id, None)
+
+    @staticmethod
+    def _resolve(job: _WatchedJob, result=None, exception=None):
+        try:
+            if exception is not None:
+                job.future.set_exception(exception)
+            else:
+                job.future.set_result(result)
+        except InvalidStateError:
+            # already resolved by stop()
+            pass
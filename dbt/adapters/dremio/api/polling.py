@@ -0,0 +1,49 @@
+# Copyright (C) 2022 Dremio Corporation
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+from abc import abstractmethod
+from dataclasses import dataclass
+from typing import Iterator
+
+
+@dataclass
+class PollingPolicy:
+    @classmethod
+    def build(cls, poll_initial_ms: int, poll_max_ms: int):
+        return ExponentialBackoffPollingPolicy(
+            initial_ms=poll_initial_ms, max_ms=poll_max_ms
+        )
+
+    @abstractmethod
+    def delays(self) -> Iterator[float]:
+        """Yields the number of seconds to wait before each successive poll."""
+        pass
+
+
+@dataclass
+class ExponentialBackoffPollingPolicy(PollingPolicy):
+    initial_ms: int = 50
+    max_ms: int = 2000
+    multiplier: float = 2.0
+    # fraction of each delay that is randomized, so that threads started
+    # together do not keep polling in lockstep
+    jitter: float = 0.5
+
+    def delays(self) -> Iterator[float]:
+        delay_ms = self.initial_ms
+        while True:
+            jittered_ms = delay_ms * (1 - self.jitter * random.random())
+            yield jittered_ms / 1000
+            delay_ms = min(delay_ms * self.multiplier, self.max_ms)
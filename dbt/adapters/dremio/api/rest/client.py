@@ -15,33 +15,90 @@
 # limitations under the License.
 
 
+import functools
+
 import requests
 
 from dbt.adapters.dremio.api.authentication import DremioPatAuthentication
-from dbt.adapters.dremio.api.parameters import Parameters
-from dbt.adapters.dremio.api.rest.utils import _post, _get, _put, _delete
+from dbt.adapters.dremio.api.parameters import CloudParameters, Parameters
+from dbt.adapters.dremio.api.rest.utils import _post, _get, _put, _delete, build_session
 from dbt.adapters.dremio.api.rest.url_builder import UrlBuilder
+from dbt.adapters.dremio.api.rest.error import DremioUnauthorizedException
+from dbt.adapters.dremio.api.rest.token_cache import token_cache
+from dbt.adapters.dremio.api.rest.rate_limiter import (
+    DremioRateLimiter,
+    RateLimits,
+    rate_limiter,
+)
 
 from dbt.adapters.events.logging import AdapterLogger
 
 logger = AdapterLogger("dremio")
 
-session = requests.Session()
+
+def _reauthenticate_on_unauthorized(func):
+    # a rejected token is refreshed through the shared token cache and the
+    # request is sent once more
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return func(self, *args, **kwargs)
+        except DremioUnauthorizedException:
+            if not self._refresh_token():
+                raise
+            return func(self, *args, **kwargs)
+
+    return wrapper
+
+
+def _rate_limited(kind):
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            self._acquire_rate_limit(kind)
+            return func(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
 
 
 class DremioRestClient:
-    def __init__(self, api_parameters: Parameters):
+    def __init__(
+        self,
+        api_parameters: Parameters,
+        session: requests.Session = None,
+        rate_limits: RateLimits = None,
+    ):
         self._parameters = api_parameters
+        # a client only closes the session it created itself
+        self._owns_session = session is None
+        self._session = build_session() if session is None else session
+        self._rate_limits = rate_limits or RateLimits()
 
     def start(self):
         self._parameters = self.__login()
 
-    def __login(self, timeout=10):
+    def close(self):
+        if self._owns_session:
+            self._session.close()
+
+    def __login(self, timeout=10, stale_token=None):
         if isinstance(self._parameters.authentication, DremioPatAuthentication):
             return self._parameters
 
+        self._parameters.authentication.token = token_cache.get_token(
+            (self._parameters.base_url, self._parameters.authentication.username),
+            lambda: self.__request_token(timeout),
+            stale_token=stale_token,
+        )
+
+        return self._parameters
+
+    def __request_token(self, timeout):
         url = UrlBuilder.login_url(self._parameters)
-        response = _post(
+        return _post(
+            self._session,
             url,
             json={
                 "userName": self._parameters.authentication.username,
@@ -51,36 +108,62 @@ class DremioRestClient:
             ssl_verify=self._parameters.authentication.verify_ssl,
         )
 
-        self._parameters.authentication.token = response["token"]
+    def _refresh_token(self) -> bool:
+        # returns False when the credentials cannot be refreshed by logging in
+        if isinstance(self._parameters.authentication, DremioPatAuthentication):
+            return False
+        logger.debug("Token was rejected, logging in again")
+        self._parameters = self.__login(
+            stale_token=self._parameters.authentication.token
+        )
+        return True
 
-        return self._parameters
+    def _acquire_rate_limit(self, kind):
+        # Cloud limits requests per project, Software per coordinator
+        if isinstance(self._parameters, CloudParameters):
+            key = self._parameters.cloud_project_id
+        else:
+            key = self._parameters.base_url
+        if kind == DremioRateLimiter.JOB_STATUS:
+            rate_per_s = self._rate_limits.job_status_per_s
+        else:
+            rate_per_s = self._rate_limits.catalog_mutation_per_s
+        rate_limiter.acquire(key, kind, rate_per_s)
 
+    @_reauthenticate_on_unauthorized
     def sql_endpoint(self, query, context=None):
         url = UrlBuilder.sql_url(self._parameters)
         return _post(
+            self._session,
             url,
             self._parameters.authentication.get_headers(),
             ssl_verify=self._parameters.authentication.verify_ssl,
             json={"sql": query, "context": context},
         )
 
+    @_reauthenticate_on_unauthorized
+    @_rate_limited(DremioRateLimiter.JOB_STATUS)
     def job_status(self, job_id):
         url = UrlBuilder.job_status_url(self._parameters, job_id)
         return _get(
+            self._session,
             url,
             self._parameters.authentication.get_headers(),
             ssl_verify=self._parameters.authentication.verify_ssl,
         )
 
+    @_reauthenticate_on_unauthorized
     def job_cancel_api(self, job_id):
         url = UrlBuilder.job_cancel_url(self._parameters, job_id)
         return _post(
+            self._session,
             url,
             self._parameters.authentication.get_headers(),
             json=None,
             ssl_verify=self._parameters.authentication.verify_ssl,
         )
 
+    @_reauthenticate_on_unauthorized
     def job_results(self, job_id, offset=0, limit=100):
         url = UrlBuilder.job_results_url(
             self._parameters,
@@ -89,21 +172,28 @@ class DremioRestClient:
             limit,
         )
         return _get(
+            self._session,
             url,
             self._parameters.authentication.get_headers(),
             ssl_verify=self._parameters.authentication.verify_ssl,
         )
 
+    @_reauthenticate_on_unauthorized
+    @_rate_limited(DremioRateLimiter.CATALOG_MUTATION)
     def create_catalog_api(self, json):
         url = UrlBuilder.catalog_url(self._parameters)
         return _post(
+            self._session,
             url,
             self._parameters.authentication.get_headers(),
             json=json,
             ssl_verify=self._parameters.authentication.verify_ssl,
         )
 
-    def get_catalog_item(self, catalog_id=None, catalog_path=None):
+    @_reauthenticate_on_unauthorized
+    def get_catalog_item(
+        self, catalog_id=None, catalog_path=None, max_children=None, page_token=None
+    ):
         if catalog_id is None and catalog_path is None:
             raise TypeError(
                 "both id and path can't be None for a catalog_item call")
@@ -113,6 +203,8 @@ class DremioRestClient:
             url = UrlBuilder.catalog_item_by_path_url(
                 self._parameters,
                 catalog_path,
+                max_children=max_children,
+                page_token=page_token,
             )
         else:
             url = UrlBuilder.catalog_item_by_id_url(
@@ -120,49 +212,64 @@ class DremioRestClient:
                 catalog_id,
             )
         return _get(
+            self._session,
             url,
             self._parameters.authentication.get_headers(),
             ssl_verify=self._parameters.authentication.verify_ssl,
         )
 
+    @_reauthenticate_on_unauthorized
+    @_rate_limited(DremioRateLimiter.CATALOG_MUTATION)
     def delete_catalog(self, cid):
         url = UrlBuilder.delete_catalog_url(self._parameters, cid)
         return _delete(
+            self._session,
             url,
             self._parameters.authentication.get_headers(),
             ssl_verify=self._parameters.authentication.verify_ssl,
         )
     
     # dbt docs integration within Dremio wikis and tags
+    @_reauthenticate_on_unauthorized
+    @_rate_limited(DremioRateLimiter.CATALOG_MUTATION)
     def create_wiki(self, object_id: str, text: str):
         url = UrlBuilder.wikis_management_url(self._parameters, object_id)
         return _post(
+            self._session,
             url,
             self._parameters.authentication.get_headers(),
             json={"text": text},
             ssl_verify=self._parameters.authentication.verify_ssl,
         )
 
+    @_reauthenticate_on_unauthorized
     def retrieve_wiki(self, object_id: str):
         url = UrlBuilder.wikis_management_url(self._parameters, object_id)
         return _get(
+            self._session,
             url,
             self._parameters.authentication.get_headers(),
             ssl_verify=self._parameters.authentication.verify_ssl,
         )
 
+    @_reauthenticate_on_unauthorized
+    @_rate_limited(DremioRateLimiter.CATALOG_MUTATION)
     def update_wiki(self, object_id: str, text: str, version: int):
         url = UrlBuilder.wikis_management_url(self._parameters, object_id)
         return _post(
+            self._session,
             url,
             self._parameters.authentication.get_headers(),
             json={"text": text, "version": version},
             ssl_verify=self._parameters.authentication.verify_ssl,
         )
 
+    @_reauthenticate_on_unauthorized
+    @_rate_limited(DremioRateLimiter.CATALOG_MUTATION)
     def delete_wiki(self, object_id: str, version: int):
         url = UrlBuilder.wikis_management_url(self._parameters, object_id)
         return _post(
+            self._session,
             url,
             self._parameters.authentication.get_headers(),
             json={"text": "", "version": version},
@@ -170,35 +277,46 @@ class DremioRestClient:
         )
 
 
+    @_reauthenticate_on_unauthorized
+    @_rate_limited(DremioRateLimiter.CATALOG_MUTATION)
     def create_tags(self, dataset_id: str, tags: list[str]):
         url = UrlBuilder.tags_management_url(self._parameters, dataset_id)
         return _post(
+            self._session,
             url,
             self._parameters.authentication.get_headers(),
             json={"tags": tags},
             ssl_verify=self._parameters.authentication.verify_ssl,
         )
 
+    @_reauthenticate_on_unauthorized
     def retrieve_tags(self, dataset_id: str):
         url = UrlBuilder.tags_management_url(self._parameters, dataset_id)
         return _get(
+            self._session,
             url,
             self._parameters.authentication.get_headers(),
             ssl_verify=self._parameters.authentication.verify_ssl,
         )
 
+    @_reauthenticate_on_unauthorized
+    @_rate_limited(DremioRateLimiter.CATALOG_MUTATION)
     def update_tags(self, dataset_id: str, tags: list[str], version: str):
         url = UrlBuilder.tags_management_url(self._parameters, dataset_id)
         return _post(
+            self._session,
             url,
             self._parameters.authentication.get_headers(),
             json={"tags": tags, "version": version},
             ssl_verify=self._parameters.authentication.verify_ssl,
         )
 
+    @_reauthenticate_on_unauthorized
+    @_rate_limited(DremioRateLimiter.CATALOG_MUTATION)
     def delete_tags(self, dataset_id: str, version: str):
         url = UrlBuilder.tags_management_url(self._parameters, dataset_id)
         return _post(
+            self._session,
             url,
             self._parameters.authentication.get_headers(),
             json={"tags": [], "version": version},
@@ -206,26 +324,34 @@ class DremioRestClient:
         )
 
 
+    @_reauthenticate_on_unauthorized
     def get_reflections(self, dataset_id):
         url = UrlBuilder.get_reflection_url(self._parameters, dataset_id)
         return _get(
+            self._session,
             url,
             self._parameters.authentication.get_headers(),
             ssl_verify=self._parameters.authentication.verify_ssl,
         )
 
+    @_reauthenticate_on_unauthorized
+    @_rate_limited(DremioRateLimiter.CATALOG_MUTATION)
     def create_reflection(self, payload):
         url = UrlBuilder.create_reflection_url(self._parameters)
         return _post(
+            self._session,
             url,
             self._parameters.authentication.get_headers(),
             json=payload,
             ssl_verify=self._parameters.authentication.verify_ssl,
         )
 
+    @_reauthenticate_on_unauthorized
+    @_rate_limited(DremioRateLimiter.CATALOG_MUTATION)
     def update_reflection(self, reflection_id, payload):
         url = UrlBuilder.update_reflection_url(self._parameters, reflection_id)
         return _put(
+            self._session,
             url,
             self._parameters.authentication.get_headers(),
             json=payload,
@@ -0,0 +1,89 @@
+# Copyright (C) 2022 Dremio Corporation
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Hashable, Optional, Tuple
+
+
+@dataclass
+class RateLimits:
+    # requests per second, None leaves that kind of request unlimited
+    job_status_per_s: Optional[float] = None
+    catalog_mutation_per_s: Optional[float] = None
+
+
+class TokenBucket:
+    """Blocks callers so that requests go out at no more than rate_per_s.
+
+    Up to capacity requests may be sent back to back after an idle period.
+    """
+
+    def __init__(self, rate_per_s: float, capacity: Optional[float] = None):
+        self.rate_per_s = rate_per_s
+        self.capacity = capacity if capacity is not None else max(1.0, rate_per_s)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._updated_at) * self.rate_per_s,
+                )
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_s = (1 - self._tokens) / self.rate_per_s
+            time.sleep(wait_s)
+
+
+class DremioRateLimiter:
+    """Process-wide token buckets, one per project or host and kind of request.
+
+    Dremio Cloud enforces its request limits per project, so every thread
+    talking to the same project draws from the same buckets.
+    """
+
+    JOB_STATUS = "job_status"
+    CATALOG_MUTATION = "catalog_mutation"
+
+    def __init__(self):
+        self._buckets: Dict[Tuple[Hashable, str], TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key: Hashable, kind: str, rate_per_s: Optional[float]):
+        if rate_per_s is None:
+            return
+        self._bucket(key, kind, rate_per_s).acquire()
+
+    def clear(self):
+        with self._lock:
+            self._buckets.clear()
+
+    def _bucket(self, key: Hashable, kind: str, rate_per_s: float) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get((key, kind))
+            if bucket is None or bucket.rate_per_s != rate_per_s:
+                bucket = TokenBucket(rate_per_s)
+                self._buckets[(key, kind)] = bucket
+            return bucket
+
+
+rate_limiter = DremioRateLimiter()
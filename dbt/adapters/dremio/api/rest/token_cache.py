@@ -0,0 +1,88 @@
+# Copyright (C) 2022 Dremio Corporation
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, Optional
+
+
+@dataclass
+class _CachedToken:
+    token: str
+    # epoch seconds, None when the login response did not say
+    expires_at: Optional[float] = None
+
+
+class DremioTokenCache:
+    """Process-wide cache of login tokens, keyed by host and user.
+
+    Every handle and thread that logs in with the same credentials shares one
+    token. Concurrent refreshes for the same key are serialized, so only the
+    first caller logs in and the others reuse the token it obtained.
+    """
+
+    # tokens this close to expiry are refreshed before use
+    EXPIRY_MARGIN_S = 300
+
+    def __init__(self):
+        self._tokens: Dict[Hashable, _CachedToken] = {}
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get_token(
+        self,
+        key: Hashable,
+        login: Callable[[], dict],
+        stale_token: Optional[str] = None,
+    ) -> str:
+        """Returns a valid token for key, calling login only when needed.
+
+        stale_token is a token the server has just rejected; it is never
+        returned again.
+        """
+        with self._key_lock(key):
+            cached = self._tokens.get(key)
+            if (
+                cached is not None
+                and cached.token != stale_token
+                and not self._is_expiring(cached)
+            ):
+                return cached.token
+
+            response = login()
+            expires = response.get("expires")
+            cached = _CachedToken(
+                token=response["token"],
+                # Dremio reports expiry in epoch milliseconds
+                expires_at=expires / 1000 if expires is not None else None,
+            )
+            self._tokens[key] = cached
+            return cached.token
+
+    def clear(self):
+        with self._lock:
+            self._tokens.clear()
+
+    def _key_lock(self, key: Hashable) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _is_expiring(self, cached: _CachedToken) -> bool:
+        if cached.expires_at is None:
+            return False
+        return cached.expires_at - time.time() < self.EXPIRY_MARGIN_S
+
+
+token_cache = DremioTokenCache()
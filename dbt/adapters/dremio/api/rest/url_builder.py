@@ -17,7 +17,7 @@ from dbt.adapters.dremio.api.parameters import (
     CloudParameters,
     SoftwareParameters,
 )
-from urllib.parse import quote
+from urllib.parse import quote, urlencode
 
 
 class UrlBuilder:
@@ -134,7 +134,9 @@ class UrlBuilder:
         return url_path + endpoint
 
     @classmethod
-    def catalog_item_by_path_url(cls, parameters: Parameters, path_list):
+    def catalog_item_by_path_url(
+        cls, parameters: Parameters, path_list, max_children=None, page_token=None
+    ):
         url_path = parameters.base_url
         if type(parameters) is CloudParameters:
             url_path += UrlBuilder.CLOUD_CATALOG_ENDPOINT.format(
@@ -148,6 +150,14 @@ class UrlBuilder:
         # Converts list to string separated by '/'
         joined_path_str = "/".join(quoted_path_list).replace('"', "")
         endpoint = f"/by-path/{joined_path_str}"
+        # children of a container are paginated
+        query = {}
+        if max_children is not None:
+            query["maxChildren"] = max_children
+        if page_token is not None:
+            query["pageToken"] = page_token
+        if query:
+            endpoint += "?" + urlencode(query)
         return url_path + endpoint
     
     # dbt docs integration within Dremio wikis and tags
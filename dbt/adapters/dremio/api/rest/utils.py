@@ -27,23 +27,129 @@ from .error import (
     DremioGatewayTimeoutException,
 )
 
+import random
+import socket
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
 import requests
 import json as jsonlib
+from requests.adapters import HTTPAdapter
 from requests.exceptions import HTTPError
+from urllib3.connection import HTTPConnection
 
 from dbt.adapters.events.logging import AdapterLogger
 
 logger = AdapterLogger("dremio")
 
-session = requests.Session()
+DEFAULT_POOL_MAXSIZE = 10
+
+# idempotent requests are retried on any transient error
+IDEMPOTENT_RETRY_STATUS_CODES = (408, 429, 500, 503, 504)
+# POSTs such as sql_endpoint may already have been acted on after a timeout or
+# server error, so they are only retried when the request was turned away
+NON_IDEMPOTENT_RETRY_STATUS_CODES = (429, 503)
+MAX_REQUEST_RETRIES = 4
+RETRY_BACKOFF_INITIAL_S = 0.5
+RETRY_BACKOFF_MAX_S = 30
+# total seconds all threads may spend waiting on retries during a run
+DEFAULT_RETRY_BUDGET_S = 300
+
+
+class RetryBudget:
+    """Caps the time spent sleeping between request retries across a run.
+
+    Once the budget is spent, transient errors are raised straight away so a
+    Dremio that stays overloaded fails the run instead of stalling it.
+    """
+
+    def __init__(self, budget_s: float = DEFAULT_RETRY_BUDGET_S):
+        self._remaining_s = budget_s
+        self._lock = threading.Lock()
+
+    def reset(self, budget_s: float = DEFAULT_RETRY_BUDGET_S):
+        with self._lock:
+            self._remaining_s = budget_s
 
+    def consume(self, delay_s: float) -> bool:
+        with self._lock:
+            if delay_s > self._remaining_s:
+                return False
+            self._remaining_s -= delay_s
+            return True
 
-def _get(url, request_headers, details="", ssl_verify=True):
-    response = session.get(url, headers=request_headers, verify=ssl_verify)
-    return _check_error(response, details)
+
+retry_budget = RetryBudget()
+
+
+class _KeepAliveHTTPAdapter(HTTPAdapter):
+    # TCP keep-alive stops idle pooled connections from being dropped by
+    # load balancers while a long running job is being waited on
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = HTTPConnection.default_socket_options + [
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        ]
+        super().init_poolmanager(*args, **kwargs)
+
+
+def build_session(pool_maxsize=DEFAULT_POOL_MAXSIZE):
+    session = requests.Session()
+    adapter = _KeepAliveHTTPAdapter(pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _retry_delay(response, attempt):
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            delay_s = float(retry_after)
+        except ValueError:
+            try:
+                delay_s = parsedate_to_datetime(retry_after).timestamp() - time.time()
+            except (TypeError, ValueError):
+                delay_s = None
+        if delay_s is not None:
+            return min(max(delay_s, 0), RETRY_BACKOFF_MAX_S)
+    delay_s = min(RETRY_BACKOFF_INITIAL_S * 2**attempt, RETRY_BACKOFF_MAX_S)
+    return delay_s * (1 - 0.5 * random.random())
+
+
+def _send(send_request, retry_status_codes, details=""):
+    attempt = 0
+    while True:
+        response = send_request()
+        if (
+            response.status_code not in retry_status_codes
+            or attempt >= MAX_REQUEST_RETRIES
+        ):
+            return _check_error(response, details)
+
+        delay_s = _retry_delay(response, attempt)
+        if not retry_budget.consume(delay_s):
+            logger.debug("Retry budget exhausted, not retrying request")
+            return _check_error(response, details)
+
+        attempt += 1
+        logger.debug(
+            f"Request to {response.url} returned {response.status_code}, "
+            f"retry {attempt} of {MAX_REQUEST_RETRIES} in {delay_s:.2f}s"
+        )
+        time.sleep(delay_s)
+
+
+def _get(session, url, request_headers, details="", ssl_verify=True):
+    return _send(
+        lambda: session.get(url, headers=request_headers, verify=ssl_verify),
+        IDEMPOTENT_RETRY_STATUS_CODES,
+        details,
+    )
 
 
 def _post(
+        session,
         url,
         request_headers=None,
         json=None,
@@ -53,26 +159,35 @@ def _post(
 ):
     if isinstance(json, str):
         json = jsonlib.loads(json)
-    response = session.post(
-        url,
-        headers=request_headers,
-        timeout=timeout,
-        verify=ssl_verify,
-        json=json,
+    return _send(
+        lambda: session.post(
+            url,
+            headers=request_headers,
+            timeout=timeout,
+            verify=ssl_verify,
+            json=json,
+        ),
+        NON_IDEMPOTENT_RETRY_STATUS_CODES,
+        details,
     )
-    return _check_error(response, details)
 
 
-def _put(url, request_headers, json=None, details="", ssl_verify=True):
-    response = session.put(
-        url, headers=request_headers, verify=ssl_verify, json=json
+def _put(session, url, request_headers, json=None, details="", ssl_verify=True):
+    return _send(
+        lambda: session.put(
+            url, headers=request_headers, verify=ssl_verify, json=json
+        ),
+        IDEMPOTENT_RETRY_STATUS_CODES,
+        details,
     )
-    return _check_error(response, details)
 
 
-def _delete(url, request_headers, details="", ssl_verify=True):
-    response = session.delete(url, headers=request_headers, verify=ssl_verify)
-    return _check_error(response, details)
+def _delete(session, url, request_headers, details="", ssl_verify=True):
+    return _send(
+        lambda: session.delete(url, headers=request_headers, verify=ssl_verify),
+        IDEMPOTENT_RETRY_STATUS_CODES,
+        details,
+    )
 
 
 def _raise_for_status(self):
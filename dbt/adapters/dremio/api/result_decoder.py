@@ -0,0 +1,122 @@
+# Copyright (C) 2022 Dremio Corporation
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import json
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional
+
+import agate
+from agate.rows import Row
+
+
+def _identity(value):
+    return value
+
+
+def _to_decimal(value):
+    if isinstance(value, float):
+        return Decimal(repr(value))
+    return Decimal(value)
+
+
+def _to_boolean(value):
+    if isinstance(value, str):
+        return value.lower() == "true"
+    return bool(value)
+
+
+def _to_date(value):
+    if isinstance(value, str):
+        return datetime.date.fromisoformat(value[:10])
+    return value
+
+
+def _to_datetime(value):
+    if isinstance(value, str):
+        return datetime.datetime.fromisoformat(value)
+    return value
+
+
+def _to_text(value):
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return str(value)
+
+
+# Dremio type name -> (agate column type factory, value decoder)
+_DREMIO_TYPES: Dict[str, tuple] = {
+    "TINYINT": (agate.Number, _to_decimal),
+    "SMALLINT": (agate.Number, _to_decimal),
+    "INTEGER": (agate.Number, _to_decimal),
+    "BIGINT": (agate.Number, _to_decimal),
+    "DECIMAL": (agate.Number, _to_decimal),
+    "FLOAT": (agate.Number, _to_decimal),
+    "DOUBLE": (agate.Number, _to_decimal),
+    "BOOLEAN": (agate.Boolean, _to_boolean),
+    "DATE": (agate.Date, _to_date),
+    "TIMESTAMP": (agate.DateTime, _to_datetime),
+    "VARCHAR": (agate.Text, _identity),
+    "CHAR": (agate.Text, _identity),
+    "LIST": (agate.Text, _to_text),
+    "STRUCT": (agate.Text, _to_text),
+    "MAP": (agate.Text, _to_text),
+}
+
+
+class DremioResultDecoder:
+    """Decodes job result rows using the schema Dremio returns with each page.
+
+    Column types come straight from the schema, so values are converted once,
+    column by column, without agate having to infer types from the data.
+    Types that have no agate equivalent (TIME, INTERVAL, VARBINARY, ...) are
+    kept as text.
+    """
+
+    def __init__(self, schema: List[Dict[str, Any]]):
+        self.column_names = [col["name"] for col in schema]
+        self.column_types = []
+        self._decoders: List[Callable[[Any], Any]] = []
+        for col in schema:
+            type_name = col["type"]["name"].upper()
+            column_type, decoder = _DREMIO_TYPES.get(type_name, (agate.Text, _to_text))
+            self.column_types.append(column_type())
+            self._decoders.append(decoder)
+
+    def decode_rows(self, json_rows: List[Dict[str, Any]]) -> List[tuple]:
+        columns = [
+            [self._decode(decoder, column_type, row.get(name)) for row in json_rows]
+            for name, decoder, column_type in zip(
+                self.column_names, self._decoders, self.column_types
+            )
+        ]
+        return list(zip(*columns))
+
+    def to_table(self, json_rows: List[Dict[str, Any]]) -> agate.Table:
+        # the rows already hold values of the column types, so agate is told
+        # not to cast every cell again
+        rows = [Row(row, self.column_names) for row in self.decode_rows(json_rows)]
+        return agate.Table(rows, self.column_names, self.column_types, _is_fork=True)
+
+    @staticmethod
+    def _decode(
+        decoder: Callable[[Any], Any], column_type: agate.DataType, value: Optional[Any]
+    ):
+        if value is None:
+            return None
+        try:
+            return decoder(value)
+        except (ArithmeticError, TypeError, ValueError):
+            # anything unexpected is left to the agate column type to cast
+            return column_type.cast(value)
@@ -0,0 +1,94 @@
+# Copyright (C) 2022 Dremio Corporation
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+
+from dbt.adapters.base.column import Column
+from dbt.adapters.base.relation import BaseRelation
+
+# statements that can change the columns of the relation they name
+_DDL_TARGET = re.compile(
+    r"\b(create\s+(?:or\s+replace\s+)?(?:table|view)(?:\s+if\s+not\s+exists)?"
+    r"|alter\s+(?:table|view)"
+    r"|drop\s+(?:table|view)(?:\s+if\s+exists)?)"
+    r"\s+((?:\"[^\"]+\"|[^\s\".(]+)(?:\s*\.\s*(?:\"[^\"]+\"|[^\s\".(]+))*)",
+    re.IGNORECASE,
+)
+_IDENTIFIER_PART = re.compile(r"\"([^\"]+)\"|([^\s\".]+)")
+
+
+def relation_key(name: str) -> str:
+    """Normalizes a rendered relation name, so that "a"."B".c and a.b.c match."""
+    parts = [quoted or bare for quoted, bare in _IDENTIFIER_PART.findall(name)]
+    return ".".join(parts).lower()
+
+
+class DremioColumnCache:
+    """Columns of relations, kept until DDL issued by the adapter changes them.
+
+    Each key carries a generation that is bumped on invalidation, so that a
+    lookup racing with DDL on another thread cannot store stale columns.
+    Relations that were last written by a CREATE statement are remembered,
+    their schema can then be read back from the catalog entity the statement
+    produced instead of from information_schema.
+    """
+
+    def __init__(self):
+        self._columns: Dict[str, List[Column]] = {}
+        self._generations: Dict[str, int] = {}
+        self._created: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def get(self, relation: BaseRelation) -> Tuple[Optional[List[Column]], int]:
+        key = relation_key(str(relation))
+        with self._lock:
+            return self._columns.get(key), self._generations.get(key, 0)
+
+    def set(
+        self, relation: BaseRelation, columns: List[Column], generation: int
+    ) -> None:
+        self.set_by_key(relation_key(str(relation)), columns, generation)
+
+    def set_by_key(self, key: str, columns: List[Column], generation: int) -> None:
+        with self._lock:
+            if self._generations.get(key, 0) == generation:
+                self._columns[key] = list(columns)
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._columns.pop(key, None)
+            self._generations[key] = self._generations.get(key, 0) + 1
+
+    def invalidate_sql(self, sql: str) -> None:
+        for match in _DDL_TARGET.finditer(sql):
+            key = relation_key(match.group(2))
+            self.invalidate(key)
+            with self._lock:
+                if match.group(1).lower().startswith("create"):
+                    self._created.add(key)
+                else:
+                    self._created.discard(key)
+
+    def was_created(self, relation: BaseRelation) -> bool:
+        with self._lock:
+            return relation_key(str(relation)) in self._created
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in self._columns:
+                self._generations[key] = self._generations.get(key, 0) + 1
+            self._columns.clear()
+            self._created.clear()
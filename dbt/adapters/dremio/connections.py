@@ -13,28 +13,43 @@
 # limitations under the License.
 
 import agate
-from typing import Any, Dict, Tuple, Optional, List
+import requests
+from typing import Any, Dict, Iterable, Tuple, Optional, List
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 
 from dbt.adapters.base.query_headers import MacroQueryStringSetter
 
 from dbt.adapters.dremio.__version__ import version
 from dbt.adapters.dremio.api.cursor import DremioCursor
+from dbt.adapters.dremio.api.flight import DremioFlightClient, build_flight_location
 from dbt.adapters.dremio.api.handle import DremioHandle
+from dbt.adapters.dremio.api.job_watcher import DremioJobWatcher
 from dbt.adapters.dremio.api.parameters import ParametersBuilder
+from dbt.adapters.dremio.api.polling import PollingPolicy
 from dbt.adapters.dremio.api.rest.entities.reflection import ReflectionEntity
 from dbt.adapters.dremio.relation import DremioRelation
+from dbt.adapters.dremio.fingerprint import fingerprint_from_tags, with_fingerprint_tag
 
 from dbt_common.clients import agate_helper
 
 import time
 import json
+import random
+import threading
 
 import dbt_common.exceptions
 from dbt.adapters.sql import SQLConnectionManager
-from dbt.adapters.contracts.connection import AdapterResponse, DEFAULT_QUERY_COMMENT
+from dbt.adapters.contracts.connection import (
+    AdapterResponse,
+    Connection,
+    DEFAULT_QUERY_COMMENT,
+)
 
 from dbt.adapters.dremio.api.rest.client import DremioRestClient
+from dbt.adapters.dremio.api.rest.rate_limiter import RateLimits
+from dbt.adapters.dremio.api.rest.utils import build_session, retry_budget
 
 from dbt.adapters.dremio.api.rest.error import (
     DremioAlreadyExistsException,
@@ -51,6 +66,21 @@ from dbt.adapters.events.logging import AdapterLogger
 
 logger = AdapterLogger("dremio")
 
+# the wordings Dremio and the Iceberg catalogs use for a commit that lost a
+# race with a concurrent commit to the same table
+COMMIT_CONFLICT_MARKERS = (
+    "concurrent",
+    "commitfailedexception",
+    "cannot commit",
+    "commit conflict",
+    "conflicting files",
+)
+
+
+def is_commit_conflict(error: Exception) -> bool:
+    message = str(error).lower()
+    return any(marker in message for marker in COMMIT_CONFLICT_MARKERS)
+
 DREMIO_QUERY_COMMENT = f"""
 {{%- set comment_dict = {{}} -%}}
 {{%- do comment_dict.update(
@@ -82,9 +112,30 @@ class DremioMacroQueryStringSetter(MacroQueryStringSetter):
 class DremioConnectionManager(SQLConnectionManager):
     TYPE = "dremio"
     DEFAULT_CONNECTION_RETRIES = 5
+    CATALOG_CHILDREN_PAGE_SIZE = 1000
+    CONCURRENT_COMMIT_RETRIES = 8
+    COMMIT_RETRY_BACKOFF_INITIAL_S = 0.2
+    COMMIT_RETRY_BACKOFF_MAX_S = 10
 
     retries = DEFAULT_CONNECTION_RETRIES
 
+    # one job watcher polls the jobs of every dbt thread
+    _job_watcher: Optional[DremioJobWatcher] = None
+    _job_watcher_lock = threading.Lock()
+
+    # one HTTP session is shared by the connections of every dbt thread, so
+    # that pooled keep-alive connections survive dbt releasing a connection
+    # between nodes
+    _http_session: Optional[requests.Session] = None
+    _http_session_lock = threading.Lock()
+    _threads = 1
+
+    def __init__(self, profile, mp_context) -> None:
+        super().__init__(profile, mp_context)
+        type(self)._threads = profile.threads
+        # request retries share one time budget for the whole run
+        retry_budget.reset()
+
     def set_query_header(self, query_header_context: Dict[str, Any]) -> None:
         self.query_header = DremioMacroQueryStringSetter(self.profile, query_header_context)
 
@@ -112,9 +163,33 @@ class DremioConnectionManager(SQLConnectionManager):
         credentials = connection.credentials
         parameters_builder = ParametersBuilder.build(credentials)
         api_parameters = parameters_builder.get_parameters()
+        polling_policy = PollingPolicy.build(
+            credentials.poll_initial_ms, credentials.poll_max_ms
+        )
+        job_watcher = cls._get_job_watcher(polling_policy)
+        http_session = cls._get_http_session(credentials.result_fetch_parallelism)
+        rate_limits = RateLimits(
+            job_status_per_s=credentials.job_status_rate_limit,
+            catalog_mutation_per_s=credentials.catalog_rate_limit,
+        )
 
         def connect():
-            handle = DremioHandle(api_parameters)
+            flight_client = None
+            if credentials.transport == "flight":
+                flight_client = DremioFlightClient(
+                    build_flight_location(credentials),
+                    api_parameters.authentication,
+                    credentials.cloud_project_id,
+                )
+            handle = DremioHandle(
+                api_parameters,
+                polling_policy,
+                job_watcher,
+                credentials.result_fetch_parallelism,
+                flight_client,
+                http_session,
+                rate_limits,
+            )
             _ = handle.cursor()
             connection.state = "open"
             connection.handle = handle
@@ -144,6 +219,36 @@ class DremioConnectionManager(SQLConnectionManager):
             retryable_exceptions=retryable_exceptions,
         )
 
+    @classmethod
+    def _get_job_watcher(cls, polling_policy: PollingPolicy) -> DremioJobWatcher:
+        with cls._job_watcher_lock:
+            if cls._job_watcher is None:
+                # as many status requests may be in flight as there are dbt
+                # threads, like when every cursor polled its own job
+                cls._job_watcher = DremioJobWatcher(polling_policy, cls._threads)
+            return cls._job_watcher
+
+    @classmethod
+    def _get_http_session(cls, result_fetch_parallelism: int) -> requests.Session:
+        with cls._http_session_lock:
+            if cls._http_session is None:
+                # every dbt thread may fetch result pages concurrently, and the
+                # job watcher polls on top of that
+                pool_maxsize = cls._threads * result_fetch_parallelism + 1
+                cls._http_session = build_session(pool_maxsize=pool_maxsize)
+            return cls._http_session
+
+    def cleanup_all(self) -> None:
+        super().cleanup_all()
+        with self._job_watcher_lock:
+            if self._job_watcher is not None:
+                self._job_watcher.stop()
+                type(self)._job_watcher = None
+        with self._http_session_lock:
+            if self._http_session is not None:
+                self._http_session.close()
+                type(self)._http_session = None
+
     @classmethod
     def is_cancelable(cls) -> bool:
         return True
@@ -166,7 +271,7 @@ class DremioConnectionManager(SQLConnectionManager):
     # Auto_begin may not be relevant with the rest_api
     def add_query(
         self, sql, auto_begin=True, bindings=None, abridge_sql_log=False,
-        fetch=False
+        fetch=False, limit=None
     ):
         connection = self.get_thread_connection()
         if auto_begin and connection.transaction_open is False:
@@ -186,10 +291,10 @@ class DremioConnectionManager(SQLConnectionManager):
             cursor = connection.handle.cursor()
 
             if bindings is None:
-                cursor.execute(sql, fetch=fetch)
+                cursor.execute(sql, fetch=fetch, limit=limit)
             else:
                 logger.debug(f"Bindings: {bindings}")
-                cursor.execute(sql, bindings, fetch=fetch)
+                cursor.execute(sql, bindings, fetch=fetch, limit=limit)
 
             logger.debug(
                 "SQL status: {} in {:0.2f} seconds".format(
@@ -220,7 +325,7 @@ class DremioConnectionManager(SQLConnectionManager):
             limit: Optional[int] = None,
     ) -> Tuple[AdapterResponse, agate.Table]:
         sql = self._add_query_comment(sql)
-        _, cursor = self.add_query(sql, auto_begin, fetch=fetch)
+        _, cursor = self.add_query(sql, auto_begin, fetch=fetch, limit=limit)
         response = self.get_response(cursor)
         if fetch:
             table = cursor.table
@@ -229,6 +334,70 @@ class DremioConnectionManager(SQLConnectionManager):
 
         return response, table
 
+    def reopen(self) -> Connection:
+        # a failed statement releases the thread's connection, statements that
+        # follow one that was expected to fail need it opened again
+        return self.open(self.get_thread_connection())
+
+    def execute_concurrently(self, sqls: Iterable[str], parallelism: int) -> int:
+        """Runs independent statements on up to parallelism cursors of the
+        thread's connection, returning the number of statements run."""
+        connection = self.get_thread_connection()
+        handle = connection.handle
+        logger.debug(
+            f'Using {self.TYPE} connection "{connection.name}" with {parallelism} concurrent statements'
+        )
+
+        def run(sql):
+            # a commit that lost a race with a concurrent one on the same
+            # Iceberg table wrote nothing, so it is safe to run again
+            for attempt in range(self.CONCURRENT_COMMIT_RETRIES + 1):
+                cursor = handle.open_cursor()
+                try:
+                    cursor.execute(sql)
+                    return
+                except Exception as e:
+                    if (
+                        not is_commit_conflict(e)
+                        or attempt == self.CONCURRENT_COMMIT_RETRIES
+                    ):
+                        logger.debug(f"Error running SQL: {sql[0:512]}....")
+                        raise
+                    logger.debug(f"Retrying statement after a commit conflict: {e}")
+                finally:
+                    cursor.close()
+                # jitter keeps the statements that conflicted from colliding again
+                delay_s = min(
+                    self.COMMIT_RETRY_BACKOFF_INITIAL_S * 2**attempt,
+                    self.COMMIT_RETRY_BACKOFF_MAX_S,
+                )
+                time.sleep(delay_s * (1 - 0.5 * random.random()))
+
+        statements = 0
+        pre = time.time()
+        executor = ThreadPoolExecutor(
+            max_workers=parallelism, thread_name_prefix="dremio-batch"
+        )
+        try:
+            # statements are rendered lazily and at most parallelism of them
+            # are held at once
+            pending = deque()
+            with self.exception_handler("concurrent statements"):
+                for sql in sqls:
+                    if len(pending) >= parallelism:
+                        pending.popleft().result()
+                    pending.append(executor.submit(run, self._add_query_comment(sql)))
+                    statements += 1
+                while pending:
+                    pending.popleft().result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        logger.debug(
+            "Ran {} statements in {:0.2f} seconds".format(statements, time.time() - pre)
+        )
+        return statements
+
     def drop_catalog(self, database, schema):
         logger.debug('Dropping schema "{}.{}"', database, schema)
 
@@ -284,6 +453,45 @@ class DremioConnectionManager(SQLConnectionManager):
         except DremioNotFoundException:
             return False
 
+    # metadata answered from the REST catalog (metadata_source: catalog_api)
+    def get_catalog_entity(self, path_list: List[str]) -> Optional[Dict[str, Any]]:
+        thread_connection = self.get_thread_connection()
+        connection = self.open(thread_connection)
+        rest_client = connection.handle.get_client()
+        try:
+            return rest_client.get_catalog_item(
+                catalog_id=None,
+                catalog_path=path_list,
+            )
+        except DremioNotFoundException:
+            return None
+
+    def get_catalog_container(self, path_list: List[str]) -> Optional[Dict[str, Any]]:
+        # returns the container with the children of every page
+        thread_connection = self.get_thread_connection()
+        connection = self.open(thread_connection)
+        rest_client = connection.handle.get_client()
+        container = None
+        page_token = None
+        while True:
+            try:
+                page = rest_client.get_catalog_item(
+                    catalog_id=None,
+                    catalog_path=path_list,
+                    max_children=self.CATALOG_CHILDREN_PAGE_SIZE,
+                    page_token=page_token,
+                )
+            except DremioNotFoundException:
+                return None
+            if container is None:
+                container = page
+                container["children"] = list(page.get("children", []))
+            else:
+                container["children"].extend(page.get("children", []))
+            page_token = page.get("nextPageToken")
+            if not page_token:
+                return container
+
     # dbt docs integration with Dremio wikis and tags
     def process_wikis(self, relation, text: str):
         logger.debug("Integrating wikis")
@@ -351,6 +559,8 @@ class DremioConnectionManager(SQLConnectionManager):
         stored_tags = rest_client.retrieve_tags(object_id)
         tags_list = stored_tags.get("tags")
         tags_version = stored_tags.get("version", None)
+        # the build fingerprint is not a model tag and outlives docs updates
+        tags = with_fingerprint_tag(tags, fingerprint_from_tags(tags_list or []))
 
         if tags_version is None:
             logger.debug(f"Creating tags for {'.'.join(path)}")
@@ -369,6 +579,44 @@ class DremioConnectionManager(SQLConnectionManager):
             result = rest_client.update_tags(object_id, tags, tags_version)
             logger.debug(result)
 
+    # relations whose inputs have not changed since they were built are kept
+    def get_relation_fingerprint(self, relation) -> Optional[str]:
+        thread_connection = self.get_thread_connection()
+        connection = self.open(thread_connection)
+        rest_client = connection.handle.get_client()
+        object_id = self._get_relation_id(rest_client, relation)
+        if object_id is None:
+            return None
+        stored_tags = rest_client.retrieve_tags(object_id)
+        return fingerprint_from_tags(stored_tags.get("tags") or [])
+
+    def set_relation_fingerprint(self, relation, fingerprint: str):
+        thread_connection = self.get_thread_connection()
+        connection = self.open(thread_connection)
+        rest_client = connection.handle.get_client()
+        object_id = self._get_relation_id(rest_client, relation)
+        if object_id is None:
+            logger.debug("Catalog not found. Returning")
+            return
+        stored_tags = rest_client.retrieve_tags(object_id)
+        tags = with_fingerprint_tag(stored_tags.get("tags") or [], fingerprint)
+        tags_version = stored_tags.get("version", None)
+        if tags_version is None:
+            rest_client.create_tags(object_id, tags)
+        else:
+            rest_client.update_tags(object_id, tags, tags_version)
+
+    def _get_relation_id(self, rest_client, relation) -> Optional[str]:
+        path = self._create_path_list(relation.database, relation.schema)
+        path.append(relation.identifier)
+        try:
+            catalog_info = rest_client.get_catalog_item(
+                catalog_id=None,
+                catalog_path=path,
+            )
+        except DremioNotFoundException:
+            return None
+        return catalog_info.get("id")
 
     def create_reflection(self, name: str, reflection_type: str, anchor: DremioRelation, display: List[str],
                           dimensions: List[str],
@@ -35,6 +35,28 @@ class DremioCredentials(Credentials):
     port: Optional[int] = 9047  # for rest endpoint
     use_ssl: Optional[bool] = True
     verify_ssl: Optional[bool] = True
+    # job status polling: first re-check after poll_initial_ms, backing off
+    # exponentially up to poll_max_ms between checks
+    poll_initial_ms: Optional[int] = 50
+    poll_max_ms: Optional[int] = 2000
+    # number of job result pages fetched concurrently
+    result_fetch_parallelism: Optional[int] = 4
+    # "rest" pages results through the job results API, "flight" fetches
+    # query results as Arrow record batches (requires pyarrow)
+    transport: Optional[str] = "rest"
+    flight_host: Optional[str] = None
+    flight_port: Optional[int] = 32010
+    # client-side request rate limits in requests per second, unlimited when unset
+    job_status_rate_limit: Optional[float] = None
+    catalog_rate_limit: Optional[float] = None
+    # "sql" reads metadata from INFORMATION_SCHEMA, "catalog_api" answers it
+    # from the REST catalog and falls back to SQL when it cannot
+    metadata_source: Optional[str] = "sql"
+    # seeds with load_method copy_into are written as Parquet to
+    # seed_staging_path (a local directory or object store URI) and loaded from
+    # seed_staging_location, the same folder as a path inside the datalake source
+    seed_staging_path: Optional[str] = None
+    seed_staging_location: Optional[str] = None
 
     _ALIASES = {
         # Only terms on left-side will be used going forward.
@@ -49,6 +71,8 @@ class DremioCredentials(Credentials):
 
     _DEFAULT_OBJECT_STORAGE_SOURCE = "$scratch"
     _SPACE_NAME_PLACEHOLDER = "@user"
+    _TRANSPORTS = ("rest", "flight")
+    _METADATA_SOURCES = ("sql", "catalog_api")
 
     @property
     def type(self):
@@ -75,6 +99,17 @@ class DremioCredentials(Credentials):
             "port",
             "use_ssl",
             "environment",
+            "poll_initial_ms",
+            "poll_max_ms",
+            "result_fetch_parallelism",
+            "transport",
+            "flight_host",
+            "flight_port",
+            "job_status_rate_limit",
+            "catalog_rate_limit",
+            "metadata_source",
+            "seed_staging_path",
+            "seed_staging_location",
             # These are aliased...
             "UID",
             "root_path",
@@ -126,6 +161,30 @@ class DremioCredentials(Credentials):
             self.database = f"@{self.UID}"
         if self.schema is None:
             self.schema = DremioRelation.no_schema
+        if self.poll_initial_ms is None or self.poll_initial_ms <= 0:
+            raise DbtValidationError("poll_initial_ms must be a positive number")
+        if self.poll_max_ms is None or self.poll_max_ms < self.poll_initial_ms:
+            raise DbtValidationError(
+                "poll_max_ms must be greater than or equal to poll_initial_ms"
+            )
+        if self.result_fetch_parallelism is None or self.result_fetch_parallelism < 1:
+            raise DbtValidationError("result_fetch_parallelism must be at least 1")
+        if self.transport not in self._TRANSPORTS:
+            raise DbtValidationError(
+                f"transport must be one of: {', '.join(self._TRANSPORTS)}"
+            )
+        if self.metadata_source not in self._METADATA_SOURCES:
+            raise DbtValidationError(
+                f"metadata_source must be one of: {', '.join(self._METADATA_SOURCES)}"
+            )
+        for rate_limit_key in ("job_status_rate_limit", "catalog_rate_limit"):
+            rate_limit = getattr(self, rate_limit_key)
+            if rate_limit is not None and rate_limit <= 0:
+                raise DbtValidationError(f"{rate_limit_key} must be a positive number")
+        if (self.seed_staging_path is None) != (self.seed_staging_location is None):
+            raise DbtValidationError(
+                "seed_staging_path and seed_staging_location must be set together"
+            )
 
     @staticmethod
     def _validate_and_restructure_data(data):
@@ -0,0 +1,44 @@
+# Copyright (C) 2022 Dremio Corporation
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import json
+from typing import Any, Dict, Optional, Sequence
+
+# the fingerprint of the inputs a relation was built from is kept as a tag on it
+FINGERPRINT_TAG_PREFIX = "dbt-fingerprint:"
+
+
+def fingerprint_from_tags(tags: Sequence[str]) -> Optional[str]:
+    for tag in tags:
+        if tag.startswith(FINGERPRINT_TAG_PREFIX):
+            return tag[len(FINGERPRINT_TAG_PREFIX) :]
+    return None
+
+
+def with_fingerprint_tag(tags: Sequence[str], fingerprint: Optional[str]) -> list:
+    """Replaces the fingerprint tag in tags, keeping every other tag."""
+    tags = [tag for tag in tags if not tag.startswith(FINGERPRINT_TAG_PREFIX)]
+    if fingerprint is not None:
+        tags.append(FINGERPRINT_TAG_PREFIX + fingerprint)
+    return tags
+
+
+def build_fingerprint(sql: str, config: Dict[str, Any], inputs: Dict[str, str]) -> str:
+    """Hashes the compiled SQL and config of a model with the state of the
+    relations it reads from."""
+    payload = {"sql": sql, "config": config, "inputs": inputs}
+    return hashlib.sha256(
+        json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
@@ -12,19 +12,58 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import threading
+from collections import defaultdict
+from concurrent.futures import as_completed
+
 import agate
 from dbt.adapters.sql import SQLAdapter
 from dbt.adapters.dremio import DremioConnectionManager
+from dbt.adapters.dremio.api.rest.error import DremioException
 from dbt.adapters.dremio.column import DremioColumn
+from dbt.adapters.dremio.column_cache import DremioColumnCache, relation_key
+from dbt.adapters.dremio.fingerprint import build_fingerprint
+from dbt.adapters.dremio.node_index import (
+    DremioNodeIndex,
+    IndexedNode,
+    format_clause_from_node,
+)
+from dbt.adapters.dremio.partition_pruning import (
+    MAX_PARTITION_MATCH_TERMS,
+    parse_partition_field,
+    partition_bounds_sql,
+    partition_exists_predicate,
+    partition_match_predicate,
+    partition_predicate,
+    partition_values_sql,
+)
 from dbt.adapters.dremio.relation import DremioRelation
+from dbt.adapters.dremio.seed import (
+    insert_batches,
+    number_column_types,
+    seed_column_changes,
+    seed_fingerprint,
+)
+from dbt.adapters.dremio.seed_staging import (
+    SeedStagingWriter,
+    copy_into_sql,
+    to_arrow_table,
+)
+from typing import Any
 from typing import Dict
 
 from typing import List
+from typing import Iterable
 from typing import Optional
+from typing import Set
+from typing import Tuple
 from dbt.adapters.base.column import Column as BaseColumn
-from dbt.adapters.base.impl import ConstraintSupport
+from dbt.adapters.base.impl import ConstraintSupport, _parse_callback_empty_table
 from dbt.adapters.base.meta import available
 from dbt.adapters.base.relation import BaseRelation
+from dbt.adapters.contracts.connection import AdapterResponse
+from dbt.adapters.contracts.relation import RelationConfig
 
 from dbt.adapters.capability import (
     CapabilityDict,
@@ -32,12 +71,26 @@ from dbt.adapters.capability import (
     Support,
     Capability,
 )
-from dbt.adapters.sql.impl import DROP_RELATION_MACRO_NAME
+from dbt.adapters.sql.impl import DROP_RELATION_MACRO_NAME, RENAME_RELATION_MACRO_NAME
 from dbt.adapters.events.logging import AdapterLogger
+from dbt_common.exceptions import DbtRuntimeError
+from dbt_common.utils import executor
 from dbt.contracts.graph.nodes import ConstraintType
 
 logger = AdapterLogger("dremio")
 
+LIST_RELATIONS_IN_SCHEMAS_MACRO_NAME = "dremio__list_relations_in_schemas"
+GET_COLUMNS_IN_RELATIONS_MACRO_NAME = "dremio__get_columns_in_relations"
+ALTER_TABLE_RENAME_MACRO_NAME = "dremio__alter_table_rename"
+# errors that mean a source cannot rename tables at all, rather than that one
+# rename failed
+RENAME_UNSUPPORTED_MARKERS = (
+    "parse error",
+    "unsupported",
+    "not supported",
+    "does not support",
+)
+
 
 class DremioAdapter(SQLAdapter):
     ConnectionManager = DremioConnectionManager
@@ -52,6 +105,9 @@ class DremioAdapter(SQLAdapter):
         ConstraintType.foreign_key: ConstraintSupport.NOT_SUPPORTED,
     }
 
+    # schemas listed per metadata job when the relation cache is populated
+    LIST_RELATIONS_BATCH_SIZE = 100
+
     _capabilities = CapabilityDict(
         {
             Capability.TableLastModifiedMetadata: CapabilitySupport(
@@ -63,6 +119,15 @@ class DremioAdapter(SQLAdapter):
         }
     )
 
+    def __init__(self, config, mp_context) -> None:
+        super().__init__(config, mp_context)
+        self._node_index: Optional[DremioNodeIndex] = None
+        self._node_index_lock = threading.Lock()
+        self._column_cache = DremioColumnCache()
+        # databases (sources and catalogs) that rejected ALTER TABLE RENAME
+        self._rename_unsupported: Set[str] = set()
+        self._rename_unsupported_lock = threading.Lock()
+
     @classmethod
     def date_function(cls):
         return "current_date"
@@ -85,13 +150,43 @@ class DremioAdapter(SQLAdapter):
 
     @classmethod
     def convert_number_type(cls, agate_table, col_idx):
-        decimals = agate_table.aggregate(agate.MaxPrecision(col_idx))
-        return "decimal" if decimals else "bigint"
+        return number_column_types(agate_table)[col_idx]
 
     @classmethod
     def convert_time_type(cls, agate_table, col_idx):
         return "time"
 
+    def rename_relation(
+        self, from_relation: DremioRelation, to_relation: DremioRelation
+    ) -> None:
+        # a catalog-level rename is tried first, copying the table with CTAS and
+        # dropping it is the fallback for sources that cannot rename tables
+        self.cache_renamed(from_relation, to_relation)
+        kwargs = {"from_relation": from_relation, "to_relation": to_relation}
+        database = (from_relation.database or "").lower()
+        can_rename = (
+            from_relation.type != DremioRelation.View
+            and database == (to_relation.database or "").lower()
+        )
+        with self._rename_unsupported_lock:
+            can_rename = can_rename and database not in self._rename_unsupported
+        if can_rename:
+            try:
+                self.execute_macro(ALTER_TABLE_RENAME_MACRO_NAME, kwargs=kwargs)
+                self._column_cache.invalidate(relation_key(str(to_relation)))
+                return
+            except DbtRuntimeError as e:
+                logger.debug(
+                    f"Renaming {from_relation} in the catalog failed, copying it instead: {e}"
+                )
+                # the failed rename released the connection the copy runs on
+                self.connections.reopen()
+                message = str(e).lower()
+                if any(marker in message for marker in RENAME_UNSUPPORTED_MARKERS):
+                    with self._rename_unsupported_lock:
+                        self._rename_unsupported.add(database)
+        self.execute_macro(RENAME_RELATION_MACRO_NAME, kwargs=kwargs)
+
     def create_schema(self, relation: DremioRelation) -> None:
         self.connections.create_catalog(relation)
 
@@ -142,7 +237,7 @@ class DremioAdapter(SQLAdapter):
         """The set of standard builtin strategies which this adapter supports out-of-the-box.
         Not used to validate custom strategies defined by end users.
         """
-        return ["append"]
+        return ["append", "merge", "insert_overwrite"]
 
     def standardize_grants_dict(self, grants_table: agate.Table) -> dict:
         """Translate the result of `show grants` (or equivalent) to match the
@@ -181,6 +276,465 @@ class DremioAdapter(SQLAdapter):
         ]
         return columns
 
+    def _relations_cache_for_schemas(
+        self,
+        relation_configs: Iterable[RelationConfig],
+        cache_schemas: Optional[Set[BaseRelation]] = None,
+    ) -> None:
+        # one metadata job per database (and batch of schemas) instead of one
+        # per schema
+        if not cache_schemas:
+            cache_schemas = self._get_cache_schemas(relation_configs)
+
+        schemas_by_database = defaultdict(list)
+        for cache_schema in cache_schemas:
+            schemas_by_database[cache_schema.database].append(cache_schema.schema)
+
+        with executor(self.config) as tpe:
+            futures = []
+            for database, schemas in schemas_by_database.items():
+                schemas = sorted(set(schemas))
+                for start in range(0, len(schemas), self.LIST_RELATIONS_BATCH_SIZE):
+                    batch = schemas[start : start + self.LIST_RELATIONS_BATCH_SIZE]
+                    futures.append(
+                        tpe.submit_connected(
+                            self,
+                            f"list_{database}_{start}",
+                            self.list_relations_in_schemas,
+                            database,
+                            batch,
+                        )
+                    )
+
+            for future in as_completed(futures):
+                for relation in future.result():
+                    self.cache.add(relation)
+
+        # schemas without relations are cached too, so that they are known
+        # to be empty
+        self.cache.update_schemas(
+            {
+                (cache_schema.database, cache_schema.schema)
+                for cache_schema in cache_schemas
+                if cache_schema.schema
+            }
+        )
+
+    def list_relations_in_schemas(
+        self, database: str, schemas: List[str]
+    ) -> List[BaseRelation]:
+        results = self.execute_macro(
+            LIST_RELATIONS_IN_SCHEMAS_MACRO_NAME,
+            kwargs={"database": database, "schemas": schemas},
+        )
+
+        relations = []
+        quote_policy = {"database": True, "schema": True, "identifier": True}
+        for _database, name, _schema, _type in results:
+            try:
+                _type = self.Relation.get_relation_type(_type)
+            except ValueError:
+                _type = self.Relation.External
+            relations.append(
+                self.Relation.create(
+                    database=_database,
+                    schema=_schema,
+                    identifier=name,
+                    quote_policy=quote_policy,
+                    type=_type,
+                )
+            )
+        return relations
+
+    @available.parse(_parse_callback_empty_table)
+    def execute(
+        self,
+        sql: str,
+        auto_begin: bool = False,
+        fetch: bool = False,
+        limit: Optional[int] = None,
+    ) -> Tuple[AdapterResponse, agate.Table]:
+        try:
+            return super().execute(sql, auto_begin=auto_begin, fetch=fetch, limit=limit)
+        finally:
+            # cached columns of any relation this statement may have changed
+            self._column_cache.invalidate_sql(sql)
+
+    @available.parse_list
+    def get_columns_in_relation(self, relation: DremioRelation) -> List[BaseColumn]:
+        columns, generation = self._column_cache.get(relation)
+        if columns is None:
+            columns = self._get_created_relation_columns(relation)
+            if columns is None:
+                columns = super().get_columns_in_relation(relation)
+            self._column_cache.set(relation, columns, generation)
+        return list(columns)
+
+    @available.parse_list
+    def get_columns_in_query(self, sql: str) -> List[BaseColumn]:
+        """Reads the schema of a query from a job that returns no rows."""
+        _, cursor = self.connections.add_query(
+            f"select * from (\n{sql}\n) as dbt_query_schema limit 0",
+            auto_begin=False,
+            fetch=True,
+        )
+        return [
+            self._column_from_catalog_field(field)
+            for field in cursor.job_results()["schema"]
+        ]
+
+    @available
+    def get_partition_predicates(
+        self,
+        source_relation: DremioRelation,
+        target_relation: DremioRelation,
+        partition_by: Any,
+    ) -> List[str]:
+        """Derives predicates on DBT_INTERNAL_DEST that limit a merge into
+        target_relation to the partitions the rows of source_relation fall in."""
+        if not partition_by:
+            return []
+        if isinstance(partition_by, str):
+            partition_by = [partition_by]
+        data_types = {
+            column.name.lower(): column.data_type
+            for column in self.get_columns_in_relation(target_relation)
+        }
+        fields = [
+            field
+            for field in map(parse_partition_field, partition_by)
+            if field is not None and field.column_key in data_types
+        ]
+        if not fields:
+            return []
+        _, table = self.execute(
+            partition_bounds_sql(str(source_relation), fields), fetch=True
+        )
+        bounds = table.rows[0]
+        predicates = []
+        for index, field in enumerate(fields):
+            min_value, max_value, nulls = bounds[index * 3 : index * 3 + 3]
+            predicate = partition_predicate(
+                field, data_types[field.column_key], min_value, max_value, bool(nulls)
+            )
+            if predicate is not None:
+                predicates.append(predicate)
+        return predicates
+
+    @available
+    def get_partition_overwrite_predicate(
+        self,
+        source_relation: DremioRelation,
+        target_relation: DremioRelation,
+        partition_by: Any,
+    ) -> str:
+        """Builds a predicate on DBT_INTERNAL_DEST matching every partition of
+        target_relation that rows of source_relation fall in, FALSE if none."""
+        if not partition_by:
+            raise DbtRuntimeError("insert_overwrite requires partition_by to be set")
+        if isinstance(partition_by, str):
+            partition_by = [partition_by]
+        data_types = {
+            column.name.lower(): column.data_type
+            for column in self.get_columns_in_relation(target_relation)
+        }
+        fields = []
+        for expression in partition_by:
+            field = parse_partition_field(expression)
+            # overwriting a wider set of partitions than the batch covers would lose data
+            if field is None or field.column_key not in data_types:
+                raise DbtRuntimeError(
+                    f"insert_overwrite does not support the partition {expression}, "
+                    "only identity and year, month, day or hour partitions"
+                )
+            fields.append(field)
+        _, table = self.execute(
+            partition_values_sql(
+                str(source_relation), fields, limit=MAX_PARTITION_MATCH_TERMS + 1
+            ),
+            fetch=True,
+        )
+        if len(table.rows) > MAX_PARTITION_MATCH_TERMS:
+            # one term per partition would make the delete statement unbounded
+            return partition_exists_predicate(fields, str(source_relation))
+        field_types = [data_types[field.column_key] for field in fields]
+        predicates = [
+            partition_match_predicate(fields, field_types, list(row))
+            for row in table.rows
+        ]
+        if not predicates:
+            return "FALSE"
+        return " or ".join(f"({predicate})" for predicate in predicates)
+
+    @available
+    def overwrite_partitions(
+        self,
+        target_relation: DremioRelation,
+        delete_sql: Optional[str],
+        insert_sql: str,
+    ) -> AdapterResponse:
+        """Deletes the partitions an insert_overwrite batch replaces and inserts
+        the batch. Dremio has no multi-statement transactions, so when either
+        statement fails the table is rolled back to the snapshot it was at
+        before the delete."""
+        path = self._catalog_path(
+            target_relation.database, target_relation.schema
+        ) + [target_relation.identifier]
+        snapshot_id = self._current_snapshot_id(path)
+        try:
+            if delete_sql is not None:
+                self.execute(delete_sql)
+            response, _ = self.execute(insert_sql)
+        except DbtRuntimeError:
+            # the failed statement released the connection the rollback runs on
+            self.connections.reopen()
+            if snapshot_id is not None:
+                self.execute(
+                    f"rollback table {target_relation} to snapshot '{snapshot_id}'"
+                )
+            raise
+        return response
+
+    def _current_snapshot_id(self, path: List[str]) -> Optional[str]:
+        # None when the table is not an Iceberg table
+        table_path = ".".join('"{}"'.format(part) for part in path).replace("'", "''")
+        try:
+            _, table = self.execute(
+                f"select snapshot_id from table(table_snapshot('{table_path}')) "
+                "order by committed_at desc limit 1",
+                fetch=True,
+            )
+        except DbtRuntimeError:
+            # the statements that follow still need the connection the failed
+            # query released
+            self.connections.reopen()
+            return None
+        if not table.rows:
+            return None
+        return str(table.rows[0][0])
+
+    def _get_created_relation_columns(
+        self, relation: DremioRelation
+    ) -> Optional[List[BaseColumn]]:
+        # CTAS jobs only report what they wrote (fragments and record counts),
+        # so the schema of a relation the adapter just created is read from
+        # its catalog entity, which is a REST call instead of an engine job
+        if not self._column_cache.was_created(relation):
+            return None
+        return self.get_columns_from_catalog(relation) or None
+
+    @available
+    def load_columns_in_relations(self, relations: List[DremioRelation]) -> None:
+        """Fetches the columns of every uncached relation in a single query."""
+        missing = {}
+        for relation in relations:
+            if relation is None or relation.identifier is None:
+                continue
+            columns, generation = self._column_cache.get(relation)
+            if columns is None:
+                missing[relation_key(str(relation))] = (relation, generation)
+        if not missing:
+            return
+
+        use_catalog = self.config.credentials.metadata_source == "catalog_api"
+        for key, (relation, generation) in list(missing.items()):
+            if use_catalog:
+                columns = self.get_columns_from_catalog(relation)
+            else:
+                columns = self._get_created_relation_columns(relation)
+            if columns is not None:
+                self._column_cache.set_by_key(key, columns, generation)
+                del missing[key]
+        if not missing:
+            return
+
+        results = self.execute_macro(
+            GET_COLUMNS_IN_RELATIONS_MACRO_NAME,
+            kwargs={"relations": [relation for relation, _ in missing.values()]},
+        )
+        columns_by_key = {key: [] for key in missing}
+        for table_schema, table_name, *column in results:
+            key = relation_key(f"{table_schema}.{table_name}")
+            if key in columns_by_key:
+                columns_by_key[key].append(self.Column(*column))
+        for key, columns in columns_by_key.items():
+            self._column_cache.set_by_key(key, columns, missing[key][1])
+
+    @available
+    def insert_seed_rows(
+        self,
+        relation: DremioRelation,
+        agate_table: agate.Table,
+        column_names: List[str],
+        column_types: List[str],
+        batch_size: int,
+        parallelism: int,
+    ) -> int:
+        """Inserts the seed in batches of typed VALUES, running up to
+        parallelism batches at once. Returns the number of rows inserted."""
+        statements = insert_batches(
+            str(relation), column_names, column_types, agate_table.rows, batch_size
+        )
+        try:
+            self.connections.execute_concurrently(statements, parallelism)
+        except DbtRuntimeError:
+            # the batches committed before the failure would leave a partly
+            # loaded seed behind, the failed statement released the connection
+            self.connections.reopen()
+            self.drop_relation(relation)
+            raise
+        return len(agate_table.rows)
+
+    @available
+    def copy_seed_into(
+        self,
+        relation: DremioRelation,
+        agate_table: agate.Table,
+        column_names: List[str],
+        column_types: List[str],
+    ) -> int:
+        """Writes the seed as a Parquet file to the staging location and loads
+        it with COPY INTO. Returns the number of rows loaded."""
+        credentials = self.config.credentials
+        if credentials.seed_staging_path is None:
+            raise DbtRuntimeError(
+                "load_method copy_into requires seed_staging_path and "
+                "seed_staging_location to be set in the profile"
+            )
+        writer = SeedStagingWriter.build(credentials.seed_staging_path)
+        file_name = writer.new_file_name(relation.identifier)
+        writer.write(
+            file_name, to_arrow_table(column_names, column_types, agate_table.rows)
+        )
+        location = "@{}/{}".format(
+            credentials.datalake, credentials.seed_staging_location.strip("/")
+        ).rstrip("/")
+        try:
+            self.execute(copy_into_sql(str(relation), location, file_name))
+        finally:
+            writer.remove(file_name)
+        return len(agate_table.rows)
+
+    @available
+    def widen_seed_columns(
+        self, staging_relation: DremioRelation, target_relation: DremioRelation
+    ) -> bool:
+        """Widens the decimal columns of a seed's table that are too narrow for
+        its staged rows. Returns False when the seed's columns changed in a way
+        that needs the table rebuilt."""
+        changes = seed_column_changes(
+            self.get_columns_in_relation(staging_relation),
+            self.get_columns_in_relation(target_relation),
+        )
+        if changes is None:
+            return False
+        for column_name, data_type in changes.items():
+            self.alter_column_type(target_relation, column_name, data_type)
+        return True
+
+    @available
+    def merge_seed_from_staging(
+        self, staging_relation: DremioRelation, statements: List[str]
+    ) -> None:
+        """Runs the statements that apply a seed's staging table to its table,
+        dropping the staging table whether or not they succeed."""
+        try:
+            for sql in statements:
+                self.execute(sql)
+        except DbtRuntimeError:
+            # the failed statement released the connection the drop runs on
+            self.connections.reopen()
+            self.drop_relation(staging_relation)
+            raise
+        self.drop_relation(staging_relation)
+
+    @available
+    def rebuild_seed_from_staging(
+        self, staging_relation: DremioRelation, target_relation: DremioRelation
+    ) -> None:
+        """Replaces a seed's table with its staging table. The table is set
+        aside until the staging table has taken its place, and put back if
+        that fails."""
+        backup_relation = target_relation.incorporate(
+            path={"identifier": target_relation.identifier + "__dbt_seed_backup"}
+        )
+        self.drop_relation(backup_relation)
+        self.rename_relation(target_relation, backup_relation)
+        try:
+            self.rename_relation(staging_relation, target_relation)
+        except DbtRuntimeError:
+            self.connections.reopen()
+            self.drop_relation(target_relation)
+            self.rename_relation(backup_relation, target_relation)
+            self.drop_relation(staging_relation)
+            raise
+        self.drop_relation(backup_relation)
+
+    @available
+    def seed_fingerprint(self, model: Dict[str, Any]) -> str:
+        """Hashes the seed's CSV file and the config that shapes its table."""
+        path = os.path.join(model["root_path"], model["original_file_path"])
+        return seed_fingerprint(path, model["config"])
+
+    @available
+    def get_relation_fingerprint(self, relation: DremioRelation) -> Optional[str]:
+        return self.connections.get_relation_fingerprint(relation)
+
+    @available
+    def set_relation_fingerprint(self, relation: DremioRelation, fingerprint: str) -> None:
+        self.connections.set_relation_fingerprint(relation, fingerprint)
+
+    @available
+    def build_fingerprint(
+        self, model: Dict[str, Any], graph: Dict[str, Any], sql: str
+    ) -> Optional[str]:
+        """Fingerprints the compiled SQL of a model with the current snapshot of
+        every upstream Iceberg table and the definition of every upstream view.
+        Returns None when an input's state cannot be read, so the model is built."""
+        inputs = {}
+        pending = list(model["depends_on"]["nodes"])
+        seen = set()
+        while pending:
+            unique_id = pending.pop()
+            if unique_id in seen:
+                continue
+            seen.add(unique_id)
+            node = graph["nodes"].get(unique_id) or graph["sources"].get(unique_id)
+            if node is None:
+                return None
+            materialized = (node.get("config") or {}).get("materialized")
+            # views and ephemeral models pass their inputs' changes through
+            if materialized in ("view", "ephemeral"):
+                pending.extend(node["depends_on"]["nodes"])
+            if materialized == "ephemeral":
+                continue
+            state = self._input_state(node)
+            if state is None:
+                logger.debug(f"Cannot fingerprint {unique_id}, building the model")
+                return None
+            inputs[unique_id] = state
+        return build_fingerprint(sql, model["config"], inputs)
+
+    def _input_state(self, node: Dict[str, Any]) -> Optional[str]:
+        identifier = node.get("alias") or node["identifier"]
+        path = self._catalog_path(node["database"], node["schema"]) + [identifier]
+        entity = self.connections.get_catalog_entity(path)
+        if entity is None:
+            return None
+        if entity.get("type") == "VIRTUAL_DATASET":
+            # what a view outside of the project reads from is not known
+            if node["resource_type"] == "source":
+                return None
+            return "view:" + entity.get("sql", "")
+        # promoted files and tables of other formats have no snapshots
+        format_type = (entity.get("format") or {}).get("type")
+        if format_type is not None and format_type.upper() != "ICEBERG":
+            return None
+        snapshot_id = self._current_snapshot_id(path)
+        if snapshot_id is None:
+            return None
+        return "snapshot:" + snapshot_id
+
     # This is for use in the test suite
     # Need to override to add fetch to the execute method
     def run_sql_for_tests(self, sql, fetch, conn):
@@ -222,6 +776,145 @@ class DremioAdapter(SQLAdapter):
                                            computations, partition_by, partition_transform, partition_method,
                                            distribute_by, localsort_by, arrow_cache)
 
+    # metadata from the REST catalog, used when metadata_source is catalog_api.
+    # Each method returns None when the catalog cannot answer, and the calling
+    # macro then falls back to INFORMATION_SCHEMA.
+    @available
+    def list_relations_from_catalog(
+        self, database: str, schemas: List[str]
+    ) -> Optional[List[Tuple[str, str, str, str]]]:
+        rows = []
+        try:
+            for schema in schemas:
+                container = self.connections.get_catalog_container(
+                    self._catalog_path(database, schema)
+                )
+                if container is None:
+                    continue
+                for child in container["children"]:
+                    if child.get("type") != "DATASET":
+                        continue
+                    path = child["path"]
+                    relation_type = (
+                        "view" if child.get("datasetType") == "VIRTUAL" else "table"
+                    )
+                    rows.append(
+                        (
+                            path[0],
+                            path[-1],
+                            ".".join(path[1:-1]) or DremioRelation.no_schema,
+                            relation_type,
+                        )
+                    )
+        except DremioException as e:
+            logger.debug(f"Listing relations from the catalog failed: {e}")
+            return None
+        return rows
+
+    @available
+    def check_schema_exists_in_catalog(
+        self, database: str, schema: str
+    ) -> Optional[bool]:
+        try:
+            entity = self.connections.get_catalog_entity(
+                self._catalog_path(database, schema)
+            )
+        except DremioException as e:
+            logger.debug(f"Checking schema in the catalog failed: {e}")
+            return None
+        return entity is not None and entity.get("entityType") != "dataset"
+
+    @available
+    def get_columns_from_catalog(
+        self, relation: DremioRelation
+    ) -> Optional[List[DremioColumn]]:
+        path = self._catalog_path(relation.database, relation.schema)
+        path.append(relation.identifier.strip('"'))
+        try:
+            entity = self.connections.get_catalog_entity(path)
+        except DremioException as e:
+            logger.debug(f"Reading columns from the catalog failed: {e}")
+            return None
+        if entity is None:
+            return []
+        if "fields" not in entity:
+            return None
+        return [self._column_from_catalog_field(field) for field in entity["fields"]]
+
+    @available
+    def list_schemas_from_catalog(self, database: str) -> Optional[List[Tuple[str]]]:
+        database = database.strip('"')
+        try:
+            root = self.connections.get_catalog_container([database])
+            # folders of a source are not walked, that can mean listing a
+            # whole object store
+            if root is not None and root.get("entityType") == "source":
+                return None
+            schemas = []
+            pending = [root] if root is not None else []
+            while pending:
+                container = pending.pop()
+                for child in container["children"]:
+                    if child.get("containerType") != "FOLDER":
+                        continue
+                    schemas.append((".".join(child["path"][1:]),))
+                    folder = self.connections.get_catalog_container(child["path"])
+                    if folder is not None:
+                        pending.append(folder)
+        except DremioException as e:
+            logger.debug(f"Listing schemas from the catalog failed: {e}")
+            return None
+        schemas.append((DremioRelation.no_schema,))
+        return schemas
+
+    def _catalog_path(self, database: str, schema: str) -> List[str]:
+        return self.connections._create_path_list(
+            database.strip('"'), schema.strip('"')
+        )
+
+    # information_schema reports these types under their SQL standard names
+    _CATALOG_TYPE_NAMES = {
+        "VARCHAR": "character varying",
+        "VARBINARY": "binary varying",
+        "STRUCT": "row",
+        "LIST": "array",
+    }
+    _VARCHAR_MAX_LENGTH = 65536
+
+    def _column_from_catalog_field(self, field: Dict[str, Any]) -> DremioColumn:
+        field_type = field.get("type", {})
+        type_name = field_type.get("name", "")
+        return self.Column(
+            field["name"],
+            self._CATALOG_TYPE_NAMES.get(type_name, type_name.lower()),
+            self._VARCHAR_MAX_LENGTH if type_name == "VARCHAR" else None,
+            field_type.get("precision"),
+            field_type.get("scale"),
+        )
+
+    # constant time node lookups for the ref() and source() overrides
+    @available
+    def get_ref_node(self, graph: Dict[str, Any], model_name: str) -> Optional[IndexedNode]:
+        return self._get_node_index(graph).get_model(model_name)
+
+    @available
+    def get_source_node(
+        self, graph: Dict[str, Any], source_name: str, table_name: str
+    ) -> Optional[IndexedNode]:
+        return self._get_node_index(graph).get_source(source_name, table_name)
+
+    @available
+    def format_clause_from_node(self, config: Dict[str, Any]) -> Optional[str]:
+        return format_clause_from_node(config)
+
+    def _get_node_index(self, graph: Dict[str, Any]) -> DremioNodeIndex:
+        # the graph is built once per invocation, so the index is only rebuilt
+        # when a different graph is passed in
+        with self._node_index_lock:
+            if self._node_index is None or self._node_index.graph is not graph:
+                self._node_index = DremioNodeIndex(graph)
+            return self._node_index
+
 
 COLUMNS_EQUAL_SQL = """
 with diff_count as (
@@ -0,0 +1,131 @@
+# Copyright (C) 2022 Dremio Corporation
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+_FORMAT_KEY_MAP = {
+    "format": "type",
+    "field_delimiter": "fieldDelimiter",
+    "line_delimiter": "lineDelimiter",
+    "skip_first_line": "skipFirstLine",
+    "extract_header": "extractHeader",
+    "trim_header": "trimHeader",
+    "auto_generated_column_names": "autoGenerateColumnNames",
+    "pretty_print": "prettyPrint",
+    "sheet_name": "sheetName",
+    "has_merged_cells": "hasMergedCells",
+}
+_NODE_FORMATS = ("text", "json", "arrow", "parquet", "avro", "excel", "delta")
+_STRING_OPTIONS = {
+    "text": ("field_delimiter", "line_delimiter", "quote", "comment", "escape"),
+    "excel": ("sheet_name",),
+}
+_BOOLEAN_OPTIONS = {
+    "text": (
+        "skip_first_line",
+        "extract_header",
+        "trim_header",
+        "auto_generated_column_names",
+    ),
+    "json": ("pretty_print",),
+    "excel": ("xls", "extract_header", "has_merged_cells"),
+}
+
+
+def format_clause_from_node(config: Optional[Mapping[str, Any]]) -> Optional[str]:
+    """Builds the table() format options for a node config or source external."""
+    if not config:
+        return None
+    options = []
+    format = config.get("format")
+    if isinstance(format, str) and format in _NODE_FORMATS:
+        options.append(f"type=>'{format}'")
+    for key in _STRING_OPTIONS.get(format, ()):
+        value = config.get(key)
+        if isinstance(value, str):
+            options.append(f"{_FORMAT_KEY_MAP.get(key, key)}=>'{value}'")
+    for key in _BOOLEAN_OPTIONS.get(format, ()):
+        value = config.get(key)
+        if isinstance(value, bool):
+            options.append(f"{_FORMAT_KEY_MAP.get(key, key)}=>{value}")
+    return ", ".join(options) if options else None
+
+
+@dataclass(frozen=True)
+class IndexedNode:
+    node: Mapping[str, Any]
+    format: Optional[str] = None
+    format_clause: Optional[str] = None
+
+
+class DremioNodeIndex:
+    """Name lookups over the flat graph used by the ref() and source() overrides.
+
+    The graph is scanned once; the format of each node is resolved the first
+    time it is looked up and reused afterwards.
+    """
+
+    def __init__(self, graph: Mapping[str, Any]):
+        self.graph = graph
+        self._models: Dict[str, Mapping[str, Any]] = {}
+        self._sources: Dict[Tuple[str, str], Mapping[str, Any]] = {}
+        self._resolved: Dict[str, IndexedNode] = {}
+
+        # the first node with a given name wins, as with the linear scan
+        for node in graph.get("nodes", {}).values():
+            self._models.setdefault(node["name"], node)
+        for source in graph.get("sources", {}).values():
+            self._sources.setdefault((source["source_name"], source["name"]), source)
+
+    def get_model(self, model_name: str) -> Optional[IndexedNode]:
+        node = self._models.get(model_name)
+        if node is None:
+            return None
+        return self._resolve(node, self._model_format)
+
+    def get_source(self, source_name: str, table_name: str) -> Optional[IndexedNode]:
+        source = self._sources.get((source_name, table_name))
+        if source is None:
+            return None
+        return self._resolve(source, self._source_format)
+
+    def _resolve(self, node, get_format) -> IndexedNode:
+        unique_id = node["unique_id"]
+        indexed = self._resolved.get(unique_id)
+        if indexed is None:
+            format, format_config = get_format(node)
+            indexed = IndexedNode(
+                node=node,
+                format=format,
+                format_clause=(
+                    format_clause_from_node(format_config)
+                    if format is not None
+                    else None
+                ),
+            )
+            self._resolved[unique_id] = indexed
+        return indexed
+
+    @staticmethod
+    def _model_format(node):
+        config = node.get("config") or {}
+        if config.get("materialized") in ("view", "reflection"):
+            return None, config
+        return config.get("format"), config
+
+    @staticmethod
+    def _source_format(source):
+        external = source.get("external") or {}
+        return external.get("format"), external
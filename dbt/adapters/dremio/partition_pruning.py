@@ -0,0 +1,180 @@
+# Copyright (C) 2022 Dremio Corporation
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any, List, Optional
+
+from dbt.adapters.dremio.seed import seed_literal
+
+# year(ts), bucket(16, id), truncate(3, name), identity(c) or a bare column
+_PARTITION_TRANSFORM = re.compile(
+    r"^\s*(\w+)\s*\(\s*(?:\d+\s*,\s*)?(.+?)\s*\)\s*$", re.IGNORECASE
+)
+_TEMPORAL_TRANSFORMS = ("year", "month", "day", "hour")
+DEST_ALIAS = "DBT_INTERNAL_DEST"
+SOURCE_ALIAS = "DBT_INTERNAL_SOURCE"
+# past this many partitions the batch's partitions are matched with one
+# subquery, instead of a predicate per partition
+MAX_PARTITION_MATCH_TERMS = 100
+
+
+@dataclass(frozen=True)
+class PartitionField:
+    column: str
+    transform: str
+
+    @property
+    def column_key(self) -> str:
+        return self.column.replace('"', "").lower()
+
+
+def parse_partition_field(expression: str) -> Optional[PartitionField]:
+    """Parses a partition_by entry. Returns None for transforms whose
+    partitions cannot be selected by a range of the column, such as bucket."""
+    match = _PARTITION_TRANSFORM.match(expression)
+    if match is None:
+        return PartitionField(expression.strip(), "identity")
+    transform = match.group(1).lower()
+    if transform == "identity" or transform in _TEMPORAL_TRANSFORMS:
+        return PartitionField(match.group(2), transform)
+    return None
+
+
+def _truncate(value, transform: str):
+    if transform == "year":
+        value = value.replace(month=1, day=1)
+    elif transform == "month":
+        value = value.replace(day=1)
+    if isinstance(value, datetime):
+        if transform == "hour":
+            return value.replace(minute=0, second=0, microsecond=0)
+        return value.replace(hour=0, minute=0, second=0, microsecond=0)
+    return value
+
+
+def _next_partition(value, transform: str):
+    # value is the start of a partition
+    if transform == "year":
+        return value.replace(year=value.year + 1)
+    if transform == "month":
+        if value.month == 12:
+            return value.replace(year=value.year + 1, month=1)
+        return value.replace(month=value.month + 1)
+    if transform == "hour":
+        return value + timedelta(hours=1)
+    return value + timedelta(days=1)
+
+
+def partition_predicate(
+    field: PartitionField,
+    data_type: str,
+    min_value: Any,
+    max_value: Any,
+    has_nulls: bool,
+) -> Optional[str]:
+    """Builds a predicate on the merge destination that selects every partition
+    of field holding a value between min_value and max_value."""
+    column = f"{DEST_ALIAS}.{field.column}"
+    predicates = []
+    if min_value is not None and max_value is not None:
+        if field.transform == "identity":
+            lower, upper = min_value, max_value
+            predicates.append(
+                f"{column} >= {seed_literal(lower, data_type)}"
+                f" and {column} <= {seed_literal(upper, data_type)}"
+            )
+        elif isinstance(min_value, (date, datetime)):
+            lower = _truncate(min_value, field.transform)
+            upper = _next_partition(
+                _truncate(max_value, field.transform), field.transform
+            )
+            predicates.append(
+                f"{column} >= {seed_literal(lower, data_type)}"
+                f" and {column} < {seed_literal(upper, data_type)}"
+            )
+        else:
+            return None
+    if has_nulls:
+        predicates.append(f"{column} is null")
+    if not predicates:
+        # the batch is empty
+        return "FALSE"
+    return " or ".join(f"({predicate})" for predicate in predicates)
+
+
+def partition_bounds_sql(relation: str, fields: List[PartitionField]) -> str:
+    selects = []
+    for field in fields:
+        selects.extend(
+            [
+                f"min({field.column})",
+                f"max({field.column})",
+                f"count(*) - count({field.column})",
+            ]
+        )
+    return f"select {', '.join(selects)} from {relation}"
+
+
+def _partition_start_sql(field: PartitionField, alias: Optional[str] = None) -> str:
+    column = field.column if alias is None else f"{alias}.{field.column}"
+    if field.transform == "identity":
+        return column
+    return f"date_trunc('{field.transform.upper()}', {column})"
+
+
+def partition_values_sql(
+    relation: str, fields: List[PartitionField], limit: Optional[int] = None
+) -> str:
+    starts = ", ".join(_partition_start_sql(field) for field in fields)
+    sql = f"select distinct {starts} from {relation}"
+    if limit is not None:
+        sql += f" limit {limit}"
+    return sql
+
+
+def partition_exists_predicate(fields: List[PartitionField], relation: str) -> str:
+    """Builds a predicate on the destination that matches every partition a
+    row of relation falls in, with one subquery for any number of partitions."""
+    matches = " and ".join(
+        f"{_partition_start_sql(field, SOURCE_ALIAS)}"
+        f" is not distinct from {_partition_start_sql(field, DEST_ALIAS)}"
+        for field in fields
+    )
+    return f"exists (select 1 from {relation} as {SOURCE_ALIAS} where {matches})"
+
+
+def partition_match_predicate(
+    fields: List[PartitionField], data_types: List[str], values: List[Any]
+) -> str:
+    """Builds a predicate on the destination that matches exactly the partition
+    whose fields start at values."""
+    predicates = []
+    for field, data_type, value in zip(fields, data_types, values):
+        column = f"{DEST_ALIAS}.{field.column}"
+        if value is None:
+            predicates.append(f"{column} is null")
+        elif field.transform == "identity":
+            predicates.append(f"{column} = {seed_literal(value, data_type)}")
+        else:
+            lower = _truncate(value, field.transform)
+            if isinstance(lower, datetime) and data_type.lower().startswith("date"):
+                lower = lower.date()
+            upper = _next_partition(lower, field.transform)
+            predicates.append(
+                f"{column} >= {seed_literal(lower, data_type)}"
+                f" and {column} < {seed_literal(upper, data_type)}"
+            )
+    return " and ".join(predicates)
@@ -0,0 +1,204 @@
+# Copyright (C) 2022 Dremio Corporation
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import json
+import threading
+import weakref
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import agate
+
+try:
+    import pyarrow
+except ImportError:  # pragma: no cover - pyarrow is an optional dependency
+    pyarrow = None
+
+_TEXT_TYPES = ("varchar", "char", "character varying", "string", "text")
+_NUMERIC_TYPES = (
+    "tinyint",
+    "smallint",
+    "int",
+    "integer",
+    "bigint",
+    "decimal",
+    "numeric",
+    "float",
+    "double",
+)
+
+_FINGERPRINT_CHUNK_SIZE = 1024 * 1024
+# seed configs that change the table built from the same CSV
+_FINGERPRINT_CONFIG_KEYS = ("column_types", "quote_columns", "delimiter", "format")
+
+# integers with more digits may not fit in a bigint
+_BIGINT_MAX_DIGITS = 18
+_DECIMAL_MAX_PRECISION = 38
+
+# inferred types of every number column, per seed table
+_number_types = weakref.WeakKeyDictionary()
+_number_types_lock = threading.Lock()
+
+
+def _quote(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def seed_literal(value: Any, data_type: str) -> str:
+    """Renders a seed value as a SQL literal of the column's type."""
+    if value is None:
+        return f"cast(null as {data_type})"
+    base_type = data_type.split("(")[0].strip().lower()
+    if base_type in _TEXT_TYPES:
+        return _quote(str(value))
+    # bool is checked first, it is also an int
+    if isinstance(value, bool):
+        if base_type == "boolean":
+            return "TRUE" if value else "FALSE"
+    elif isinstance(value, (int, float, Decimal)):
+        if base_type in _NUMERIC_TYPES:
+            return format(value, "f") if isinstance(value, Decimal) else str(value)
+    elif isinstance(value, datetime):
+        if base_type == "timestamp":
+            timestamp = value.replace(tzinfo=None).isoformat(
+                sep=" ", timespec="milliseconds"
+            )
+            return f"TIMESTAMP '{timestamp}'"
+    elif isinstance(value, date):
+        if base_type == "date":
+            return f"DATE '{value.isoformat()}'"
+    return f"cast({_quote(str(value))} as {data_type})"
+
+
+def insert_values_sql(
+    relation: str,
+    column_names: Sequence[str],
+    column_types: Sequence[str],
+    rows: Sequence[Sequence[Any]],
+) -> str:
+    values = ",\n".join(
+        "("
+        + ", ".join(
+            seed_literal(value, data_type)
+            for value, data_type in zip(row, column_types)
+        )
+        + ")"
+        for row in rows
+    )
+    return f"insert into {relation} ({', '.join(column_names)})\nvalues\n{values}"
+
+
+def insert_batches(
+    relation: str,
+    column_names: Sequence[str],
+    column_types: Sequence[str],
+    rows: Sequence[Sequence[Any]],
+    batch_size: int,
+) -> Iterator[str]:
+    """Yields one INSERT statement per batch_size rows, rendered lazily."""
+    for start in range(0, len(rows), batch_size):
+        yield insert_values_sql(
+            relation, column_names, column_types, rows[start : start + batch_size]
+        )
+
+
+def seed_fingerprint(path: str, config: Dict[str, Any]) -> str:
+    """Hashes the CSV file together with the config that shapes its table."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as csv_file:
+        for chunk in iter(lambda: csv_file.read(_FINGERPRINT_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    table_config = {key: config.get(key) for key in _FINGERPRINT_CONFIG_KEYS}
+    digest.update(json.dumps(table_config, sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _precision_and_scale(values: Sequence[Decimal]):
+    # digits before and after the point needed to hold every value
+    if pyarrow is not None:
+        decimal_type = pyarrow.array(values).type
+        if pyarrow.types.is_decimal(decimal_type):
+            return decimal_type.precision - decimal_type.scale, decimal_type.scale
+    integer_digits = scale = 0
+    for value in values:
+        if value is None:
+            continue
+        _, digits, exponent = value.as_tuple()
+        if not isinstance(exponent, int):
+            # NaN and infinity are not inferred as numbers
+            continue
+        integer_digits = max(integer_digits, len(digits) + exponent)
+        scale = max(scale, -exponent)
+    return integer_digits, scale
+
+
+def _number_type(values: Sequence[Decimal]) -> str:
+    integer_digits, scale = _precision_and_scale(values)
+    if scale == 0 and integer_digits <= _BIGINT_MAX_DIGITS:
+        return "bigint"
+    precision = max(integer_digits, 0) + scale
+    if precision > _DECIMAL_MAX_PRECISION:
+        return "double"
+    return f"decimal({precision},{scale})"
+
+
+def number_column_types(agate_table: agate.Table) -> List[Optional[str]]:
+    """Infers the Dremio type of every number column of the seed in one pass
+    over its columns, bigint for whole numbers and decimal(p,s) otherwise.
+    Other columns are None."""
+    with _number_types_lock:
+        column_types = _number_types.get(agate_table)
+    if column_types is None:
+        column_types = [
+            _number_type(column.values_without_nulls())
+            if isinstance(column.data_type, agate.Number)
+            else None
+            for column in agate_table.columns
+        ]
+        with _number_types_lock:
+            _number_types[agate_table] = column_types
+    return column_types
+
+
+def _decimal_precision_and_scale(column):
+    return int(column.numeric_precision or 0), int(column.numeric_scale or 0)
+
+
+def seed_column_changes(staged_columns, existing_columns) -> Optional[Dict[str, str]]:
+    """Compares the columns of a seed's staging table with those of its table.
+    Returns the widened type of every decimal column of the table that is too
+    narrow for the staged rows, or None when the table has to be rebuilt
+    because a column was added, removed or changed its base type."""
+    existing_by_name = {column.name.lower(): column for column in existing_columns}
+    staged_names = [column.name.lower() for column in staged_columns]
+    if sorted(existing_by_name) != sorted(staged_names):
+        return None
+    changes = {}
+    for staged in staged_columns:
+        existing = existing_by_name[staged.name.lower()]
+        if staged.dtype.lower() != existing.dtype.lower():
+            return None
+        if existing.dtype.lower() not in ("decimal", "numeric"):
+            continue
+        staged_precision, staged_scale = _decimal_precision_and_scale(staged)
+        precision, scale = _decimal_precision_and_scale(existing)
+        integer_digits = max(staged_precision - staged_scale, precision - scale)
+        if staged_scale > scale or integer_digits + scale > _DECIMAL_MAX_PRECISION:
+            # Iceberg widens the precision of a decimal but never its scale
+            return None
+        if integer_digits + scale > precision:
+            changes[existing.name] = f"decimal({integer_digits + scale},{scale})"
+    return changes
@@ -0,0 +1,161 @@
+# Copyright (C) 2022 Dremio Corporation
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+import uuid
+from abc import abstractmethod
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Sequence
+
+try:
+    import pyarrow
+    import pyarrow.fs as pyarrow_fs
+    import pyarrow.parquet as parquet
+except ImportError:  # pragma: no cover - pyarrow is an optional dependency
+    pyarrow = None
+    pyarrow_fs = None
+    parquet = None
+
+_INTEGER_TYPES = ("tinyint", "smallint", "int", "integer", "bigint")
+_FLOAT_TYPES = ("float", "double")
+_DECIMAL_TYPE = re.compile(
+    r"^\s*(?:decimal|numeric)\s*(?:\(\s*(\d+)\s*(?:,\s*(\d+)\s*)?\))?\s*$", re.I
+)
+
+
+def _require_pyarrow():
+    if pyarrow is None:
+        raise Exception(
+            "Loading seeds through COPY INTO requires pyarrow. "
+            "Install it with: pip install dbt-dremio[parquet]"
+        )
+
+
+def _decimal_type(data_type: str, values: Sequence[Any]):
+    precision, scale = _DECIMAL_TYPE.match(data_type).groups()
+    if scale is None:
+        # an unsized decimal keeps the largest scale found in the seed
+        scale = max(
+            (
+                -value.as_tuple().exponent
+                for value in values
+                if isinstance(value, Decimal) and value.as_tuple().exponent < 0
+            ),
+            default=0,
+        )
+    return pyarrow.decimal128(int(precision or 38), int(scale))
+
+
+def arrow_type(data_type: str, values: Sequence[Any]):
+    """Maps a seed column type to the Arrow type its Parquet column is written as.
+
+    COPY INTO coerces the file columns to the table's types, so the Arrow type
+    only has to represent the values faithfully.
+    """
+    base_type = data_type.split("(")[0].strip().lower()
+    if base_type in _INTEGER_TYPES:
+        return pyarrow.int64()
+    if base_type in _FLOAT_TYPES:
+        return pyarrow.float64()
+    if _DECIMAL_TYPE.match(data_type):
+        return _decimal_type(data_type, values)
+    if base_type == "boolean":
+        return pyarrow.bool_()
+    if base_type == "date":
+        return pyarrow.date32()
+    if base_type == "timestamp":
+        return pyarrow.timestamp("ms")
+    return pyarrow.string()
+
+
+def _arrow_value(value: Any, target_type):
+    if value is None:
+        return None
+    if pyarrow.types.is_string(target_type):
+        return str(value)
+    if pyarrow.types.is_integer(target_type):
+        return int(value)
+    if pyarrow.types.is_floating(target_type):
+        return float(value)
+    if isinstance(value, datetime):
+        return value.replace(tzinfo=None)
+    return value
+
+
+def to_arrow_table(
+    column_names: Sequence[str],
+    column_types: Sequence[str],
+    rows: Sequence[Sequence[Any]],
+):
+    _require_pyarrow()
+    arrays = []
+    for index, data_type in enumerate(column_types):
+        values = [row[index] for row in rows]
+        target_type = arrow_type(data_type, values)
+        arrays.append(
+            pyarrow.array(
+                [_arrow_value(value, target_type) for value in values],
+                type=target_type,
+            )
+        )
+    return pyarrow.Table.from_arrays(arrays, names=list(column_names))
+
+
+class SeedStagingWriter:
+    """Writes seed files to a location that Dremio can read them from."""
+
+    @classmethod
+    def build(cls, staging_path: str):
+        return PyArrowFileSystemStagingWriter(staging_path)
+
+    @abstractmethod
+    def write(self, file_name: str, table) -> None:
+        pass
+
+    @abstractmethod
+    def remove(self, file_name: str) -> None:
+        pass
+
+    @staticmethod
+    def new_file_name(prefix: str) -> str:
+        return f"{prefix}_{uuid.uuid4().hex}.parquet"
+
+
+class PyArrowFileSystemStagingWriter(SeedStagingWriter):
+    """Writes Parquet files to a local directory or an object store URI
+    (s3://, gs://, abfs://), through pyarrow's filesystems."""
+
+    def __init__(self, staging_path: str):
+        _require_pyarrow()
+        self._filesystem, self._directory = pyarrow_fs.FileSystem.from_uri(staging_path)
+        self._directory = self._directory.rstrip("/")
+
+    def write(self, file_name: str, table) -> None:
+        self._filesystem.create_dir(self._directory, recursive=True)
+        parquet.write_table(
+            table, f"{self._directory}/{file_name}", filesystem=self._filesystem
+        )
+
+    def remove(self, file_name: str) -> None:
+        self._filesystem.delete_file(f"{self._directory}/{file_name}")
+
+
+def copy_into_sql(relation: str, location: str, file_name: str) -> str:
+    return (
+        f"copy into {relation}\n"
+        f"from '{location}'\n"
+        f"files ('{file_name}')\n"
+        f"file_format 'parquet'"
+    )
@@ -13,6 +13,12 @@ See the License for the specific language governing permissions and
 limitations under the License.*/
 
 {% macro dremio__get_columns_in_relation(relation) -%}
+  {%- if target.metadata_source == 'catalog_api' -%}
+    {%- set columns = adapter.get_columns_from_catalog(relation) -%}
+    {%- if columns is not none -%}
+      {{ return(columns) }}
+    {%- endif -%}
+  {%- endif -%}
 
   {%- set database = relation.database.strip('"') -%}
   {%- set schema = relation.schema.strip('"') -%}
@@ -41,6 +47,36 @@ limitations under the License.*/
 
 {% endmacro %}
 
+{% macro dremio__get_columns_in_relations(relations) -%}
+  {#- columns of many relations in one job, used to warm the adapter's column cache -#}
+  {% call statement('get_columns_in_relations', fetch_result=True) %}
+    select table_schema
+        ,table_name
+        ,column_name as column_name
+        ,lower(data_type) as data_type
+        ,character_maximum_length
+        ,numeric_precision
+        ,numeric_scale
+    from information_schema.columns
+    where
+    {%- for relation in relations %}
+      {%- set database = relation.database.strip('"') -%}
+      {%- set schema = relation.schema.strip('"') -%}
+      {%- set identifier = relation.identifier.strip('"') -%}
+      {%- set schema_name = database
+            + (('.' + schema) if schema != 'no_schema' else '') %}
+      {% if not loop.first %}or {% endif -%}
+      {%- if var('dremio:exact_search_enabled', default=false) -%}
+        (table_schema = '{{ schema_name }}' and table_name = '{{ identifier }}')
+      {%- else -%}
+        (ilike(table_schema, '{{ schema_name }}') and ilike(table_name, '{{ identifier }}'))
+      {%- endif -%}
+    {%- endfor %}
+    order by table_schema, table_name, ordinal_position
+  {% endcall %}
+  {{ return(load_result('get_columns_in_relations').table) }}
+{% endmacro %}
+
 {% macro dremio__alter_column_type(relation, column_name, new_column_type) -%}
 
   {% call statement('alter_column_type') %}
@@ -84,60 +84,7 @@ for 'excel' :
 {%- endmacro -%}
 
 {%- macro format_clause_from_node(config) -%}
-{%- set key_map = {'format':'type'
-  ,'field_delimiter':'fieldDelimiter'
-  ,'line_delimiter':'lineDelimiter'
-  ,'skip_first_line':'skipFirstLine'
-  ,'extract_header':'extractHeader'
-  ,'trim_header':'trimHeader'
-  ,'auto_generated_column_names':'autoGenerateColumnNames'
-  ,'pretty_print':'prettyPrint'
-  ,'sheet_name':'sheetName'
-  ,'has_merged_cells':'hasMergedCells'} -%}
-  {%- set options = [] -%}
-  {%- set format = config['format'] -%}
-  {%- if format is defined and format is string and format in ['text', 'json', 'arrow', 'parquet', 'avro', 'excel', 'delta'] -%}
-    {%- do options.append("type=>'" ~ format ~ "'") -%}
-  {%- endif -%}
-  {%- if format == 'text' -%}
-    {%- for key in ['field_delimiter', 'line_delimiter', 'quote', 'comment', 'escape'] -%}
-      {%- set value = config[key] -%}
-      {%- if value is defined and value is string -%}
-        {%- set key = key_map[key] or key -%}
-        {%- do options.append(key ~ "=>'" ~ value ~ "'") -%}
-      {%- endif -%}
-    {%- endfor -%}
-    {%- for key in ['skip_first_line', 'extract_header', 'trim_header', 'auto_generated_column_names'] -%}
-      {%- set value = config[key] -%}
-      {%- if value is defined and value is boolean -%}
-        {%- set key = key_map[key] or key -%}
-        {%- do options.append(key ~ "=>" ~ value) -%}
-      {%- endif -%}
-    {%- endfor -%}
-  {%- elif format == 'json' -%}
-    {%- set key = 'pretty_print' -%}
-    {%- set value = config[key] -%}
-    {%- if value is defined and value is boolean -%}
-      {%- set key = key_map[key] or key -%}
-      {%- do options.append(key ~ "=>" ~ value) -%}
-    {%- endif -%}
-  {%- elif format == 'excel' -%}
-    {%- for key in ['sheet_name'] -%}
-      {%- set value = config[key] -%}
-      {%- if value is defined and value is string -%}
-        {%- set key = key_map[key] or key -%}
-        {%- do options.append(key ~ "=>'" ~ value ~ "'") -%}
-      {%- endif -%}
-    {%- endfor -%}
-    {%- for key in ['xls', 'extract_header', 'has_merged_cells'] -%}
-      {%- set value = config[key] -%}
-      {%- if value is defined and value is boolean -%}
-        {%- set key = key_map[key] or key -%}
-        {%- do options.append(key ~ "=>" ~ value) -%}
-      {%- endif -%}
-    {%- endfor -%}
-  {%- endif -%}
-  {{ return((options | join(', ')) if options | length > 0 else none) }}
+  {{ return(adapter.format_clause_from_node(config)) }}
 {%- endmacro -%}
 
 {% macro render_with_format_clause(target_table) %}
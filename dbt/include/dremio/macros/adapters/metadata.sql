@@ -208,6 +208,12 @@ limitations under the License.*/
 {%- endmacro %}
 
 {% macro dremio__list_schemas(database) -%}
+  {%- if target.metadata_source == 'catalog_api' -%}
+    {%- set schemas = adapter.list_schemas_from_catalog(database) -%}
+    {%- if schemas is not none -%}
+      {{ return(schemas) }}
+    {%- endif -%}
+  {%- endif -%}
   {%- set schema_name_like = database.strip('"') + '.%' -%}
   {% set sql %}
     select substring(schema_name, position('.' in schema_name) + 1)
@@ -220,6 +226,12 @@ limitations under the License.*/
 {% endmacro %}
 
 {% macro dremio__check_schema_exists(information_schema, schema) -%}
+  {%- if target.metadata_source == 'catalog_api' -%}
+    {%- set exists = adapter.check_schema_exists_in_catalog(information_schema.database, schema) -%}
+    {%- if exists is not none -%}
+      {{ return([[1 if exists else 0]]) }}
+    {%- endif -%}
+  {%- endif -%}
   {%- set schema_name = information_schema.database.strip('"')
         + (('.' + schema) if schema != 'no_schema' else '') -%}
   {% set sql -%}
@@ -235,6 +247,12 @@ limitations under the License.*/
 {% endmacro %}
 
 {% macro dremio__list_relations_without_caching(schema_relation) %}
+  {%- if target.metadata_source == 'catalog_api' and not var('dremio:reflections_metadata_enabled', default=false) -%}
+    {%- set relations = adapter.list_relations_from_catalog(schema_relation.database, [schema_relation.schema]) -%}
+    {%- if relations is not none -%}
+      {{ return(relations) }}
+    {%- endif -%}
+  {%- endif -%}
   {%- set database = schema_relation.database.strip('"') -%}
   {%- set schema = schema_relation.schema.strip('"') -%}
   {%- set schema_name = database
@@ -310,6 +328,98 @@ limitations under the License.*/
   {{ return(t) }}
 {% endmacro %}
 
+{% macro dremio__list_relations_in_schemas(database, schemas) %}
+  {#- lists the relations of many schemas of one database in a single job -#}
+  {%- if target.metadata_source == 'catalog_api' and not var('dremio:reflections_metadata_enabled', default=false) -%}
+    {%- set relations = adapter.list_relations_from_catalog(database, schemas) -%}
+    {%- if relations is not none -%}
+      {{ return(relations) }}
+    {%- endif -%}
+  {%- endif -%}
+  {%- set database = database.strip('"') -%}
+  {%- set schema_names = [] -%}
+  {%- for schema in schemas -%}
+    {%- set schema = schema.strip('"') -%}
+    {%- do schema_names.append(database + (('.' + schema) if schema != 'no_schema' else '')) -%}
+  {%- endfor -%}
+  {% call statement('list_relations_in_schemas', fetch_result=True) -%}
+
+    {%- if var('dremio:reflections_metadata_enabled', default=false) -%}
+
+      with cte1 as (
+        select
+          dataset_name
+          ,reflection_name
+          ,type
+          ,case when substr(dataset_name, 1, 1) = '"'
+          then strpos(dataset_name, '".') + 1
+          else strpos(dataset_name, '.')
+          end as first_dot
+          ,length(dataset_name) -
+          case when substr(dataset_name, length(dataset_name)) = '"'
+          then strpos(reverse(dataset_name), '".')
+          else strpos(reverse(dataset_name), '.') - 1
+          end as last_dot
+          ,length(dataset_name) as length
+        {%- if target.cloud_host and not target.software_host %}
+          from sys.project.reflections
+        {%- elif target.software_host and not target.cloud_host %}
+          from sys.reflections
+        {%- endif %}
+      )
+      , cte2 as (
+        select
+          replace(substr(dataset_name, 1, first_dot - 1), '"', '') as table_catalog
+          ,reflection_name as table_name
+          ,replace(case when first_dot < last_dot
+          then substr(dataset_name, first_dot + 1, last_dot - first_dot - 1)
+          else 'no_schema' end, '"', '') as table_schema
+          ,'materialized_view' as table_type
+        from cte1
+      )
+      select table_catalog, table_name, table_schema, table_type
+      from cte2
+      where ilike(table_catalog, '{{ database }}')
+        and {{ dremio__table_schema_in('table_schema', schema_names) }}
+
+      union all
+
+    {%- endif %}
+
+      select (case when position('.' in table_schema) > 0
+              then substring(table_schema, 1, position('.' in table_schema) - 1)
+              else table_schema
+          end) as table_catalog
+          ,table_name
+          ,(case when position('.' in table_schema) > 0
+              then substring(table_schema, position('.' in table_schema) + 1)
+              else 'no_schema'
+          end) as table_schema
+          ,lower(table_type) as table_type
+      from information_schema."tables"
+      where {{ dremio__table_schema_in('table_schema', schema_names) }}
+      and table_type <> 'system_table'
+
+  {% endcall %}
+  {{ return(load_result('list_relations_in_schemas').table) }}
+{% endmacro %}
+
+{% macro dremio__table_schema_in(column, schema_names) -%}
+  {%- if var('dremio:exact_search_enabled', default=false) -%}
+    {{ column }} in (
+      {%- for schema_name in schema_names -%}
+        '{{ schema_name }}'{% if not loop.last %}, {% endif %}
+      {%- endfor -%}
+    )
+  {%- else -%}
+    (
+      {%- for schema_name in schema_names -%}
+        ilike({{ column }}, '{{ schema_name }}'){% if not loop.last %} or {% endif %}
+      {%- endfor -%}
+    )
+  {%- endif -%}
+{%- endmacro %}
+
 {% macro dremio__get_relation_last_modified(information_schema, relations) -%}
   {% set relation = relations[0] %}
   {%- if relation.type != 'view' -%}
@@ -26,6 +26,12 @@ limitations under the License.*/
   {%- endcall %}
 {% endmacro %}
 
+{% macro dremio__alter_table_rename(from_relation, to_relation) -%}
+  {% call statement('alter_table_rename') -%}
+    alter table {{ from_relation }} rename to {{ to_relation }}
+  {%- endcall %}
+{% endmacro %}
+
 {% macro dremio__rename_relation(from_relation, to_relation) -%}
   {% call statement('rename_relation1/2 - create to_relation from from_relation') -%}
     {{ get_create_table_as_sql(temporary=False, relation=to_relation, sql="select * from " ~ from_relation)}}
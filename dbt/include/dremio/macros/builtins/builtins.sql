@@ -15,15 +15,12 @@ limitations under the License.*/
 {%- macro ref(model_name, v=None) -%}
   {%- set relation = builtins.ref(model_name, v=v) -%}
   {%- if execute and graph -%}
-    {%- set model = graph.nodes.values() | selectattr("name", "equalto", model_name) | list | first -%}
-    {%- if model.config.materialized == 'reflection' -%}
+    {%- set model = adapter.get_ref_node(graph, model_name) -%}
+    {%- if model.node.config.materialized == 'reflection' -%}
       {% do exceptions.CompilationError("Reflections cannot be ref()erenced (" ~ relation ~ ")") %}
     {%- endif -%}
-    {%- set format = model.config.format if
-      model.config.materialized not in ['view', 'reflection']
-      and model.config.format is defined
-      else none -%}
-    {%- set format_clause = format_clause_from_node(model.config) if format is not none else none -%}
+    {%- set format = model.format -%}
+    {%- set format_clause = model.format_clause -%}
     {%- set relation2 = api.Relation.create(database=relation.database, schema=relation.schema, identifier=relation.identifier, format=format, format_clause=format_clause, limit=relation.limit, event_time_filter=relation.event_time_filter) -%}
       {{ return (relation2) }}
   {%- else -%}
@@ -34,12 +31,9 @@ limitations under the License.*/
 {%- macro source(source_name, table_name) -%}
   {%- set relation = builtins.source(source_name, table_name) -%}
   {%- if execute -%}
-    {%- set source = graph.sources.values() | selectattr("source_name", "equalto", source_name) | selectattr("name", "equalto", table_name) | list | first -%}
-    {%- set format = source.external.format if
-      source.external is defined
-      and source.external.format is defined
-      else none -%}
-    {%- set format_clause = format_clause_from_node(source.external) if format is not none else none -%}
+    {%- set source = adapter.get_source_node(graph, source_name, table_name) -%}
+    {%- set format = source.format -%}
+    {%- set format_clause = source.format_clause -%}
     {%- set relation2 = api.Relation.create(database=relation.database, schema=relation.schema, identifier=relation.identifier, format=format, format_clause=format_clause, limit=relation.limit, event_time_filter=relation.event_time_filter) -%}
       {{ return (relation2) }}
   {%- else -%}
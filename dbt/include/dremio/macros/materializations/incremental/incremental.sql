@@ -45,6 +45,8 @@ limitations under the License.*/
   {{ run_hooks(pre_hooks, inside_transaction=True) }}
 
   {% set to_drop = [] %}
+  {% set overwrite = false %}
+  {% set delete_sql = none %}
 
   {% if existing_relation is none %}
     {% set build_sql = get_create_table_as_sql(False, target_relation, external_query(sql)) %}
@@ -52,32 +54,70 @@ limitations under the License.*/
     {% set build_sql = get_create_table_as_sql(False, intermediate_relation, external_query(sql)) %}
     {% set need_swap = true %}
   {% else %}
-    {% call statement('temp') -%}
-       {{ create_table_as(True, temp_relation, external_query(sql)) }}
-    {%- endcall %}
-    {% do to_drop.append(temp_relation) %}
-    {% do adapter.expand_target_column_types(
-             from_relation=temp_relation,
-             to_relation=target_relation) %}
-    -- Process schema changes. Returns dict of changes if successful. Use source columns for upserting/merging
-    {% set dest_columns = process_schema_changes(on_schema_change, temp_relation, existing_relation) %}
-    {% if not dest_columns %}
-      {% set dest_columns = dremio__get_columns_in_relation(existing_relation) %}
-    {% endif %}
-
     -- Get the incremental_strategy, the macro to use for the strategy, and build the sql
     {%- set incremental_strategy = config.get('incremental_strategy', validator=validation.any[basestring]) or 'append' -%}
     {%- set raw_file_format = config.get('format', validator=validation.any[basestring]) or 'iceberg' -%}
     {%- set file_format = dbt_dremio_validate_get_file_format(raw_file_format) -%}
     {%- set incremental_predicates = config.get('predicates', none) or config.get('incremental_predicates', none) -%}
     {%- set strategy = dbt_dremio_validate_get_incremental_strategy(incremental_strategy) -%}
-    {% set build_sql = dbt_dremio_get_incremental_sql(strategy, intermediate_relation, target_relation, dest_columns, unique_key) %}
-    
+    -- appends whose schema cannot change are inserted straight from the model query,
+    -- instead of being written to a temp table first
+    {%- set direct_append = strategy == 'append' and (on_schema_change == 'ignore'
+        or incremental_query_matches_relation(external_query(sql), existing_relation)) -%}
+
+    {% if direct_append %}
+      {% set dest_columns = adapter.get_columns_in_relation(existing_relation) %}
+      {% set build_sql = dremio__get_incremental_append_sql(
+             '(' ~ external_query(sql) ~ ') as dbt_incremental_source', target_relation, dest_columns) %}
+    {% else %}
+      {% call statement('temp') -%}
+         {{ create_table_as(True, temp_relation, external_query(sql)) }}
+      {%- endcall %}
+      {% do to_drop.append(temp_relation) %}
+      -- one metadata query for the columns of both relations, later lookups hit the adapter's column cache
+      {% do adapter.load_columns_in_relations([temp_relation, existing_relation]) %}
+      {% do adapter.expand_target_column_types(
+               from_relation=temp_relation,
+               to_relation=target_relation) %}
+      -- Process schema changes. Returns dict of changes if successful. Use source columns for upserting/merging
+      {% set dest_columns = process_schema_changes(on_schema_change, temp_relation, existing_relation) %}
+      {% if not dest_columns %}
+        {% set dest_columns = adapter.get_columns_in_relation(existing_relation) %}
+      {% endif %}
+
+      -- derive_partition_predicates: the merge only reads the target partitions
+      -- that the staged batch falls in
+      {% if strategy == 'merge' and config.get('derive_partition_predicates') %}
+        {% set incremental_predicates = (incremental_predicates or []) + adapter.get_partition_predicates(
+               temp_relation, existing_relation, config.get('partition_by')) %}
+      {% endif %}
+      {% set build_sql = dbt_dremio_get_incremental_sql(strategy, intermediate_relation, target_relation, dest_columns, unique_key, incremental_predicates) %}
+      -- insert_overwrite: the partitions present in the batch are deleted, then
+      -- the batch is inserted by the main statement
+      {% if strategy == 'insert_overwrite' %}
+        {% set partition_predicate = adapter.get_partition_overwrite_predicate(
+               temp_relation, existing_relation, config.get('partition_by')) %}
+        {% set overwrite = true %}
+        {% if partition_predicate != 'FALSE' %}
+          {% set delete_sql = dremio__get_delete_partitions_sql(target_relation, partition_predicate) %}
+        {% endif %}
+      {% endif %}
+    {% endif %}
+
   {% endif %}
 
-  {%- call statement('main') -%}
-    {{ build_sql }}
-  {%- endcall -%}
+  {%- if overwrite -%}
+    -- the table is rolled back to its snapshot before the delete when the
+    -- batch cannot be inserted
+    {%- set response = adapter.overwrite_partitions(target_relation, delete_sql, build_sql) -%}
+    {%- call noop_statement('main', response | string, 'INSERT', response.rows_affected) -%}
+      {{ build_sql }}
+    {%- endcall -%}
+  {%- else -%}
+    {%- call statement('main') -%}
+      {{ build_sql }}
+    {%- endcall -%}
+  {%- endif -%}
 
   {% if need_swap %}
       {% do adapter.rename_relation(target_relation, backup_relation) %}
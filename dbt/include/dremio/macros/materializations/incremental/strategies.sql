@@ -20,6 +20,19 @@ limitations under the License.*/
 
 {% endmacro %}
 
+{% macro incremental_query_matches_relation(sql, relation) %}
+    {#-- the query's columns are read from a job that returns no rows --#}
+    {%- set query_columns = [] -%}
+    {%- set relation_columns = [] -%}
+    {%- for column in adapter.get_columns_in_query(sql) -%}
+        {%- do query_columns.append((column.name | lower) ~ ' ' ~ (column.data_type | lower)) -%}
+    {%- endfor -%}
+    {%- for column in adapter.get_columns_in_relation(relation) -%}
+        {%- do relation_columns.append((column.name | lower) ~ ' ' ~ (column.data_type | lower)) -%}
+    {%- endfor -%}
+    {{ return(query_columns == relation_columns) }}
+{% endmacro %}
+
 {% macro dremio__get_incremental_merge_sql(target, source, unique_key, dest_columns, incremental_predicates=none) -%}
  {%- set predicates = [] if incremental_predicates is none else [] + incremental_predicates -%}
     {%- set dest_cols_csv = get_quoted_csv(dest_columns | map(attribute="name")) -%}
@@ -70,11 +83,19 @@ limitations under the License.*/
 
 {% endmacro %}
 
-{% macro dbt_dremio_get_incremental_sql(strategy, source, target, dest_columns, unique_key) %}
+{% macro dremio__get_delete_partitions_sql(target, partition_predicate) %}
+    delete from {{ target }} as DBT_INTERNAL_DEST
+    where {{ partition_predicate }}
+{% endmacro %}
+
+{% macro dbt_dremio_get_incremental_sql(strategy, source, target, dest_columns, unique_key, incremental_predicates=none) %}
   {%- if strategy == 'append' -%}
     {{ dremio__get_incremental_append_sql(source, target, dest_columns) }}
   {%- elif strategy == 'merge' -%}
-    {{dremio__get_incremental_merge_sql(target, source, unique_key, dest_columns, incremental_predicates=none)}} 
+    {{dremio__get_incremental_merge_sql(target, source, unique_key, dest_columns, incremental_predicates=incremental_predicates)}} 
+  {%- elif strategy == 'insert_overwrite' -%}
+    {#-- the batch's partitions were deleted from the target beforehand --#}
+    {{ dremio__get_incremental_append_sql(source, target, dest_columns) }}
   {%- else -%}
     {% set no_sql_for_strategy_msg -%}
       No known SQL for the incremental strategy provided: {{ strategy }}
@@ -34,10 +34,10 @@ limitations under the License.*/
 
   {% set invalid_strategy_msg -%}
     Invalid incremental strategy provided: {{ raw_strategy }}
-    Expected one of: 'append, merge'
+    Expected one of: 'append, merge, insert_overwrite'
   {%- endset %}
 
-  {% if raw_strategy not in ['append', 'merge'] %}
+  {% if raw_strategy not in ['append', 'merge', 'insert_overwrite'] %}
     {% do exceptions.CompilationError(invalid_strategy_msg) %}
   {% endif %}
 
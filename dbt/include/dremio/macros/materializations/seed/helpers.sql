@@ -38,3 +38,91 @@ limitations under the License.*/
         {%- if not loop.last%},{%- endif %}
       {% endfor %}) temp_table ( {{ cols_sql }} )
 {% endmacro %}
+
+{% macro seed_column_types(model, agate_table) %}
+{%- set column_override = model['config'].get('column_types', {}) -%}
+{%- set column_types = [] -%}
+{%- for col_name in agate_table.column_names -%}
+  {%- set inferred_type = adapter.convert_type(agate_table, loop.index0) -%}
+  {%- do column_types.append(column_override.get(col_name, inferred_type)) -%}
+{%- endfor -%}
+{{ return(column_types) }}
+{% endmacro %}
+
+{% macro seed_quoted_column_names(model, agate_table) %}
+{%- set quote_seed_column = model['config'].get('quote_columns', None) -%}
+{%- set column_names = [] -%}
+{%- for col_name in agate_table.column_names -%}
+  {%- do column_names.append(adapter.quote_seed_column((col_name | string), quote_seed_column)) -%}
+{%- endfor -%}
+{{ return(column_names) }}
+{% endmacro %}
+
+{% macro select_empty_csv_rows(model, agate_table) %}
+{%- set column_types = seed_column_types(model, agate_table) -%}
+{%- set column_names = seed_quoted_column_names(model, agate_table) -%}
+  select
+    {% for column_name in column_names -%}
+      cast(null as {{ column_types[loop.index0] }}) as {{ column_name }}{%- if not loop.last -%}, {%- endif -%}
+    {% endfor %}
+  limit 0
+{% endmacro %}
+
+{% macro get_seed_key_match(unique_key) %}
+{%- set unique_key = [unique_key] if unique_key is string else unique_key -%}
+{%- set predicates = [] -%}
+{%- for key in unique_key -%}
+  {%- do predicates.append('DBT_INTERNAL_SOURCE.' ~ key ~ ' = DBT_INTERNAL_DEST.' ~ key) -%}
+{%- endfor -%}
+{{ return(predicates | join(' and ')) }}
+{% endmacro %}
+
+{% macro get_seed_merge_sql(target, staging, unique_key, column_names) %}
+{%- set unique_key = [unique_key] if unique_key is string else unique_key -%}
+{%- set key_names = unique_key | map('lower') | list -%}
+{%- set key_match = get_seed_key_match(unique_key) -%}
+{%- set update_columns = [] -%}
+{%- for column_name in column_names -%}
+  {%- if (column_name | replace('"', '') | lower) not in key_names -%}
+    {%- do update_columns.append(column_name) -%}
+  {%- endif -%}
+{%- endfor -%}
+    merge into {{ target }} as DBT_INTERNAL_DEST
+        using (
+            -- only rows that are new or differ from the target are merged
+            select DBT_INTERNAL_SOURCE.*
+            from {{ staging }} as DBT_INTERNAL_SOURCE
+            left join {{ target }} as DBT_INTERNAL_DEST
+                on {{ key_match }}
+            where DBT_INTERNAL_DEST.{{ unique_key[0] }} is null
+            {%- for column_name in update_columns %}
+                or DBT_INTERNAL_SOURCE.{{ column_name }} is distinct from DBT_INTERNAL_DEST.{{ column_name }}
+            {%- endfor %}
+        ) as DBT_INTERNAL_SOURCE
+        on {{ key_match }}
+
+    {% if update_columns %}
+    when matched then update set
+        {% for column_name in update_columns -%}
+            {{ column_name }} = DBT_INTERNAL_SOURCE.{{ column_name }}
+            {%- if not loop.last %}, {%- endif %}
+        {%- endfor %}
+    {% endif %}
+
+    when not matched then insert
+        ({{ column_names | join(', ') }})
+    values
+        ({% for column_name in column_names -%}
+            DBT_INTERNAL_SOURCE.{{ column_name }}
+            {%- if not loop.last %}, {%- endif %}
+        {%- endfor %})
+{% endmacro %}
+
+{% macro get_seed_delete_sql(target, staging, unique_key) %}
+    delete from {{ target }} as DBT_INTERNAL_DEST
+    where not exists (
+        select 1
+        from {{ staging }} as DBT_INTERNAL_SOURCE
+        where {{ get_seed_key_match(unique_key) }}
+    )
+{% endmacro %}
@@ -19,27 +19,100 @@ limitations under the License.*/
   {%- set old_relation = adapter.get_relation(database=database, schema=schema, identifier=identifier) -%}
   {%- set target_relation = this.incorporate(type='table')-%}
   {% set grant_config = config.get('grants') %}
+  -- skip_unchanged: a seed whose CSV and table config hash to the fingerprint
+  -- stored on its table is not reloaded
+  {%- set fingerprint = adapter.seed_fingerprint(model) if config.get('skip_unchanged') else none -%}
+  {%- set unchanged = fingerprint is not none and old_relation is not none and not should_full_refresh()
+      and adapter.get_relation_fingerprint(old_relation) == fingerprint -%}
+  {%- set seed_strategy = config.get('seed_strategy', validator=validation.any[basestring]) or 'replace' -%}
+  {%- set unique_key = config.get('unique_key', validator=validation.any[list, basestring]) -%}
+  {%- if seed_strategy not in ['replace', 'merge'] -%}
+    {% do exceptions.raise_compiler_error("Invalid seed_strategy provided: " ~ seed_strategy ~ ". Expected one of: 'replace, merge'") %}
+  {%- elif seed_strategy == 'merge' and not unique_key -%}
+    {% do exceptions.raise_compiler_error("seed_strategy merge requires a unique_key") %}
+  {%- endif -%}
+  -- seed_strategy merge: the new rows are loaded into a staging table and only
+  -- the differences are applied to the existing table, so it and its
+  -- reflections are kept
+  {%- set merge = seed_strategy == 'merge' and format == 'iceberg' and old_relation is not none
+      and old_relation.is_table and not should_full_refresh() -%}
 
   {{ run_hooks(pre_hooks) }}
 
+  {% if unchanged %}
+    {%- do store_result('agate_table', response='OK') -%}
+    {% call noop_statement('main', 'UNCHANGED', 'UNCHANGED', 0) %}
+      -- {{ target_relation }} is unchanged
+    {% endcall %}
+    {{ run_hooks(post_hooks) }}
+    {{ return({'relations': [target_relation]}) }}
+  {% endif %}
+
   -- setup: if the target relation already exists, drop it
   -- in case if the existing and future table is delta, we want to do a
   -- create or replace table instead of dropping, so we don't have the table unavailable
-  {% if old_relation is not none -%}
-    {{ adapter.drop_relation(old_relation) }}
+  {% if merge -%}
+    {%- set load_relation = make_temp_relation(target_relation, '__dbt_seed_tmp') -%}
+    -- a staging table left behind by a failed run would block the CTAS
+    {{ drop_relation_if_exists(load_cached_relation(load_relation)) }}
+  {%- else -%}
+    {%- set load_relation = target_relation -%}
+    {% if old_relation is not none -%}
+      {{ adapter.drop_relation(old_relation) }}
+    {%- endif %}
   {%- endif %}
 
   {%- set agate_table = load_agate_table() -%}
   {%- do store_result('agate_table', response='OK', agate_table=agate_table) -%}
   {%- set num_rows = (agate_table.rows | length) -%}
-  {%- set sql = select_csv_rows(model, agate_table) -%}
+  {%- set batch_size = config.get('batch_size') or get_batch_size() -%}
+  -- large Iceberg seeds are created empty and filled with concurrent batches
+  -- of inserts, instead of one statement holding every row
+  {%- set batched = format == 'iceberg' and num_rows > batch_size -%}
+  -- load_method copy_into stages the rows as a Parquet file and bulk loads it
+  {%- set copy_into = format == 'iceberg' and config.get('load_method') == 'copy_into' -%}
+  {%- if batched or copy_into -%}
+    {%- set sql = select_empty_csv_rows(model, agate_table) -%}
+  {%- else -%}
+    {%- set sql = select_csv_rows(model, agate_table) -%}
+  {%- endif -%}
 
   -- build model
   {% call statement('effective_main') -%}
-    {{ create_table_as(False, target_relation, sql) }}
+    {{ create_table_as(False, load_relation, sql) }}
   {%- endcall %}
 
-  {% call noop_statement('main', 'CREATE ' ~ num_rows, 'CREATE', num_rows) %}
+  {% if copy_into %}
+    {% do adapter.copy_seed_into(
+        load_relation,
+        agate_table,
+        agate_table.column_names,
+        seed_column_types(model, agate_table)) %}
+  {% elif batched %}
+    {% do adapter.insert_seed_rows(
+        load_relation,
+        agate_table,
+        seed_quoted_column_names(model, agate_table),
+        seed_column_types(model, agate_table),
+        batch_size,
+        config.get('insert_parallelism') or 4) %}
+  {% endif %}
+
+  {% if merge %}
+    -- decimal columns are widened in place when the new rows need more digits
+    {% if adapter.widen_seed_columns(load_relation, old_relation) %}
+      -- the staging table is dropped even when a statement fails
+      {% do adapter.merge_seed_from_staging(load_relation, [
+          get_seed_merge_sql(target_relation, load_relation, unique_key, seed_quoted_column_names(model, agate_table)),
+          get_seed_delete_sql(target_relation, load_relation, unique_key)]) %}
+    {% else %}
+      -- a column was added, removed or changed its type, so the staging table
+      -- replaces the table
+      {% do adapter.rebuild_seed_from_staging(load_relation, target_relation) %}
+    {% endif %}
+  {% endif %}
+
+  {% call noop_statement('main', ('MERGE ' if merge else 'CREATE ') ~ num_rows, 'MERGE' if merge else 'CREATE', num_rows) %}
     {{ sql }}
   {% endcall %}
 
@@ -51,6 +124,10 @@ limitations under the License.*/
 
   {% do apply_grants(target_relation, grant_config, should_revoke=should_revoke) %}
 
+  {% if fingerprint is not none %}
+    {% do adapter.set_relation_fingerprint(target_relation, fingerprint) %}
+  {% endif %}
+
   {{ run_hooks(post_hooks) }}
 
   {{ return({'relations': [target_relation]})}}
@@ -19,8 +19,21 @@ limitations under the License.*/
   {%- set old_relation = adapter.get_relation(database=database, schema=schema, identifier=identifier) -%}
   {%- set target_relation = this.incorporate(type='table') -%}
   {% set grant_config = config.get('grants') %}
+  -- build_cache: a table whose compiled SQL and inputs match the fingerprint
+  -- stored on it is not rebuilt
+  {%- set fingerprint = adapter.build_fingerprint(model, graph, sql) if config.get('build_cache') else none -%}
+  {%- set unchanged = fingerprint is not none and old_relation is not none and old_relation.is_table
+      and not should_full_refresh() and adapter.get_relation_fingerprint(old_relation) == fingerprint -%}
   {{ run_hooks(pre_hooks) }}
 
+  {% if unchanged %}
+    {% call noop_statement('main', 'UNCHANGED', 'UNCHANGED', 0) %}
+      -- {{ target_relation }} is unchanged
+    {% endcall %}
+    {{ run_hooks(post_hooks) }}
+    {{ return({'relations': [target_relation]}) }}
+  {% endif %}
+
   -- setup: if the target relation already exists, drop it
   -- in case if the existing and future table is delta, we want to do a
   -- create or replace table instead of dropping, so we don't have the table unavailable
@@ -41,6 +54,10 @@ limitations under the License.*/
 
   {% do apply_grants(target_relation, grant_config, should_revoke=should_revoke) %}
 
+  {% if fingerprint is not none %}
+    {% do adapter.set_relation_fingerprint(target_relation, fingerprint) %}
+  {% endif %}
+
   {{ run_hooks(post_hooks) }}
 
   {{ return({'relations': [target_relation]})}}
@@ -42,6 +42,10 @@ setup(
         "dbt-adapters>=1.16.1, <2.0",
         "requests>=2.31.0",
     ],
+    extras_require={
+        "flight": ["pyarrow>=14.0.0"],
+        "parquet": ["pyarrow>=14.0.0"],
+    },
     classifiers=[
         "License :: OSI Approved :: Apache Software License",
         "Operating System :: Microsoft :: Windows",
@@ -0,0 +1,100 @@
+# Copyright (C) 2022 Dremio Corporation
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+from dbt.tests.util import run_dbt, write_file
+from tests.utils.util import relation_from_name
+
+initial_seed_csv = """id,name,amount
+1,one,10
+2,two,20
+3,three,30
+""".lstrip()
+
+changed_seed_csv = """id,name,amount
+1,one,10
+2,two,22
+4,four,40
+""".lstrip()
+
+seeds_yml = """
+version: 2
+seeds:
+  - name: merged_seed
+    config:
+      seed_strategy: merge
+      unique_key: id
+"""
+
+
+class TestSeedMergeDremio:
+    @pytest.fixture(scope="class")
+    def seeds(self):
+        return {
+            "merged_seed.csv": initial_seed_csv,
+            "seeds.yml": seeds_yml,
+        }
+
+    def test_seed_merge(self, project):
+        run_dbt(["seed"])
+
+        write_file(changed_seed_csv, project.project_root, "seeds", "merged_seed.csv")
+        results = run_dbt(["seed"])
+
+        assert results[0].adapter_response["_message"].startswith("MERGE")
+        relation = relation_from_name(project.adapter, "merged_seed")
+        rows = project.run_sql(
+            f"select id, name, amount from {relation} order by id", fetch="all"
+        )
+        assert [tuple(row) for row in rows] == [
+            (1, "one", 10),
+            (2, "two", 22),
+            (4, "four", 40),
+        ]
+
+
+initial_decimal_seed_csv = """id,amount
+1,1.5
+2,2.5
+""".lstrip()
+
+wider_decimal_seed_csv = """id,amount
+1,1.5
+2,12.5
+""".lstrip()
+
+
+class TestSeedMergeWidensDecimalsDremio:
+    @pytest.fixture(scope="class")
+    def seeds(self):
+        return {
+            "merged_seed.csv": initial_decimal_seed_csv,
+            "seeds.yml": seeds_yml,
+        }
+
+    def test_seed_merge_widens_decimals(self, project):
+        run_dbt(["seed"])
+
+        write_file(
+            wider_decimal_seed_csv, project.project_root, "seeds", "merged_seed.csv"
+        )
+        results = run_dbt(["seed"])
+
+        # the amount column is widened to hold the extra digit
+        assert results[0].adapter_response["_message"].startswith("MERGE")
+        relation = relation_from_name(project.adapter, "merged_seed")
+        rows = project.run_sql(
+            f"select id, amount from {relation} order by id", fetch="all"
+        )
+        assert [(row[0], str(row[1])) for row in rows] == [(1, "1.5"), (2, "12.5")]
@@ -0,0 +1,171 @@
+# Copyright (C) 2022 Dremio Corporation
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest.mock import MagicMock
+
+from dbt.adapters.dremio.api.rest.error import (
+    DremioNotFoundException,
+    DremioPermissionException,
+)
+from dbt.adapters.dremio.connections import DremioConnectionManager
+from dbt.adapters.dremio.impl import DremioAdapter
+from dbt.adapters.dremio.relation import DremioRelation
+
+CATALOG = {
+    ("space",): {
+        "entityType": "space",
+        "children": [
+            {"path": ["space", "a"], "type": "CONTAINER", "containerType": "FOLDER"},
+            {"path": ["space", "v"], "type": "DATASET", "datasetType": "VIRTUAL"},
+        ],
+    },
+    ("space", "a"): {
+        "entityType": "folder",
+        "children": [
+            {
+                "path": ["space", "a", "b"],
+                "type": "CONTAINER",
+                "containerType": "FOLDER",
+            },
+            {"path": ["space", "a", "t"], "type": "DATASET", "datasetType": "PROMOTED"},
+        ],
+    },
+    ("space", "a", "b"): {"entityType": "folder", "children": []},
+    ("space", "a", "t"): {
+        "entityType": "dataset",
+        "fields": [
+            {"name": "id", "type": {"name": "BIGINT"}},
+            {"name": "name", "type": {"name": "VARCHAR"}},
+            {
+                "name": "amount",
+                "type": {"name": "DECIMAL", "precision": 10, "scale": 2},
+            },
+        ],
+    },
+    ("lake",): {"entityType": "source", "children": []},
+}
+
+
+def _adapter():
+    adapter = DremioAdapter.__new__(DremioAdapter)
+    connections = MagicMock()
+    connections._create_path_list = DremioConnectionManager._create_path_list.__get__(
+        connections
+    )
+    connections.get_catalog_entity.side_effect = lambda path: CATALOG.get(tuple(path))
+    connections.get_catalog_container.side_effect = lambda path: CATALOG.get(
+        tuple(path)
+    )
+    adapter.connections = connections
+    return adapter
+
+
+class TestCatalogMetadata:
+    def test_list_relations(self):
+        rows = _adapter().list_relations_from_catalog('"space"', ["no_schema", "a"])
+
+        assert rows == [
+            ("space", "v", "no_schema", "view"),
+            ("space", "t", "a", "table"),
+        ]
+
+    def test_missing_schema_has_no_relations(self):
+        assert _adapter().list_relations_from_catalog("space", ["missing"]) == []
+
+    def test_check_schema_exists(self):
+        adapter = _adapter()
+
+        assert adapter.check_schema_exists_in_catalog("space", "a.b") is True
+        assert adapter.check_schema_exists_in_catalog("space", "missing") is False
+        assert adapter.check_schema_exists_in_catalog("space", "a.t") is False
+
+    def test_get_columns(self):
+        relation = DremioRelation.create(database="space", schema="a", identifier="t")
+
+        columns = _adapter().get_columns_from_catalog(relation)
+
+        assert [(c.name, c.data_type) for c in columns] == [
+            ("id", "bigint"),
+            ("name", "character varying(65536)"),
+            ("amount", "decimal(10,2)"),
+        ]
+
+    def test_list_schemas_walks_folders(self):
+        schemas = _adapter().list_schemas_from_catalog("space")
+
+        assert sorted(schemas) == [("a",), ("a.b",), ("no_schema",)]
+
+    def test_sources_and_errors_fall_back_to_sql(self):
+        adapter = _adapter()
+
+        assert adapter.list_schemas_from_catalog("lake") is None
+
+        adapter.connections.get_catalog_container.side_effect = (
+            DremioPermissionException("No permission:", "403")
+        )
+        assert adapter.list_relations_from_catalog("space", ["a"]) is None
+
+
+class TestCatalogContainerPagination:
+    def test_children_of_every_page_are_combined(self):
+        manager = DremioConnectionManager.__new__(DremioConnectionManager)
+        rest_client = MagicMock()
+        rest_client.get_catalog_item.side_effect = [
+            {"entityType": "folder", "children": [{"id": 1}], "nextPageToken": "p2"},
+            {"entityType": "folder", "children": [{"id": 2}]},
+        ]
+        manager.get_thread_connection = MagicMock()
+        manager.open = MagicMock()
+        manager.open.return_value.handle.get_client.return_value = rest_client
+
+        container = manager.get_catalog_container(["space", "a"])
+
+        assert container["children"] == [{"id": 1}, {"id": 2}]
+        assert (
+            rest_client.get_catalog_item.call_args_list[1].kwargs["page_token"] == "p2"
+        )
+
+    def test_missing_container(self):
+        manager = DremioConnectionManager.__new__(DremioConnectionManager)
+        rest_client = MagicMock()
+        rest_client.get_catalog_item.side_effect = DremioNotFoundException(
+            "Not found:", "404"
+        )
+        manager.get_thread_connection = MagicMock()
+        manager.open = MagicMock()
+        manager.open.return_value.handle.get_client.return_value = rest_client
+
+        assert manager.get_catalog_container(["space", "missing"]) is None
+
+
+class TestColumnsInQuery:
+    def test_columns_are_read_from_the_job_schema(self):
+        adapter = _adapter()
+        cursor = MagicMock()
+        cursor.job_results.return_value = {
+            "schema": [
+                {"name": "id", "type": {"name": "BIGINT"}},
+                {
+                    "name": "amount",
+                    "type": {"name": "DECIMAL", "precision": 10, "scale": 2},
+                },
+            ],
+            "rows": [],
+        }
+        adapter.connections.add_query.return_value = (None, cursor)
+
+        columns = adapter.get_columns_in_query("select id, amount from t")
+
+        assert adapter.connections.add_query.call_args.args[0].endswith("limit 0")
+        assert [(column.name, column.data_type) for column in columns] == [
+            ("id", "bigint"),
+            ("amount", "decimal(10,2)"),
+        ]
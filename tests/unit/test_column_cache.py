@@ -0,0 +1,145 @@
+# Copyright (C) 2022 Dremio Corporation
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from dbt.adapters.dremio.column import DremioColumn
+from dbt.adapters.dremio.column_cache import DremioColumnCache, relation_key
+from dbt.adapters.dremio.impl import DremioAdapter
+from dbt.adapters.dremio.relation import DremioRelation
+
+ORDERS = DremioRelation.create(database="space", schema="a.b", identifier="Orders")
+CUSTOMERS = DremioRelation.create(
+    database="space", schema="no_schema", identifier="customers"
+)
+
+
+class TestRelationKey:
+    def test_quoting_and_case_are_ignored(self):
+        assert relation_key(str(ORDERS)) == "space.a.b.orders"
+        assert relation_key('space."A".b.ORDERS') == "space.a.b.orders"
+        assert relation_key(str(CUSTOMERS)) == "space.customers"
+
+
+class TestDremioColumnCache:
+    @pytest.mark.parametrize(
+        "sql",
+        [
+            'create table "space"."a"."b"."Orders" as (select 1)',
+            "CREATE OR REPLACE VIEW space.a.b.orders AS select 1",
+            'alter table "space"."a"."b"."orders" add columns (x int)',
+            'drop table if exists "space"."a"."b"."orders"',
+        ],
+    )
+    def test_ddl_invalidates_named_relation(self, sql):
+        cache = DremioColumnCache()
+        cache.set(ORDERS, [DremioColumn("id", "bigint")], 0)
+        cache.set(CUSTOMERS, [DremioColumn("id", "bigint")], 0)
+
+        cache.invalidate_sql(sql)
+
+        assert cache.get(ORDERS)[0] is None
+        assert cache.get(CUSTOMERS)[0] is not None
+
+    def test_select_does_not_invalidate(self):
+        cache = DremioColumnCache()
+        cache.set(ORDERS, [DremioColumn("id", "bigint")], 0)
+
+        cache.invalidate_sql('select * from "space"."a"."b"."Orders"')
+
+        assert cache.get(ORDERS)[0] is not None
+
+    def test_stale_lookup_is_not_stored(self):
+        cache = DremioColumnCache()
+        _, generation = cache.get(ORDERS)
+
+        # DDL on another thread while the columns were being read
+        cache.invalidate(relation_key(str(ORDERS)))
+        cache.set(ORDERS, [DremioColumn("id", "bigint")], generation)
+
+        assert cache.get(ORDERS)[0] is None
+
+
+class TestAdapterColumnCache:
+    def _adapter(self):
+        adapter = DremioAdapter.__new__(DremioAdapter)
+        adapter._column_cache = DremioColumnCache()
+        adapter.config = MagicMock()
+        adapter.config.credentials.metadata_source = "sql"
+        return adapter
+
+    @patch("dbt.adapters.sql.SQLAdapter.get_columns_in_relation")
+    def test_columns_are_fetched_once(self, mocked_get_columns):
+        mocked_get_columns.return_value = [DremioColumn("id", "bigint")]
+        adapter = self._adapter()
+
+        adapter.get_columns_in_relation(ORDERS)
+        columns = adapter.get_columns_in_relation(ORDERS)
+
+        assert [column.name for column in columns] == ["id"]
+        assert mocked_get_columns.call_count == 1
+
+    @patch("dbt.adapters.sql.SQLAdapter.get_columns_in_relation")
+    def test_bulk_load_fills_cache(self, mocked_get_columns):
+        adapter = self._adapter()
+        adapter.execute_macro = MagicMock(
+            return_value=[
+                ("space.a.b", "orders", "id", "bigint", None, None, None),
+                ("space.a.b", "orders", "amount", "decimal", None, 10, 2),
+                ("space", "customers", "name", "character varying", 65536, None, None),
+            ]
+        )
+
+        adapter.load_columns_in_relations([ORDERS, CUSTOMERS, None])
+        adapter.load_columns_in_relations([ORDERS])
+
+        assert adapter.execute_macro.call_count == 1
+        assert [c.name for c in adapter.get_columns_in_relation(ORDERS)] == [
+            "id",
+            "amount",
+        ]
+        assert adapter.get_columns_in_relation(CUSTOMERS)[0].data_type == (
+            "character varying(65536)"
+        )
+        mocked_get_columns.assert_not_called()
+
+    @patch("dbt.adapters.sql.SQLAdapter.get_columns_in_relation")
+    def test_created_relation_is_read_from_catalog(self, mocked_get_columns):
+        adapter = self._adapter()
+        adapter.get_columns_from_catalog = MagicMock(
+            return_value=[DremioColumn("id", "bigint")]
+        )
+        adapter.execute_macro = MagicMock(return_value=[])
+
+        adapter._column_cache.invalidate_sql(
+            f"create table {ORDERS} as (select 1 as id)"
+        )
+        adapter.load_columns_in_relations([ORDERS])
+
+        assert [c.name for c in adapter.get_columns_in_relation(ORDERS)] == ["id"]
+        adapter.execute_macro.assert_not_called()
+        mocked_get_columns.assert_not_called()
+
+    @patch("dbt.adapters.sql.SQLAdapter.get_columns_in_relation")
+    def test_relations_not_created_by_the_adapter_use_sql(self, mocked_get_columns):
+        mocked_get_columns.return_value = [DremioColumn("id", "bigint")]
+        adapter = self._adapter()
+        adapter.get_columns_from_catalog = MagicMock()
+
+        adapter._column_cache.invalidate_sql(
+            f"alter table {ORDERS} add columns (x int)"
+        )
+        adapter.get_columns_in_relation(ORDERS)
+
+        adapter.get_columns_from_catalog.assert_not_called()
+        assert mocked_get_columns.call_count == 1
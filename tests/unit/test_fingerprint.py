@@ -0,0 +1,274 @@
+# Copyright (C) 2022 Dremio Corporation
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import multiprocessing
+from unittest.mock import MagicMock, patch
+
+import agate
+from dbt_common.exceptions import DbtRuntimeError
+
+from dbt.adapters.contracts.connection import Connection
+
+from dbt.adapters.dremio import connections as dremio_connections
+from dbt.adapters.dremio.connections import DremioConnectionManager
+from dbt.adapters.dremio.fingerprint import with_fingerprint_tag
+from dbt.adapters.dremio.impl import DremioAdapter
+from dbt.adapters.dremio.relation import DremioRelation
+
+
+def test_fingerprint_tag_is_replaced():
+    tags = with_fingerprint_tag(["finance", "dbt-fingerprint:old"], "new")
+
+    assert tags == ["finance", "dbt-fingerprint:new"]
+
+
+class TestFingerprintTags:
+    def _manager(self, stored_tags):
+        manager = DremioConnectionManager.__new__(DremioConnectionManager)
+        connection = MagicMock()
+        manager.get_thread_connection = MagicMock(return_value=connection)
+        manager.open = MagicMock(return_value=connection)
+        rest_client = connection.handle.get_client.return_value
+        rest_client.get_catalog_item.return_value = {"id": "dataset-id"}
+        rest_client.retrieve_tags.return_value = stored_tags
+        return manager, rest_client
+
+    def _relation(self):
+        return DremioRelation.create(
+            database="lake", schema="seeds", identifier="codes"
+        )
+
+    def test_fingerprint_is_read_from_tags(self):
+        manager, _ = self._manager(
+            {"tags": ["a", "dbt-fingerprint:abc"], "version": "1"}
+        )
+
+        assert manager.get_relation_fingerprint(self._relation()) == "abc"
+
+    def test_fingerprint_is_added_to_tags(self):
+        manager, rest_client = self._manager({"tags": ["a"], "version": "1"})
+
+        manager.set_relation_fingerprint(self._relation(), "abc")
+
+        rest_client.update_tags.assert_called_once_with(
+            "dataset-id", ["a", "dbt-fingerprint:abc"], "1"
+        )
+
+    def test_docs_tags_keep_the_fingerprint(self):
+        manager, rest_client = self._manager(
+            {"tags": ["old", "dbt-fingerprint:abc"], "version": "1"}
+        )
+
+        manager.process_tags(self._relation(), ["new"])
+
+        rest_client.update_tags.assert_called_once_with(
+            "dataset-id", ["new", "dbt-fingerprint:abc"], "1"
+        )
+
+
+GRAPH = {
+    "nodes": {
+        "model.p.orders": {
+            "resource_type": "model",
+            "database": "lake",
+            "schema": "no_schema",
+            "alias": "orders",
+            "config": {"materialized": "table"},
+            "depends_on": {"nodes": []},
+        },
+        "model.p.orders_view": {
+            "resource_type": "model",
+            "database": "space",
+            "schema": "no_schema",
+            "alias": "orders_view",
+            "config": {"materialized": "view"},
+            "depends_on": {"nodes": ["model.p.orders"]},
+        },
+        "model.p.recent": {
+            "resource_type": "model",
+            "database": "space",
+            "schema": "no_schema",
+            "alias": "recent",
+            "config": {"materialized": "ephemeral"},
+            "depends_on": {"nodes": ["model.p.orders_view"]},
+        },
+    },
+    "sources": {
+        "source.p.raw.events": {
+            "resource_type": "source",
+            "database": "lake",
+            "schema": "raw",
+            "identifier": "events",
+            "depends_on": {"nodes": []},
+        },
+    },
+}
+
+CATALOG = {
+    ("lake", "orders"): {"type": "PHYSICAL_DATASET"},
+    ("space", "orders_view"): {
+        "type": "VIRTUAL_DATASET",
+        "sql": "select * from orders",
+    },
+    ("lake", "raw", "events"): {"type": "PHYSICAL_DATASET"},
+}
+
+
+class TestBuildFingerprint:
+    def _adapter(self, snapshots):
+        adapter = DremioAdapter.__new__(DremioAdapter)
+        connections = MagicMock()
+        connections._create_path_list = (
+            DremioConnectionManager._create_path_list.__get__(connections)
+        )
+        connections.get_catalog_entity.side_effect = lambda path: CATALOG.get(
+            tuple(path)
+        )
+        adapter.connections = connections
+
+        def execute(sql, fetch=False):
+            for table_path, snapshot_id in snapshots.items():
+                if table_path in sql:
+                    return None, agate.Table([(snapshot_id,)], ["snapshot_id"])
+            raise DbtRuntimeError("not an Iceberg table")
+
+        adapter.execute = MagicMock(side_effect=execute)
+        return adapter
+
+    def _model(self, *nodes):
+        return {
+            "config": {"materialized": "table"},
+            "depends_on": {"nodes": list(nodes)},
+        }
+
+    def test_fingerprint_follows_upstream_snapshots_through_views(self):
+        model = self._model("model.p.recent")
+        fingerprint = self._adapter({'"lake"."orders"': 1}).build_fingerprint(
+            model, GRAPH, "select 1"
+        )
+
+        assert fingerprint is not None
+        assert (
+            self._adapter({'"lake"."orders"': 1}).build_fingerprint(
+                model, GRAPH, "select 1"
+            )
+            == fingerprint
+        )
+        assert (
+            self._adapter({'"lake"."orders"': 2}).build_fingerprint(
+                model, GRAPH, "select 1"
+            )
+            != fingerprint
+        )
+        assert (
+            self._adapter({'"lake"."orders"': 1}).build_fingerprint(
+                model, GRAPH, "select 2"
+            )
+            != fingerprint
+        )
+
+    def test_inputs_without_snapshots_are_not_fingerprinted(self):
+        adapter = self._adapter({'"lake"."orders"': 1})
+
+        assert (
+            adapter.build_fingerprint(
+                self._model("source.p.raw.events"), GRAPH, "select 1"
+            )
+            is None
+        )
+
+
+class _FakeCursor:
+    def __init__(self, statements):
+        self._statements = statements
+        self.closed = False
+        self.rowcount = -1
+
+    def execute(self, sql, bindings=None, fetch=False, limit=None):
+        self._statements.append(sql)
+        if "table_snapshot" in sql:
+            raise DbtRuntimeError("not an Iceberg table")
+
+
+class _FakeHandle:
+    def __init__(self, statements):
+        self._statements = statements
+        self.closed = False
+
+    def cursor(self):
+        if self.closed:
+            raise Exception("HandleClosed")
+        return _FakeCursor(self._statements)
+
+    def close(self):
+        self.closed = True
+
+
+class TestInputStateConnection:
+    def test_a_failed_snapshot_query_leaves_the_connection_usable(self):
+        statements = []
+        profile = MagicMock(threads=1)
+        manager = DremioConnectionManager(profile, multiprocessing.get_context("spawn"))
+        credentials = MagicMock(
+            poll_initial_ms=50,
+            poll_max_ms=2000,
+            result_fetch_parallelism=1,
+            transport="rest",
+            job_status_rate_limit=None,
+            catalog_rate_limit=None,
+        )
+        connection = Connection(type="dremio", name="model", credentials=credentials)
+        manager.set_thread_connection(connection)
+        manager.get_catalog_entity = MagicMock(
+            return_value={"type": "PHYSICAL_DATASET", "format": {"type": "Iceberg"}}
+        )
+        adapter = DremioAdapter.__new__(DremioAdapter)
+        adapter.connections = manager
+        adapter._column_cache = MagicMock()
+        node = {
+            "resource_type": "source",
+            "database": "lake",
+            "schema": "raw",
+            "identifier": "events",
+        }
+
+        with patch.object(dremio_connections, "ParametersBuilder"), patch.object(
+            dremio_connections,
+            "DremioHandle",
+            side_effect=lambda *args: _FakeHandle(statements),
+        ):
+            manager.reopen()
+            assert adapter._input_state(node) is None
+            adapter.execute("create table lake.model as select 1")
+
+        assert statements[-1] == "create table lake.model as select 1"
+
+    def test_files_that_are_not_iceberg_are_not_queried(self):
+        adapter = DremioAdapter.__new__(DremioAdapter)
+        adapter.connections = MagicMock()
+        adapter.connections._create_path_list = (
+            DremioConnectionManager._create_path_list.__get__(adapter.connections)
+        )
+        adapter.connections.get_catalog_entity.return_value = {
+            "type": "PHYSICAL_DATASET",
+            "format": {"type": "Parquet"},
+        }
+        adapter.execute = MagicMock()
+        node = {
+            "resource_type": "source",
+            "database": "lake",
+            "schema": "raw",
+            "identifier": "events",
+        }
+
+        assert adapter._input_state(node) is None
+        adapter.execute.assert_not_called()
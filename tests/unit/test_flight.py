@@ -0,0 +1,108 @@
+# Copyright (C) 2022 Dremio Corporation
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import datetime
+from decimal import Decimal
+
+import pytest
+
+from dbt.adapters.dremio.api.authentication import DremioPatAuthentication
+from dbt.adapters.dremio.api.cursor import DremioCursor
+from dbt.adapters.dremio.api.flight import DremioFlightClient
+from dbt.adapters.dremio.api.parameters import Parameters
+from dbt.adapters.dremio.api.rest.client import DremioRestClient
+
+pa = pytest.importorskip("pyarrow")
+flight = pytest.importorskip("pyarrow.flight")
+
+
+class StandInFlightServer(flight.FlightServerBase):
+    """In-process stand-in for the Dremio Flight endpoint.
+
+    Serves a fixed Arrow table for each known SQL statement.
+    """
+
+    def __init__(self, tables):
+        super().__init__("grpc+tcp://localhost:0")
+        self._tables = tables
+
+    def get_flight_info(self, context, descriptor):
+        table = self._tables[descriptor.command.decode()]
+        endpoint = flight.FlightEndpoint(flight.Ticket(descriptor.command), [])
+        return flight.FlightInfo(
+            table.schema, descriptor, [endpoint], table.num_rows, -1
+        )
+
+    def do_get(self, context, ticket):
+        return flight.RecordBatchStream(self._tables[ticket.ticket.decode()])
+
+
+SQL = "select * from orders"
+ORDERS = pa.table(
+    {
+        "id": pa.array([1, 2, 3], type=pa.int64()),
+        "amount": pa.array(
+            [Decimal("1.50"), None, Decimal("3.25")], type=pa.decimal128(10, 2)
+        ),
+        "status": pa.array(["1", "shipped", "true"]),
+        "ordered_at": pa.array(
+            [datetime.datetime(2024, 1, d) for d in (1, 2, 3)],
+            type=pa.timestamp("ms"),
+        ),
+    }
+)
+
+
+@pytest.fixture
+def flight_cursor():
+    server = StandInFlightServer({SQL: ORDERS})
+    flight_client = DremioFlightClient(
+        f"grpc+tcp://localhost:{server.port}",
+        DremioPatAuthentication(username="dbt", pat="token"),
+    )
+    cursor = DremioCursor(
+        DremioRestClient(Parameters("base_url", DremioPatAuthentication())),
+        flight_client=flight_client,
+    )
+    yield cursor
+    flight_client.close()
+    server.shutdown()
+
+
+class TestFlightTransport:
+    def test_fetch_returns_typed_table(self, flight_cursor):
+        flight_cursor.execute(SQL, fetch=True)
+
+        assert flight_cursor.rowcount == 3
+        assert flight_cursor.arrow_table.equals(ORDERS)
+        assert flight_cursor.table.column_names == (
+            "id",
+            "amount",
+            "status",
+            "ordered_at",
+        )
+        assert tuple(flight_cursor.table.rows[0]) == (
+            Decimal(1),
+            Decimal("1.50"),
+            "1",
+            datetime.datetime(2024, 1, 1),
+        )
+        assert flight_cursor.job_results()["schema"][1] == {
+            "name": "amount",
+            "type": {"name": "DECIMAL"},
+        }
+
+    def test_fetch_honors_limit(self, flight_cursor):
+        flight_cursor.execute(SQL, fetch=True, limit=2)
+
+        assert flight_cursor.rowcount == 2
+        assert [row["id"] for row in flight_cursor.fetchall()] == [1, 2]
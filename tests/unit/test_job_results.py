@@ -77,3 +77,77 @@ class TestJobResults:
         # Assert
         assert dremio_cursor_obj._job_results == self.expected_combined_job_results
         assert mocked_job_results_func.call_count == JOB_RESULT_TOTAL_CALLS
+
+    @patch("dbt.adapters.dremio.api.rest.client.DremioRestClient.job_results")
+    def test_parallel_job_result_pagination_keeps_row_order(
+        self, mocked_job_results_func
+    ):
+        # Arrange
+        ROW_LIMIT = 2
+        schema = [{"name": "id", "type": {"name": "BIGINT"}}]
+        pages_by_offset = {
+            offset: {
+                "rowCount": 7,
+                "schema": schema,
+                "rows": [{"id": i} for i in range(offset + 1, min(offset + ROW_LIMIT, 7) + 1)],
+            }
+            for offset in range(0, 8, ROW_LIMIT)
+        }
+        dremio_cursor_obj = DremioCursor(
+            DremioRestClient(Parameters("base_url", DremioAuthentication())),
+            result_fetch_parallelism=3,
+        )
+        mocked_job_results_func.side_effect = (
+            lambda job_id, offset, limit: pages_by_offset[offset]
+        )
+
+        # Act
+        dremio_cursor_obj._populate_job_results(row_limit=ROW_LIMIT)
+
+        # Assert
+        assert dremio_cursor_obj._job_results == self.expected_combined_job_results
+        assert sorted(
+            c.kwargs["offset"] for c in mocked_job_results_func.call_args_list
+        ) == [0, 2, 4, 6]
+
+    @patch("dbt.adapters.dremio.api.rest.client.DremioRestClient.job_results")
+    def test_fetchmany_pulls_pages_lazily(self, mocked_job_results_func):
+        # Arrange
+        schema = [{"name": "id", "type": {"name": "BIGINT"}}]
+        mocked_job_results_func.side_effect = lambda job_id, offset, limit: {
+            "rowCount": 7,
+            "schema": schema,
+            "rows": [{"id": i} for i in range(offset + 1, min(offset + limit, 7) + 1)],
+        }
+        dremio_cursor_obj = DremioCursor(
+            DremioRestClient(Parameters("base_url", DremioAuthentication()))
+        )
+        dremio_cursor_obj._job_id = "job-id"
+
+        # Act
+        first_rows = dremio_cursor_obj.fetchmany(3)
+
+        # Assert
+        assert first_rows == [(1,), (2,), (3,)]
+        assert mocked_job_results_func.call_count == 1
+        assert list(dremio_cursor_obj) == [(4,), (5,), (6,), (7,)]
+
+    @patch("dbt.adapters.dremio.api.rest.client.DremioRestClient.job_results")
+    def test_job_results_stop_at_max_rows(self, mocked_job_results_func):
+        # Arrange
+        schema = [{"name": "id", "type": {"name": "BIGINT"}}]
+        mocked_job_results_func.side_effect = lambda job_id, offset, limit: {
+            "rowCount": 7,
+            "schema": schema,
+            "rows": [{"id": i} for i in range(offset + 1, min(offset + limit, 7) + 1)],
+        }
+        dremio_cursor_obj = DremioCursor(
+            DremioRestClient(Parameters("base_url", DremioAuthentication()))
+        )
+
+        # Act
+        dremio_cursor_obj._populate_job_results(row_limit=2, max_rows=3)
+
+        # Assert
+        assert dremio_cursor_obj._job_results["rows"] == [{"id": 1}, {"id": 2}, {"id": 3}]
+        assert mocked_job_results_func.call_count == 2
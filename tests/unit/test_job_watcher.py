@@ -0,0 +1,143 @@
+# Copyright (C) 2022 Dremio Corporation
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import threading
+
+import pytest
+from unittest.mock import MagicMock
+
+from dbt.adapters.dremio.api.job_watcher import DremioJobWatcher
+from dbt.adapters.dremio.api.polling import ExponentialBackoffPollingPolicy
+
+
+def _make_watcher():
+    return DremioJobWatcher(
+        ExponentialBackoffPollingPolicy(initial_ms=1, max_ms=5, jitter=0)
+    )
+
+
+class TestDremioJobWatcher:
+    def test_resolves_each_job_with_its_final_status(self):
+        watcher = _make_watcher()
+        rest_client = MagicMock()
+        states = {
+            "job-a": iter(["RUNNING", "RUNNING", "COMPLETED"]),
+            "job-b": iter(["ENQUEUED", "FAILED"]),
+        }
+        rest_client.job_status.side_effect = lambda job_id: {
+            "jobState": next(states[job_id])
+        }
+
+        try:
+            future_a = watcher.watch(rest_client, "job-a")
+            future_b = watcher.watch(rest_client, "job-b")
+
+            assert future_a.result(timeout=5)["jobState"] == "COMPLETED"
+            assert future_b.result(timeout=5)["jobState"] == "FAILED"
+            assert rest_client.job_status.call_count == 5
+        finally:
+            watcher.stop()
+
+    def test_status_errors_are_raised_to_the_waiting_cursor(self):
+        watcher = _make_watcher()
+        rest_client = MagicMock()
+        rest_client.job_status.side_effect = ValueError("boom")
+
+        try:
+            with pytest.raises(ValueError, match="boom"):
+                watcher.wait_for(rest_client, "job-a")
+        finally:
+            watcher.stop()
+
+    def test_malformed_status_fails_only_its_job(self):
+        watcher = _make_watcher()
+        rest_client = MagicMock()
+        # _check_error returns the response text when the body is not JSON
+        rest_client.job_status.side_effect = lambda job_id: (
+            "<html>Bad Gateway</html>"
+            if job_id == "job-a"
+            else {"jobState": "COMPLETED"}
+        )
+
+        try:
+            future_a = watcher.watch(rest_client, "job-a")
+            future_b = watcher.watch(rest_client, "job-b")
+
+            with pytest.raises(TypeError):
+                future_a.result(timeout=5)
+            assert future_b.result(timeout=5)["jobState"] == "COMPLETED"
+            assert (
+                watcher.watch(rest_client, "job-c").result(timeout=5)["jobState"]
+                == "COMPLETED"
+            )
+        finally:
+            watcher.stop()
+
+    def test_a_slow_status_request_does_not_hold_up_other_jobs(self):
+        watcher = _make_watcher()
+        rest_client = MagicMock()
+        release = threading.Event()
+
+        def job_status(job_id):
+            if job_id == "job-a":
+                # a request sleeping between retries or on the rate limiter
+                release.wait(5)
+            return {"jobState": "COMPLETED"}
+
+        rest_client.job_status.side_effect = job_status
+
+        try:
+            future_a = watcher.watch(rest_client, "job-a")
+            future_b = watcher.watch(rest_client, "job-b")
+
+            assert future_b.result(timeout=2)["jobState"] == "COMPLETED"
+            assert not future_a.done()
+            release.set()
+            assert future_a.result(timeout=5)["jobState"] == "COMPLETED"
+        finally:
+            release.set()
+            watcher.stop()
+
+    def test_a_dead_watcher_thread_is_restarted(self):
+        watcher = _make_watcher()
+        watcher.LIVENESS_CHECK_S = 0.05
+        rest_client = MagicMock()
+        rest_client.job_status.return_value = {"jobState": "COMPLETED"}
+        run = watcher._run
+        runs = []
+
+        def run_once_dying():
+            runs.append(1)
+            if len(runs) == 1:
+                raise RuntimeError("watcher died")
+            run()
+
+        watcher._run = run_once_dying
+
+        try:
+            assert watcher.wait_for(rest_client, "job-a")["jobState"] == "COMPLETED"
+            assert len(runs) == 2
+        finally:
+            watcher.stop()
+
+    def test_stop_fails_pending_jobs(self):
+        watcher = _make_watcher()
+        rest_client = MagicMock()
+        rest_client.job_status.return_value = {"jobState": "RUNNING"}
+
+        future = watcher.watch(rest_client, "job-a")
+        watcher.stop()
+
+        with pytest.raises(Exception, match="JobWatcherStopped"):
+            future.result(timeout=5)
+        with pytest.raises(Exception, match="JobWatcherStopped"):
+            watcher.watch(rest_client, "job-b")
@@ -0,0 +1,92 @@
+# Copyright (C) 2022 Dremio Corporation
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from dbt.adapters.dremio.node_index import DremioNodeIndex, format_clause_from_node
+
+
+def _model(name, materialized="table", **config):
+    return {
+        "unique_id": f"model.test.{name}",
+        "name": name,
+        "config": {"materialized": materialized, **config},
+    }
+
+
+def _source(source_name, name, external=None):
+    return {
+        "unique_id": f"source.test.{source_name}.{name}",
+        "source_name": source_name,
+        "name": name,
+        "external": external,
+    }
+
+
+GRAPH = {
+    "nodes": {
+        "model.test.orders": _model("orders", format="parquet"),
+        "model.test.customers": _model("customers", "view", format="parquet"),
+        "model.other.orders": _model("orders", format="json"),
+    },
+    "sources": {
+        "source.test.raw.events": _source(
+            "raw",
+            "events",
+            {"format": "text", "field_delimiter": "|", "extract_header": True},
+        ),
+        "source.test.raw.users": _source("raw", "users"),
+    },
+}
+
+
+class TestDremioNodeIndex:
+    def test_model_lookup_resolves_format(self):
+        index = DremioNodeIndex(GRAPH)
+
+        model = index.get_model("orders")
+
+        # the first node with the name wins, matching the previous linear scan
+        assert model.node is GRAPH["nodes"]["model.test.orders"]
+        assert model.format == "parquet"
+        assert model.format_clause == "type=>'parquet'"
+        assert index.get_model("orders") is model
+
+    def test_views_have_no_format(self):
+        index = DremioNodeIndex(GRAPH)
+
+        model = index.get_model("customers")
+
+        assert model.format is None
+        assert model.format_clause is None
+
+    def test_source_lookup_resolves_format(self):
+        index = DremioNodeIndex(GRAPH)
+
+        events = index.get_source("raw", "events")
+        users = index.get_source("raw", "users")
+
+        assert events.format_clause == (
+            "type=>'text', fieldDelimiter=>'|', extractHeader=>True"
+        )
+        assert users.format is None
+        assert index.get_source("raw", "missing") is None
+
+
+class TestFormatClauseFromNode:
+    def test_excel_options(self):
+        config = {"format": "excel", "sheet_name": "Sheet1", "xls": False}
+
+        assert format_clause_from_node(config) == (
+            "type=>'excel', sheetName=>'Sheet1', xls=>False"
+        )
+
+    def test_unknown_format_has_no_clause(self):
+        assert format_clause_from_node({"format": "iceberg"}) is None
+        assert format_clause_from_node(None) is None
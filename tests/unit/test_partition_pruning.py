@@ -0,0 +1,260 @@
+# Copyright (C) 2022 Dremio Corporation
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from datetime import date, datetime
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import agate
+import pytest
+from dbt_common.exceptions import DbtRuntimeError
+
+from dbt.adapters.dremio.column import DremioColumn
+from dbt.adapters.dremio.impl import DremioAdapter
+from dbt.adapters.dremio.partition_pruning import (
+    MAX_PARTITION_MATCH_TERMS,
+    PartitionField,
+    parse_partition_field,
+    partition_match_predicate,
+    partition_predicate,
+)
+from dbt.adapters.dremio.relation import DremioRelation
+
+
+class TestParsePartitionField:
+    @pytest.mark.parametrize(
+        "expression, field",
+        [
+            ("region", PartitionField("region", "identity")),
+            ("identity(region)", PartitionField("region", "identity")),
+            ("DAY(event_ts)", PartitionField("event_ts", "day")),
+            ('month("event date")', PartitionField('"event date"', "month")),
+            ("bucket(16, id)", None),
+            ("truncate(3, name)", None),
+        ],
+    )
+    def test_partition_by_entries(self, expression, field):
+        assert parse_partition_field(expression) == field
+
+
+class TestPartitionPredicate:
+    def test_identity_partitions_are_bounded_by_the_batch(self):
+        predicate = partition_predicate(
+            PartitionField("region", "identity"), "varchar", "eu", "us", False
+        )
+
+        assert predicate == (
+            "(DBT_INTERNAL_DEST.region >= 'eu' and DBT_INTERNAL_DEST.region <= 'us')"
+        )
+
+    def test_temporal_partitions_are_widened_to_their_boundaries(self):
+        predicate = partition_predicate(
+            PartitionField("event_ts", "month"),
+            "timestamp",
+            datetime(2024, 1, 15, 10, 30),
+            datetime(2024, 12, 2),
+            True,
+        )
+
+        assert predicate == (
+            "(DBT_INTERNAL_DEST.event_ts >= TIMESTAMP '2024-01-01 00:00:00.000'"
+            " and DBT_INTERNAL_DEST.event_ts < TIMESTAMP '2025-01-01 00:00:00.000')"
+            " or (DBT_INTERNAL_DEST.event_ts is null)"
+        )
+
+    def test_day_partitions_of_dates(self):
+        predicate = partition_predicate(
+            PartitionField("day", "day"),
+            "date",
+            date(2024, 2, 28),
+            date(2024, 2, 29),
+            False,
+        )
+
+        assert predicate == (
+            "(DBT_INTERNAL_DEST.day >= DATE '2024-02-28'"
+            " and DBT_INTERNAL_DEST.day < DATE '2024-03-01')"
+        )
+
+    def test_an_empty_batch_reads_no_partitions(self):
+        assert (
+            partition_predicate(
+                PartitionField("region", "identity"), "varchar", None, None, False
+            )
+            == "FALSE"
+        )
+
+
+class TestGetPartitionPredicates:
+    def test_predicates_are_derived_from_one_bounds_query(self):
+        adapter = DremioAdapter.__new__(DremioAdapter)
+        adapter.get_columns_in_relation = MagicMock(
+            return_value=[
+                DremioColumn("region", "varchar"),
+                DremioColumn("id", "bigint"),
+            ]
+        )
+        adapter.execute = MagicMock(
+            return_value=(
+                None,
+                agate.Table(
+                    [(Decimal("1"), Decimal("5"), Decimal("0"))],
+                    ["min", "max", "nulls"],
+                    [agate.Number()] * 3,
+                ),
+            )
+        )
+        relation = DremioRelation.create(
+            database="lake", schema="no_schema", identifier="t"
+        )
+
+        predicates = adapter.get_partition_predicates(
+            relation, relation, ["id", "bucket(8, region)", "missing"]
+        )
+
+        assert adapter.execute.call_count == 1
+        assert predicates == [
+            "(DBT_INTERNAL_DEST.id >= 1 and DBT_INTERNAL_DEST.id <= 5)"
+        ]
+
+
+class TestPartitionMatchPredicate:
+    def test_partitions_are_matched_exactly(self):
+        predicate = partition_match_predicate(
+            [PartitionField("region", "identity"), PartitionField("event_date", "day")],
+            ["varchar", "date"],
+            ["eu", datetime(2024, 12, 31)],
+        )
+
+        assert predicate == (
+            "DBT_INTERNAL_DEST.region = 'eu'"
+            " and DBT_INTERNAL_DEST.event_date >= DATE '2024-12-31'"
+            " and DBT_INTERNAL_DEST.event_date < DATE '2025-01-01'"
+        )
+
+    def test_null_partitions(self):
+        assert (
+            partition_match_predicate(
+                [PartitionField("region", "identity")], ["varchar"], [None]
+            )
+            == "DBT_INTERNAL_DEST.region is null"
+        )
+
+
+class TestGetPartitionOverwritePredicate:
+    def _adapter(self, rows):
+        adapter = DremioAdapter.__new__(DremioAdapter)
+        adapter.get_columns_in_relation = MagicMock(
+            return_value=[
+                DremioColumn("region", "varchar"),
+                DremioColumn("id", "bigint"),
+            ]
+        )
+        adapter.execute = MagicMock(
+            return_value=(None, agate.Table(rows, ["region"], [agate.Text()]))
+        )
+        return adapter
+
+    def _relation(self):
+        return DremioRelation.create(
+            database="lake", schema="no_schema", identifier="t"
+        )
+
+    def test_every_partition_of_the_batch_is_matched(self):
+        adapter = self._adapter([("eu",), ("us",)])
+
+        predicate = adapter.get_partition_overwrite_predicate(
+            self._relation(), self._relation(), "region"
+        )
+
+        assert predicate == (
+            "(DBT_INTERNAL_DEST.region = 'eu') or (DBT_INTERNAL_DEST.region = 'us')"
+        )
+
+    def test_an_empty_batch_overwrites_nothing(self):
+        adapter = self._adapter([])
+
+        assert (
+            adapter.get_partition_overwrite_predicate(
+                self._relation(), self._relation(), ["region"]
+            )
+            == "FALSE"
+        )
+
+    @pytest.mark.parametrize("partition_by", [None, ["bucket(8, id)"], ["missing"]])
+    def test_partitions_that_cannot_be_matched_are_rejected(self, partition_by):
+        with pytest.raises(DbtRuntimeError):
+            self._adapter([]).get_partition_overwrite_predicate(
+                self._relation(), self._relation(), partition_by
+            )
+
+    def test_many_partitions_are_matched_with_a_subquery(self):
+        rows = [(f"region {i}",) for i in range(MAX_PARTITION_MATCH_TERMS + 1)]
+        adapter = self._adapter(rows)
+
+        predicate = adapter.get_partition_overwrite_predicate(
+            self._relation(), self._relation(), ["day(region)"]
+        )
+
+        assert predicate == (
+            'exists (select 1 from "lake"."t" as DBT_INTERNAL_SOURCE where '
+            "date_trunc('DAY', DBT_INTERNAL_SOURCE.region) is not distinct from "
+            "date_trunc('DAY', DBT_INTERNAL_DEST.region))"
+        )
+        assert adapter.execute.call_args.args[0].endswith(
+            f"limit {MAX_PARTITION_MATCH_TERMS + 1}"
+        )
+
+
+class TestOverwritePartitions:
+    def _adapter(self, failing_sql):
+        adapter = DremioAdapter.__new__(DremioAdapter)
+        adapter.connections = MagicMock()
+        adapter.connections._create_path_list = lambda database, schema: [database]
+        executed = []
+
+        def execute(sql, fetch=False):
+            executed.append(sql)
+            if sql == failing_sql:
+                raise DbtRuntimeError("insert failed")
+            if "table_snapshot" in sql:
+                return None, agate.Table([(42,)], ["snapshot_id"], [agate.Number()])
+            return "OK", None
+
+        adapter.execute = MagicMock(side_effect=execute)
+        return adapter, executed
+
+    def _relation(self):
+        return DremioRelation.create(
+            database="lake", schema="no_schema", identifier="t"
+        )
+
+    def test_partitions_are_deleted_before_the_insert(self):
+        adapter, executed = self._adapter(None)
+
+        assert (
+            adapter.overwrite_partitions(self._relation(), "delete", "insert") == "OK"
+        )
+        assert executed[1:] == ["delete", "insert"]
+
+    def test_a_failed_insert_rolls_the_delete_back(self):
+        adapter, executed = self._adapter("insert")
+
+        with pytest.raises(DbtRuntimeError, match="insert failed"):
+            adapter.overwrite_partitions(self._relation(), "delete", "insert")
+
+        adapter.connections.reopen.assert_called_once()
+        assert executed[1:] == [
+            "delete",
+            "insert",
+            """rollback table "lake"."t" to snapshot '42'""",
+        ]
@@ -0,0 +1,70 @@
+# Copyright (C) 2022 Dremio Corporation
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from itertools import islice
+from unittest.mock import patch
+
+from dbt.adapters.dremio.api.cursor import DremioCursor
+from dbt.adapters.dremio.api.parameters import Parameters
+from dbt.adapters.dremio.api.polling import ExponentialBackoffPollingPolicy
+from dbt.adapters.dremio.api.authentication import DremioAuthentication
+from dbt.adapters.dremio.api.rest.client import DremioRestClient
+
+
+class TestExponentialBackoffPollingPolicy:
+    def test_delays_grow_up_to_ceiling(self):
+        policy = ExponentialBackoffPollingPolicy(initial_ms=10, max_ms=80, jitter=0)
+
+        delays = list(islice(policy.delays(), 6))
+
+        assert delays == [0.01, 0.02, 0.04, 0.08, 0.08, 0.08]
+
+    def test_jitter_only_shortens_delays(self):
+        policy = ExponentialBackoffPollingPolicy(initial_ms=100, max_ms=100, jitter=0.5)
+
+        for delay in islice(policy.delays(), 50):
+            assert 0.05 <= delay <= 0.1
+
+
+class TestPopulateRowcountPolling:
+    @patch("dbt.adapters.dremio.api.cursor.time.sleep")
+    @patch("dbt.adapters.dremio.api.rest.client.DremioRestClient.job_status")
+    def test_completed_job_is_not_delayed(self, mocked_job_status, mocked_sleep):
+        dremio_cursor_object = DremioCursor(
+            DremioRestClient(Parameters("base_url", DremioAuthentication()))
+        )
+        mocked_job_status.return_value = {"jobState": "COMPLETED", "rowCount": 3}
+
+        dremio_cursor_object._populate_rowcount()
+
+        assert dremio_cursor_object.rowcount == 3
+        mocked_sleep.assert_not_called()
+
+    @patch("dbt.adapters.dremio.api.cursor.time.sleep")
+    @patch("dbt.adapters.dremio.api.rest.client.DremioRestClient.job_status")
+    def test_running_job_is_polled_with_policy_delays(
+        self, mocked_job_status, mocked_sleep
+    ):
+        dremio_cursor_object = DremioCursor(
+            DremioRestClient(Parameters("base_url", DremioAuthentication())),
+            ExponentialBackoffPollingPolicy(initial_ms=10, max_ms=20, jitter=0),
+        )
+        mocked_job_status.side_effect = [
+            {"jobState": "RUNNING"},
+            {"jobState": "RUNNING"},
+            {"jobState": "RUNNING"},
+            {"jobState": "COMPLETED"},
+        ]
+
+        dremio_cursor_object._populate_rowcount()
+
+        assert [c.args[0] for c in mocked_sleep.call_args_list] == [0.01, 0.02, 0.02]
@@ -0,0 +1,80 @@
+# Copyright (C) 2022 Dremio Corporation
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from unittest.mock import patch
+
+from dbt.adapters.dremio.api.authentication import DremioPatAuthentication
+from dbt.adapters.dremio.api.parameters import CloudParameters
+from dbt.adapters.dremio.api.rest.client import DremioRestClient
+from dbt.adapters.dremio.api.rest.rate_limiter import (
+    DremioRateLimiter,
+    RateLimits,
+    TokenBucket,
+    rate_limiter,
+)
+
+
+class TestTokenBucket:
+    def test_burst_then_steady_rate(self):
+        bucket = TokenBucket(rate_per_s=50, capacity=2)
+
+        start = time.monotonic()
+        for _ in range(4):
+            bucket.acquire()
+        elapsed = time.monotonic() - start
+
+        # two requests go out at once, the other two wait 1/50 s each
+        assert elapsed >= 0.035
+
+
+class TestDremioRateLimiter:
+    def test_buckets_are_separate_per_key_and_kind(self):
+        limiter = DremioRateLimiter()
+
+        limiter.acquire("project-a", DremioRateLimiter.JOB_STATUS, 1)
+        start = time.monotonic()
+        limiter.acquire("project-b", DremioRateLimiter.JOB_STATUS, 1)
+        limiter.acquire("project-a", DremioRateLimiter.CATALOG_MUTATION, 1)
+
+        assert time.monotonic() - start < 0.5
+
+    def test_unset_rate_is_unlimited(self):
+        limiter = DremioRateLimiter()
+
+        limiter.acquire("project", DremioRateLimiter.JOB_STATUS, None)
+
+        assert limiter._buckets == {}
+
+
+class TestRestClientRateLimits:
+    def teardown_method(self):
+        rate_limiter.clear()
+
+    @patch("dbt.adapters.dremio.api.rest.client._get")
+    @patch("dbt.adapters.dremio.api.rest.rate_limiter.DremioRateLimiter.acquire")
+    def test_job_status_uses_project_bucket(self, mocked_acquire, mocked_get_func):
+        parameters = CloudParameters(
+            base_url="https://api.dremio.cloud",
+            authentication=DremioPatAuthentication(
+                username=None, pat="pat", verify_ssl=True
+            ),
+            cloud_project_id="project",
+        )
+        client = DremioRestClient(
+            parameters, rate_limits=RateLimits(job_status_per_s=5)
+        )
+
+        client.job_status("job")
+
+        mocked_acquire.assert_called_once_with(
+            "project", DremioRateLimiter.JOB_STATUS, 5
+        )
@@ -0,0 +1,77 @@
+# Copyright (C) 2022 Dremio Corporation
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest.mock import MagicMock
+
+from dbt.adapters.dremio.impl import (
+    DremioAdapter,
+    LIST_RELATIONS_IN_SCHEMAS_MACRO_NAME,
+)
+from dbt.adapters.dremio.relation import DremioRelation
+
+
+class TestRelationsCachePrefetch:
+    def _adapter(self, batch_size=100):
+        adapter = DremioAdapter.__new__(DremioAdapter)
+        adapter.config = MagicMock()
+        adapter.config.args.single_threaded = True
+        adapter.cache = MagicMock()
+        adapter.LIST_RELATIONS_BATCH_SIZE = batch_size
+        adapter.execute_macro = MagicMock(
+            side_effect=lambda name, kwargs: [
+                (kwargs["database"], f"table_{schema}", schema, "table")
+                for schema in kwargs["schemas"]
+            ]
+        )
+        return adapter
+
+    def _schemas(self, database, *schemas):
+        return {
+            DremioRelation.create(database=database, schema=schema)
+            for schema in schemas
+        }
+
+    def test_one_job_per_database(self):
+        adapter = self._adapter()
+        cache_schemas = self._schemas("space_a", "s1", "s2", "s3") | self._schemas(
+            "space_b", "s1"
+        )
+
+        adapter._relations_cache_for_schemas([], cache_schemas)
+
+        assert adapter.execute_macro.call_count == 2
+        calls = {
+            call.kwargs["kwargs"]["database"]: call.kwargs["kwargs"]["schemas"]
+            for call in adapter.execute_macro.call_args_list
+        }
+        assert calls == {"space_a": ["s1", "s2", "s3"], "space_b": ["s1"]}
+        assert all(
+            call.args[0] == LIST_RELATIONS_IN_SCHEMAS_MACRO_NAME
+            for call in adapter.execute_macro.call_args_list
+        )
+        assert adapter.cache.add.call_count == 4
+        adapter.cache.update_schemas.assert_called_once_with(
+            {
+                ("space_a", "s1"),
+                ("space_a", "s2"),
+                ("space_a", "s3"),
+                ("space_b", "s1"),
+            }
+        )
+
+    def test_schemas_are_batched(self):
+        adapter = self._adapter(batch_size=2)
+
+        adapter._relations_cache_for_schemas(
+            [], self._schemas("space", "s1", "s2", "s3")
+        )
+
+        assert adapter.execute_macro.call_count == 2
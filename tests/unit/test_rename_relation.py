@@ -0,0 +1,154 @@
+# Copyright (C) 2022 Dremio Corporation
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import multiprocessing
+import threading
+from unittest.mock import MagicMock, patch
+
+from dbt_common.exceptions import DbtDatabaseError
+
+from dbt.adapters.contracts.connection import Connection
+from dbt.adapters.dremio import connections as dremio_connections
+from dbt.adapters.dremio.column_cache import DremioColumnCache
+from dbt.adapters.dremio.connections import DremioConnectionManager
+from dbt.adapters.dremio.impl import DremioAdapter
+from dbt.adapters.dremio.relation import DremioRelation
+
+
+def _adapter(rename_error=None):
+    adapter = DremioAdapter.__new__(DremioAdapter)
+    adapter.cache_renamed = MagicMock()
+    adapter.connections = MagicMock()
+    adapter._column_cache = DremioColumnCache()
+    adapter._rename_unsupported = set()
+    adapter._rename_unsupported_lock = threading.Lock()
+
+    def execute_macro(name, kwargs):
+        if name == "dremio__alter_table_rename" and rename_error is not None:
+            raise rename_error
+
+    adapter.execute_macro = MagicMock(side_effect=execute_macro)
+    return adapter
+
+
+def _relation(identifier, database="lake"):
+    return DremioRelation.create(
+        database=database, schema="no_schema", identifier=identifier, type="table"
+    )
+
+
+def _macros(adapter):
+    return [call.args[0] for call in adapter.execute_macro.call_args_list]
+
+
+class TestRenameRelation:
+    def test_tables_are_renamed_in_the_catalog(self):
+        adapter = _adapter()
+
+        adapter.rename_relation(_relation("a"), _relation("b"))
+
+        assert _macros(adapter) == ["dremio__alter_table_rename"]
+
+    def test_rename_falls_back_to_a_copy_once_per_database(self):
+        adapter = _adapter(DbtDatabaseError("RENAME is not supported"))
+
+        adapter.rename_relation(_relation("a"), _relation("b"))
+        adapter.rename_relation(_relation("c"), _relation("d"))
+
+        assert _macros(adapter) == [
+            "dremio__alter_table_rename",
+            "rename_relation",
+            "rename_relation",
+        ]
+
+    def test_other_rename_errors_do_not_disable_renames(self):
+        adapter = _adapter(DbtDatabaseError("Service unavailable"))
+
+        adapter.rename_relation(_relation("a"), _relation("b"))
+        adapter.rename_relation(_relation("c"), _relation("d"))
+
+        assert _macros(adapter) == [
+            "dremio__alter_table_rename",
+            "rename_relation",
+            "dremio__alter_table_rename",
+            "rename_relation",
+        ]
+
+    def test_relations_are_copied_across_databases(self):
+        adapter = _adapter()
+
+        adapter.rename_relation(_relation("a"), _relation("a", database="other"))
+
+        assert _macros(adapter) == ["rename_relation"]
+
+
+class _FakeCursor:
+    def __init__(self, statements):
+        self._statements = statements
+        self.closed = False
+        self.rowcount = -1
+
+    def execute(self, sql, bindings=None, fetch=False, limit=None):
+        self._statements.append(sql)
+        if "rename to" in sql:
+            raise DbtDatabaseError("RENAME is not supported")
+
+
+class _FakeHandle:
+    def __init__(self, statements):
+        self._statements = statements
+        self.closed = False
+
+    def cursor(self):
+        if self.closed:
+            raise Exception("HandleClosed")
+        return _FakeCursor(self._statements)
+
+    def close(self):
+        self.closed = True
+
+
+def test_rename_falls_back_to_a_copy_on_the_same_connection():
+    statements = []
+    manager = DremioConnectionManager(
+        MagicMock(threads=1), multiprocessing.get_context("spawn")
+    )
+    credentials = MagicMock(
+        poll_initial_ms=50,
+        poll_max_ms=2000,
+        result_fetch_parallelism=1,
+        transport="rest",
+        job_status_rate_limit=None,
+        catalog_rate_limit=None,
+    )
+    manager.set_thread_connection(
+        Connection(type="dremio", name="model", credentials=credentials)
+    )
+    adapter = _adapter()
+    adapter.connections = manager
+    sqls = {
+        "dremio__alter_table_rename": "alter table lake.a rename to b",
+        "rename_relation": "create table lake.b as select * from lake.a",
+    }
+    adapter.execute_macro = MagicMock(
+        side_effect=lambda name, kwargs: adapter.execute(sqls[name])
+    )
+
+    with patch.object(dremio_connections, "ParametersBuilder"), patch.object(
+        dremio_connections,
+        "DremioHandle",
+        side_effect=lambda *args: _FakeHandle(statements),
+    ):
+        manager.reopen()
+        adapter.rename_relation(_relation("a"), _relation("b"))
+
+    assert statements == list(sqls.values())
@@ -10,15 +10,24 @@
 # limitations under the License.
 
 import json
-from unittest.mock import MagicMock
+import socket
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from dbt.adapters.dremio.api.rest.error import (
     DremioAlreadyExistsException,
     DremioBadRequestException,
+    DremioInternalServerException,
+    DremioTooManyRequestsException,
+)
+from dbt.adapters.dremio.api.rest.utils import (
+    _check_error,
+    _get,
+    _post,
+    build_session,
+    retry_budget,
 )
-from dbt.adapters.dremio.api.rest.utils import _check_error
 
 
 _REASON_BY_STATUS = {400: "Bad Request", 409: "Conflict"}
@@ -59,3 +68,72 @@ class TestCheckErrorAlreadyExists:
         response = _make_response(409, body)
         with pytest.raises(DremioAlreadyExistsException):
             _check_error(response)
+
+
+class TestBuildSession:
+    def test_pool_size_and_keep_alive(self):
+        session = build_session(pool_maxsize=33)
+
+        adapter = session.get_adapter("https://api.dremio.cloud")
+        assert adapter._pool_maxsize == 33
+        assert (
+            socket.SOL_SOCKET,
+            socket.SO_KEEPALIVE,
+            1,
+        ) in adapter.poolmanager.connection_pool_kw["socket_options"]
+        session.close()
+
+
+class TestRequestRetries:
+    def _response(self, status_code, headers=None):
+        response = _make_response(status_code, "{}")
+        response.reason = "Error"
+        response.headers = headers or {}
+        response.json.return_value = {"status": status_code}
+        return response
+
+    @patch("dbt.adapters.dremio.api.rest.utils.time.sleep")
+    def test_get_is_retried_honoring_retry_after(self, mocked_sleep):
+        session = MagicMock()
+        session.get.side_effect = [
+            self._response(429, {"Retry-After": "2"}),
+            self._response(503),
+            self._response(200),
+        ]
+
+        assert _get(session, "https://dremio/job", {}) == {"status": 200}
+        assert session.get.call_count == 3
+        assert mocked_sleep.call_args_list[0].args == (2.0,)
+
+    @patch("dbt.adapters.dremio.api.rest.utils.time.sleep")
+    def test_post_is_not_retried_after_server_error(self, mocked_sleep):
+        session = MagicMock()
+        session.post.return_value = self._response(500)
+
+        with pytest.raises(DremioInternalServerException):
+            _post(session, "https://dremio/sql", {}, json={"sql": "select 1"})
+        assert session.post.call_count == 1
+        mocked_sleep.assert_not_called()
+
+    @patch("dbt.adapters.dremio.api.rest.utils.time.sleep")
+    def test_post_is_retried_when_throttled(self, mocked_sleep):
+        session = MagicMock()
+        session.post.side_effect = [self._response(429), self._response(200)]
+
+        assert _post(session, "https://dremio/sql", {}) == {"status": 200}
+        assert session.post.call_count == 2
+
+    @patch("dbt.adapters.dremio.api.rest.utils.time.sleep")
+    def test_exhausted_budget_stops_retries(self, mocked_sleep):
+        session = MagicMock()
+        session.get.return_value = self._response(429, {"Retry-After": "5"})
+        retry_budget.reset(7)
+        try:
+            with pytest.raises(DremioTooManyRequestsException):
+                _get(session, "https://dremio/job", {})
+        finally:
+            retry_budget.reset()
+
+        # one 5 second wait fits in the budget, the second does not
+        assert session.get.call_count == 2
+        mocked_sleep.assert_called_once_with(5.0)
@@ -0,0 +1,94 @@
+# Copyright (C) 2022 Dremio Corporation
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import datetime
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import agate
+
+from dbt.adapters.dremio.api.result_decoder import DremioResultDecoder
+
+
+class TestDremioResultDecoder:
+    schema = [
+        {"name": "id", "type": {"name": "BIGINT"}},
+        {"name": "amount", "type": {"name": "DECIMAL", "precision": 10, "scale": 2}},
+        {"name": "ratio", "type": {"name": "DOUBLE"}},
+        {"name": "code", "type": {"name": "VARCHAR"}},
+        {"name": "flag", "type": {"name": "BOOLEAN"}},
+        {"name": "day", "type": {"name": "DATE"}},
+        {"name": "ts", "type": {"name": "TIMESTAMP"}},
+        {"name": "tags", "type": {"name": "LIST"}},
+        {"name": "at", "type": {"name": "TIME"}},
+    ]
+
+    def test_column_types_follow_schema(self):
+        table = DremioResultDecoder(self.schema).to_table([])
+
+        assert table.column_names == tuple(col["name"] for col in self.schema)
+        assert [type(t) for t in table.column_types] == [
+            agate.Number,
+            agate.Number,
+            agate.Number,
+            agate.Text,
+            agate.Boolean,
+            agate.Date,
+            agate.DateTime,
+            agate.Text,
+            agate.Text,
+        ]
+
+    def test_values_are_decoded_without_inference(self):
+        rows = [
+            {
+                "id": 1,
+                "amount": 12.5,
+                "ratio": 0.1,
+                # would be inferred as a boolean/number by agate.TypeTester
+                "code": "1",
+                "flag": True,
+                "day": "2024-02-29",
+                "ts": "2024-02-29 10:11:12.345",
+                "tags": ["a", "b"],
+                "at": "10:11:12",
+            },
+            {"id": 2},
+        ]
+
+        table = DremioResultDecoder(self.schema).to_table(rows)
+
+        assert tuple(table.rows[0]) == (
+            Decimal(1),
+            Decimal("12.5"),
+            Decimal("0.1"),
+            "1",
+            True,
+            datetime.date(2024, 2, 29),
+            datetime.datetime(2024, 2, 29, 10, 11, 12, 345000),
+            '["a", "b"]',
+            "10:11:12",
+        )
+        assert tuple(table.rows[1]) == (Decimal(2),) + (None,) * 8
+
+    def test_decoded_values_are_not_cast_again(self, monkeypatch):
+        for column_type in (agate.Number, agate.Text, agate.Date, agate.DateTime):
+            monkeypatch.setattr(
+                column_type, "cast", MagicMock(side_effect=AssertionError("cast"))
+            )
+
+        table = DremioResultDecoder(self.schema[:4] + self.schema[5:7]).to_table(
+            [{"id": 1, "amount": 1.5, "ratio": 2, "code": "a", "day": "2024-02-29"}]
+        )
+
+        assert table.rows[0]["id"] == Decimal(1)
+        assert table.rows[0]["day"] == datetime.date(2024, 2, 29)
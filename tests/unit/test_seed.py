@@ -0,0 +1,317 @@
+# Copyright (C) 2022 Dremio Corporation
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+from datetime import date, datetime
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import agate
+import pytest
+from dbt_common.exceptions import DbtRuntimeError
+
+from dbt.adapters.dremio import seed
+
+from dbt.adapters.dremio.connections import DremioConnectionManager
+from dbt.adapters.dremio.column import DremioColumn
+from dbt.adapters.dremio.impl import DremioAdapter
+from dbt.adapters.dremio.relation import DremioRelation
+from dbt.adapters.dremio.seed import (
+    insert_batches,
+    number_column_types,
+    seed_column_changes,
+    seed_fingerprint,
+    seed_literal,
+)
+
+
+class TestSeedLiteral:
+    @pytest.mark.parametrize(
+        "value, data_type, literal",
+        [
+            (None, "bigint", "cast(null as bigint)"),
+            ("it's", "varchar", "'it''s'"),
+            (Decimal("12"), "varchar", "'12'"),
+            (Decimal("12"), "bigint", "12"),
+            (Decimal("1E+3"), "decimal", "1000"),
+            (Decimal("1.50"), "decimal(10,2)", "1.50"),
+            (True, "boolean", "TRUE"),
+            (date(2024, 1, 31), "date", "DATE '2024-01-31'"),
+            (
+                datetime(2024, 1, 31, 12, 30),
+                "timestamp",
+                "TIMESTAMP '2024-01-31 12:30:00.000'",
+            ),
+            ("12:30:00", "time", "cast('12:30:00' as time)"),
+        ],
+    )
+    def test_literals(self, value, data_type, literal):
+        assert seed_literal(value, data_type) == literal
+
+
+class TestNumberColumnTypes:
+    def _table(self):
+        return agate.Table(
+            [
+                (
+                    Decimal("1.25"),
+                    Decimal("-1000"),
+                    Decimal("12345678901234567890"),
+                    "a",
+                ),
+                (None, Decimal("3"), Decimal("1"), "b"),
+                (Decimal("10.5"), Decimal("7"), None, "c"),
+            ],
+            ["ratio", "count", "big", "name"],
+            [agate.Number(), agate.Number(), agate.Number(), agate.Text()],
+        )
+
+    @pytest.mark.parametrize("use_pyarrow", [True, False])
+    def test_types_are_inferred_for_every_number_column(self, monkeypatch, use_pyarrow):
+        if not use_pyarrow:
+            monkeypatch.setattr(seed, "pyarrow", None)
+
+        assert number_column_types(self._table()) == [
+            "decimal(4,2)",
+            "bigint",
+            "decimal(20,0)",
+            None,
+        ]
+
+    def test_types_are_inferred_once_per_table(self, monkeypatch):
+        table = self._table()
+        column_types = number_column_types(table)
+        monkeypatch.setattr(seed, "_number_type", MagicMock())
+
+        assert number_column_types(table) is column_types
+
+
+class TestInsertBatches:
+    def test_rows_are_split_into_batches(self):
+        rows = [(Decimal(i), f"name {i}") for i in range(5)]
+
+        statements = list(
+            insert_batches(
+                '"space"."seed"', ['"id"', '"name"'], ["bigint", "varchar"], rows, 2
+            )
+        )
+
+        assert len(statements) == 3
+        assert statements[0] == (
+            'insert into "space"."seed" ("id", "name")\n'
+            "values\n"
+            "(0, 'name 0'),\n"
+            "(1, 'name 1')"
+        )
+        assert statements[2].endswith("(4, 'name 4')")
+
+
+class TestExecuteConcurrently:
+    def _manager(self, execute):
+        manager = DremioConnectionManager.__new__(DremioConnectionManager)
+        manager._add_query_comment = lambda sql: sql
+        manager.release = MagicMock()
+        manager.COMMIT_RETRY_BACKOFF_INITIAL_S = 0
+        connection = MagicMock()
+        manager.get_thread_connection = MagicMock(return_value=connection)
+
+        def open_cursor():
+            cursor = MagicMock()
+            cursor.execute.side_effect = execute
+            return cursor
+
+        connection.handle.open_cursor.side_effect = open_cursor
+        return manager
+
+    def test_statements_run_concurrently(self):
+        barrier = threading.Barrier(3, timeout=5)
+        executed = []
+
+        def execute(sql):
+            barrier.wait()
+            executed.append(sql)
+
+        manager = self._manager(execute)
+
+        assert manager.execute_concurrently(iter(["a", "b", "c"]), 3) == 3
+        assert sorted(executed) == ["a", "b", "c"]
+
+    def test_commit_conflicts_are_retried(self):
+        attempts = []
+
+        def execute(sql):
+            attempts.append(sql)
+            if len(attempts) == 1:
+                raise Exception("ERROR: Concurrent operation has updated the table")
+
+        manager = self._manager(execute)
+
+        manager.execute_concurrently(["a"], 2)
+
+        assert attempts == ["a", "a"]
+
+    def test_commit_conflicts_in_other_wordings_are_retried(self):
+        attempts = []
+
+        def execute(sql):
+            attempts.append(sql)
+            if len(attempts) <= 4:
+                raise Exception(
+                    "ERROR: CommitFailedException: Cannot commit changes based on stale metadata"
+                )
+
+        manager = self._manager(execute)
+
+        manager.execute_concurrently(["a"], 2)
+
+        assert attempts == ["a"] * 5
+
+    def test_failures_are_raised(self):
+        def execute(sql):
+            raise Exception("ERROR: syntax error")
+
+        manager = self._manager(execute)
+
+        with pytest.raises(DbtRuntimeError):
+            manager.execute_concurrently(["a", "b"], 2)
+
+
+class TestInsertSeedRows:
+    def test_a_partly_loaded_seed_is_dropped(self):
+        adapter = DremioAdapter.__new__(DremioAdapter)
+        adapter.connections = MagicMock()
+        adapter.connections.execute_concurrently.side_effect = DbtRuntimeError(
+            "ERROR: syntax error"
+        )
+        adapter.drop_relation = MagicMock()
+        table = agate.Table([(1,), (2,)], ["id"], [agate.Number()])
+
+        with pytest.raises(DbtRuntimeError, match="syntax error"):
+            adapter.insert_seed_rows("seed", table, ['"id"'], ["bigint"], 1, 2)
+
+        adapter.connections.reopen.assert_called_once()
+        adapter.drop_relation.assert_called_once_with("seed")
+
+
+class TestMergeSeedFromStaging:
+    def _adapter(self, execute):
+        adapter = DremioAdapter.__new__(DremioAdapter)
+        adapter.connections = MagicMock()
+        adapter.execute = MagicMock(side_effect=execute)
+        adapter.drop_relation = MagicMock()
+        return adapter
+
+    def test_staging_table_is_dropped_after_the_merge(self):
+        adapter = self._adapter(lambda sql: None)
+
+        adapter.merge_seed_from_staging("staging", ["merge", "delete"])
+
+        assert [call.args[0] for call in adapter.execute.call_args_list] == [
+            "merge",
+            "delete",
+        ]
+        adapter.drop_relation.assert_called_once_with("staging")
+
+    def test_staging_table_is_dropped_when_the_merge_fails(self):
+        def execute(sql):
+            raise DbtRuntimeError("merge failed")
+
+        adapter = self._adapter(execute)
+
+        with pytest.raises(DbtRuntimeError, match="merge failed"):
+            adapter.merge_seed_from_staging("staging", ["merge", "delete"])
+
+        adapter.execute.assert_called_once_with("merge")
+        adapter.connections.reopen.assert_called_once()
+        adapter.drop_relation.assert_called_once_with("staging")
+
+    def test_rebuild_puts_the_table_back_when_the_swap_fails(self):
+        adapter = self._adapter(lambda sql: None)
+        renames = []
+
+        def rename_relation(from_relation, to_relation):
+            renames.append((from_relation.identifier, to_relation.identifier))
+            if from_relation.identifier == "seed__dbt_seed_tmp":
+                raise DbtRuntimeError("create table failed")
+
+        adapter.rename_relation = MagicMock(side_effect=rename_relation)
+        target = DremioRelation.create(
+            database="lake", schema="no_schema", identifier="seed", type="table"
+        )
+        staging = target.incorporate(path={"identifier": "seed__dbt_seed_tmp"})
+
+        with pytest.raises(DbtRuntimeError, match="create table failed"):
+            adapter.rebuild_seed_from_staging(staging, target)
+
+        assert renames == [
+            ("seed", "seed__dbt_seed_backup"),
+            ("seed__dbt_seed_tmp", "seed"),
+            ("seed__dbt_seed_backup", "seed"),
+        ]
+        dropped = [
+            call.args[0].identifier for call in adapter.drop_relation.call_args_list
+        ]
+        assert dropped == ["seed__dbt_seed_backup", "seed", "seed__dbt_seed_tmp"]
+
+
+def _decimal(name, precision, scale):
+    return DremioColumn(name, "decimal", None, precision, scale)
+
+
+class TestSeedColumnChanges:
+    def test_narrow_decimals_are_widened(self):
+        staged = [DremioColumn("id", "bigint"), _decimal("amount", 6, 2)]
+        existing = [DremioColumn("ID", "bigint"), _decimal("amount", 4, 2)]
+
+        assert seed_column_changes(staged, existing) == {"amount": "decimal(6,2)"}
+
+    def test_wide_enough_decimals_are_kept(self):
+        staged = [_decimal("amount", 3, 1)]
+        existing = [_decimal("amount", 6, 2)]
+
+        assert seed_column_changes(staged, existing) == {}
+
+    @pytest.mark.parametrize(
+        "staged",
+        [
+            [DremioColumn("id", "bigint")],
+            [
+                DremioColumn("id", "bigint"),
+                _decimal("amount", 4, 2),
+                DremioColumn("note", "varchar"),
+            ],
+            [DremioColumn("id", "double"), _decimal("amount", 4, 2)],
+            # Iceberg cannot change the scale of a decimal
+            [DremioColumn("id", "bigint"), _decimal("amount", 5, 3)],
+        ],
+    )
+    def test_other_changes_rebuild_the_table(self, staged):
+        existing = [DremioColumn("id", "bigint"), _decimal("amount", 4, 2)]
+
+        assert seed_column_changes(staged, existing) is None
+
+
+class TestSeedFingerprint:
+    def test_fingerprint_follows_content_and_column_types(self, tmp_path):
+        csv_path = tmp_path / "seed.csv"
+        csv_path.write_text("id,name\n1,a\n")
+        fingerprint = seed_fingerprint(str(csv_path), {"column_types": {}})
+
+        assert (
+            seed_fingerprint(str(csv_path), {"column_types": {}, "tags": ["x"]})
+            == fingerprint
+        )
+        assert (
+            seed_fingerprint(str(csv_path), {"column_types": {"id": "int"}})
+            != fingerprint
+        )
+        csv_path.write_text("id,name\n1,b\n")
+        assert seed_fingerprint(str(csv_path), {"column_types": {}}) != fingerprint
@@ -0,0 +1,94 @@
+# Copyright (C) 2022 Dremio Corporation
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+
+pyarrow = pytest.importorskip("pyarrow")
+parquet = pytest.importorskip("pyarrow.parquet")
+
+from dbt.adapters.dremio.seed_staging import (  # noqa: E402
+    SeedStagingWriter,
+    copy_into_sql,
+    to_arrow_table,
+)
+
+
+class TestToArrowTable:
+    def test_columns_take_the_target_types(self):
+        rows = [
+            (
+                Decimal("1"),
+                Decimal("2.5"),
+                Decimal("1.25"),
+                "a",
+                True,
+                date(2024, 1, 31),
+                datetime(2024, 1, 31, 12, 30),
+            ),
+            (None, None, Decimal("10.5"), None, None, None, None),
+        ]
+
+        table = to_arrow_table(
+            ["id", "ratio", "amount", "name", "flag", "day", "at"],
+            ["bigint", "double", "decimal", "varchar", "boolean", "date", "timestamp"],
+            rows,
+        )
+
+        assert table.schema.types == [
+            pyarrow.int64(),
+            pyarrow.float64(),
+            pyarrow.decimal128(38, 2),
+            pyarrow.string(),
+            pyarrow.bool_(),
+            pyarrow.date32(),
+            pyarrow.timestamp("ms"),
+        ]
+        assert table.column("id").to_pylist() == [1, None]
+        assert table.column("amount").to_pylist() == [Decimal("1.25"), Decimal("10.50")]
+
+    def test_sized_decimals_and_other_types(self):
+        table = to_arrow_table(
+            ["price", "code"],
+            ["decimal(10,3)", "varchar(20)"],
+            [(Decimal("1.5"), Decimal("7"))],
+        )
+
+        assert table.schema.types == [pyarrow.decimal128(10, 3), pyarrow.string()]
+        assert table.column("code").to_pylist() == ["7"]
+
+
+class TestStagingWriter:
+    def test_writes_and_removes_files_in_a_local_directory(self, tmp_path):
+        staging_path = tmp_path / "staging"
+        writer = SeedStagingWriter.build(str(staging_path))
+        file_name = writer.new_file_name("seed")
+        table = to_arrow_table(["id"], ["bigint"], [(Decimal("1"),), (Decimal("2"),)])
+
+        writer.write(file_name, table)
+
+        assert file_name.startswith("seed_") and file_name.endswith(".parquet")
+        assert parquet.read_table(str(staging_path / file_name)).equals(table)
+
+        writer.remove(file_name)
+
+        assert list(staging_path.iterdir()) == []
+
+
+def test_copy_into_sql():
+    assert copy_into_sql('"lake"."seed"', "@lake/staging", "seed_1.parquet") == (
+        'copy into "lake"."seed"\n'
+        "from '@lake/staging'\n"
+        "files ('seed_1.parquet')\n"
+        "file_format 'parquet'"
+    )
@@ -0,0 +1,130 @@
+# Copyright (C) 2022 Dremio Corporation
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from dbt.adapters.dremio.api.authentication import DremioPasswordAuthentication
+from dbt.adapters.dremio.api.parameters import Parameters
+from dbt.adapters.dremio.api.rest.client import DremioRestClient
+from dbt.adapters.dremio.api.rest.error import DremioUnauthorizedException
+from dbt.adapters.dremio.api.rest.token_cache import DremioTokenCache, token_cache
+
+
+def _login_returning(*tokens):
+    login = MagicMock(side_effect=[{"token": token} for token in tokens])
+    return login
+
+
+class TestDremioTokenCache:
+    def test_token_is_reused(self):
+        cache = DremioTokenCache()
+        login = _login_returning("first")
+
+        assert cache.get_token("key", login) == "first"
+        assert cache.get_token("key", login) == "first"
+        assert login.call_count == 1
+
+    def test_concurrent_refreshes_log_in_once(self):
+        cache = DremioTokenCache()
+        calls = []
+
+        def slow_login():
+            calls.append(threading.current_thread().name)
+            time.sleep(0.05)
+            return {"token": "shared"}
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            tokens = list(
+                executor.map(lambda _: cache.get_token("key", slow_login), range(8))
+            )
+
+        assert tokens == ["shared"] * 8
+        assert len(calls) == 1
+
+    def test_stale_token_is_replaced(self):
+        cache = DremioTokenCache()
+        login = _login_returning("first", "second")
+
+        cache.get_token("key", login)
+
+        assert cache.get_token("key", login, stale_token="first") == "second"
+        # a caller holding an older stale token picks up the refreshed one
+        assert cache.get_token("key", login, stale_token="first") == "second"
+        assert login.call_count == 2
+
+    def test_expiring_token_is_refreshed(self):
+        cache = DremioTokenCache()
+        expires_ms = (time.time() + 60) * 1000
+        login = MagicMock(
+            side_effect=[
+                {"token": "first", "expires": expires_ms},
+                {"token": "second"},
+            ]
+        )
+
+        cache.get_token("key", login)
+
+        assert cache.get_token("key", login) == "second"
+
+    def test_failed_login_is_not_cached(self):
+        cache = DremioTokenCache()
+        login = MagicMock(side_effect=[Exception("login failed"), {"token": "ok"}])
+
+        with pytest.raises(Exception):
+            cache.get_token("key", login)
+
+        assert cache.get_token("key", login) == "ok"
+
+
+class TestRestClientReauthentication:
+    def setup_method(self):
+        token_cache.clear()
+
+    def teardown_method(self):
+        token_cache.clear()
+
+    def _client(self):
+        parameters = Parameters(
+            base_url="http://localhost:9047",
+            authentication=DremioPasswordAuthentication(
+                username="user", password="pass", verify_ssl=False
+            ),
+        )
+        return DremioRestClient(parameters)
+
+    @patch("dbt.adapters.dremio.api.rest.client._post")
+    def test_clients_share_login(self, mocked_post_func):
+        mocked_post_func.return_value = {"token": "shared"}
+
+        self._client().start()
+        self._client().start()
+
+        assert mocked_post_func.call_count == 1
+
+    @patch("dbt.adapters.dremio.api.rest.client._get")
+    @patch("dbt.adapters.dremio.api.rest.client._post")
+    def test_rejected_token_is_refreshed_once(self, mocked_post_func, mocked_get_func):
+        mocked_post_func.side_effect = [{"token": "first"}, {"token": "second"}]
+        mocked_get_func.side_effect = [
+            DremioUnauthorizedException("Unauthorized:", "401"),
+            {"jobState": "COMPLETED"},
+        ]
+        client = self._client()
+        client.start()
+
+        assert client.job_status("job") == {"jobState": "COMPLETED"}
+        assert mocked_post_func.call_count == 2
+        assert client._parameters.authentication.token == "second"